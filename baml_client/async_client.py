@@ -79,6 +79,21 @@ class BamlAsyncClient:
     def parse_stream(self):
       return self.__llm_stream_parser
     
+    async def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> types.PlotSpec:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.GeneratePlotSpec(user_query=user_query,data_columns=data_columns,data_head=data_head,data_note=data_note,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="GeneratePlotSpec", args={
+                "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+            })
+            return typing.cast(types.PlotSpec, result.cast_to(types, types, stream_types, False, __runtime__))
     async def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> types.PlotSummary:
@@ -118,6 +133,18 @@ class BamlStreamClient:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.PlotSpec, types.PlotSpec]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="GeneratePlotSpec", args={
+            "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+        })
+        return baml_py.BamlStream[stream_types.PlotSpec, types.PlotSpec](
+          result,
+          lambda x: typing.cast(stream_types.PlotSpec, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.PlotSpec, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
     def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlStream[stream_types.PlotSummary, types.PlotSummary]:
@@ -150,6 +177,13 @@ class BamlHttpRequestClient:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    async def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GeneratePlotSpec", args={
+            "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+        }, mode="request")
+        return result
     async def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -172,6 +206,13 @@ class BamlHttpStreamRequestClient:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    async def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GeneratePlotSpec", args={
+            "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+        }, mode="stream")
+        return result
     async def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
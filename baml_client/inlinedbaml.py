@@ -14,6 +14,7 @@ _file_map = {
 
     "clients.baml": "// Learn more about clients at https://docs.boundaryml.com/docs/snippets/clients/overview\n\n// Using the new OpenAI Responses API for enhanced formatting\nclient<llm> CustomGPT5 {\n  provider openai-responses\n  options {\n    model \"gpt-5\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\nclient<llm> CustomGPT5Mini {\n  provider openai-responses\n  retry_policy Exponential\n  options {\n    model \"gpt-5-mini\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\n// Openai with chat completion\nclient<llm> CustomGPT5Chat {\n  provider openai\n  options {\n    model \"gpt-5\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\n// Latest Anthropic Claude 4 models\nclient<llm> CustomOpus4 {\n  provider anthropic\n  options {\n    model \"claude-opus-4-1-20250805\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\nclient<llm> CustomSonnet4 {\n  provider anthropic\n  options {\n    model \"claude-sonnet-4-20250514\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\nclient<llm> CustomHaiku {\n  provider anthropic\n  retry_policy Constant\n  options {\n    model \"claude-3-5-haiku-20241022\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\n// Example Google AI client (uncomment to use)\n// client<llm> CustomGemini {\n//   provider google-ai\n//   options {\n//     model \"gemini-2.5-pro\"\n//     api_key env.GOOGLE_API_KEY\n//   }\n// }\n\n// Example AWS Bedrock client (uncomment to use)\n// client<llm> CustomBedrock {\n//   provider aws-bedrock\n//   options {\n//     model \"anthropic.claude-sonnet-4-20250514-v1:0\"\n//     region \"us-east-1\"\n//     // AWS credentials are auto-detected from env vars\n//   }\n// }\n\n// Example Azure OpenAI client (uncomment to use)\n// client<llm> CustomAzure {\n//   provider azure-openai\n//   options {\n//     model \"gpt-5\"\n//     api_key env.AZURE_OPENAI_API_KEY\n//     base_url \"https://MY_RESOURCE_NAME.openai.azure.com/openai/deployments/MY_DEPLOYMENT_ID\"\n//     api_version \"2024-10-01-preview\"\n//   }\n// }\n\n// Example Vertex AI client (uncomment to use)\n// client<llm> CustomVertex {\n//   provider vertex-ai\n//   options {\n//     model \"gemini-2.5-pro\"\n//     location \"us-central1\"\n//     // Uses Google Cloud Application Default Credentials\n//   }\n// }\n\n// Example Ollama client for local models (uncomment to use)\n// client<llm> CustomOllama {\n//   provider openai-generic\n//   options {\n//     base_url \"http://localhost:11434/v1\"\n//     model \"llama4\"\n//     default_role \"user\" // Most local models prefer the user role\n//     // No API key needed for local Ollama\n//   }\n// }\n\n// https://docs.boundaryml.com/docs/snippets/clients/round-robin\nclient<llm> CustomFast {\n  provider round-robin\n  options {\n    // This will alternate between the two clients\n    strategy [CustomGPT5Mini, CustomHaiku]\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/fallback\nclient<llm> OpenaiFallback {\n  provider fallback\n  options {\n    // This will try the clients in order until one succeeds\n    strategy [CustomGPT5Mini, CustomGPT5]\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/retry\nretry_policy Constant {\n  max_retries 3\n  strategy {\n    type constant_delay\n    delay_ms 200\n  }\n}\n\nretry_policy Exponential {\n  max_retries 2\n  strategy {\n    type exponential_backoff\n    delay_ms 300\n    multiplier 1.5\n    max_delay_ms 10000\n  }\n}",
     "generators.baml": "// This helps use auto generate libraries you can use in the language of\n// your choice. You can have multiple generators if you use multiple languages.\n// Just ensure that the output_dir is different for each generator.\ngenerator target {\n    // Valid values: \"python/pydantic\", \"typescript\", \"ruby/sorbet\", \"rest/openapi\"\n    output_type \"python/pydantic\"\n\n    // Where the generated code will be saved (relative to baml_src/)\n    output_dir \"../\"\n\n    // The version of the BAML package you have installed (e.g. same version as your baml-py or @boundaryml/baml).\n    // The BAML VSCode extension version should also match this version.\n    version \"0.212.0\"\n\n    // Valid values: \"sync\", \"async\"\n    // This controls what `b.FunctionName()` will be (sync or async).\n    default_client_mode sync\n}\n",
+    "plot_spec.baml": "// Chart types the native renderer draws, anything else is left to the plot agent.\nenum ChartType {\n  BAR @description(\"One bar per row: categories on x, values on y\")\n  LINE @description(\"Values on y over an ordered x, e.g. dates\")\n  SCATTER @description(\"Two numeric columns against each other\")\n  BOX @description(\"Distribution of the y values, optionally per category on x\")\n  HISTOGRAM @description(\"Distribution of the x values, or pre-binned bin_start/bin_end/count columns\")\n  PIE @description(\"Shares of the y values per category on x\")\n  UNSUPPORTED @description(\"Any plot the other types can't draw from the columns as they are\")\n}\n\nclass PlotSpec {\n  chart_type ChartType\n  x string? @description(\"Column on the x axis, exactly as in the data columns\")\n  y string? @description(\"Column on the y axis, exactly as in the data columns\")\n  hue string? @description(\"Column splitting the data into colored series\")\n  title string\n  x_label string?\n  y_label string?\n}\n\nfunction GeneratePlotSpec(user_query: string, data_columns: string, data_head: string, data_note: string) -> PlotSpec {\n  client \"google-ai/gemini-2.5-flash\"\n  prompt #\"\n    Choose the chart that best answers the user's question from a DataFrame that is already\n    processed and ready for visualization: its columns are plotted as they are, they are\n    NOT aggregated, pivoted or transformed in any way. Use only the given column names.\n    Pick UNSUPPORTED when the chart needs a transformation of the data or another chart type.\n\n    Data columns:\n    {{ data_columns }}\n\n    First rows of the data:\n    {{ data_head }}\n    {{ data_note }}\n\n    Input question:\n    {{ user_query }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest GetPlotSpec {\n  functions [GeneratePlotSpec]\n  args {\n    data_columns \"['category', 'purchases']\"\n    data_head #\"\n         category  purchases\n      0  Accessories       1240\n      1     Clothing       1737\n      2     Footwear        599\n      3    Outerwear        324\n    \"#\n    data_note \"\"\n    user_query \"How many purchases were made in every category?\"\n  }\n}\n",
     "plot_summarizer.baml": "// Defining a data model.\nclass PlotSummary {\n  summary string\n  caption string\n}\n\nfunction GeneratePlotSummary(image: image, user_query: string) -> PlotSummary {\n  client \"google-ai/gemini-2.5-flash\"\n  prompt #\"\n    You can only summarize the plot that was generated by a plot generator colleague to answer the user's question.\n    Your task is to generate a standalone, concise summary for the provided plot image:\n    {{ image }}\n    The summary should be no more than 5 sentences and should not mention the plot itself.\n    Add a conclusion or insight sentence at the end if it will help to answer the user's question.\n\n    Also provide a caption for the plot which will be used to show it to the user.\n\n    Input question:\n    {{ user_query }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest GetPlotSummary {\n  functions [GeneratePlotSummary]\n  args {\n    image {\n        base64 #\"\n            iVBORw0KGgoAAAANSUhEUgAABLAAAAK8CAYAAAD/M0aOAAAAOnRFWHRTb2Z0d2FyZQBNYXRwbG90bGliIHZlcnNpb24zLjEwLjcsIGh0dHBzOi8vbWF0cGxvdGxpYi5vcmcvTLEjVAAAAAlwSFlzAAAPYQAAD2EBqD+naQAAjM1JREFUeJzs3Xd0FNX/xvFn0wkhoQVC79I7UqQXCR2+dKU3UVGkiYIiigiIUhTphqAQpEhROhgpIkUBFVRAek+oKSQkQDK/PzzZH0sCUgZ2Qt6vc/aYvTN772c2m5E8uXPHZhiGIQAAAAAAAMCiXJxdAAAAAAAAAHAvBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAMnYbDa99tprzi4DJujevbt8fHycXQYsZO7cubLZbDpx4oSzS3kkNptN77//vrPLAAA8IQRYAIAnZtq0abLZbKpSpYqzS7Gc/Pnzy2az2R/ZsmVTzZo1tXz5cmeXlupERETIy8tLNptNBw4ccHY5pvv777/1/vvvWzJ8SEhIUHBwsOrUqaPMmTPL09NT+fPnV48ePbR79+4H7s/Kx5qW7Nu3Tz169FCBAgXk5eUlHx8flStXTkOHDtWxY8ecXR4AII0gwAIAPDEhISHKnz+/fvnlFx05csTZ5VhOuXLlNG/ePM2bN09DhgzRuXPn1Lp1a82YMcPZpaUqS5Yskc1mU0BAgEJCQpxdjun+/vtvffDBB5YLda5fv65mzZqpZ8+eMgxDw4cP1/Tp09W1a1ft2LFDlStX1pkzZx6oT6sea1oye/ZsVahQQWvXrlXr1q01ZcoUffLJJ6pevbq+/vprFStWTAkJCc4uEwCQBrg5uwAAQNpw/Phxbd++XcuWLVPfvn0VEhKikSNHPtEaEhMTdePGDXl5eT3Rce9Xrly51LlzZ/vzrl27qnDhwpo0aZJefvnlR+4/JiZG6dOnf+R+rG7+/Plq0qSJ8uXLpwULFmj06NHOLilNePPNN7Vu3TpNmjRJAwYMcNg2cuRITZo0yTmFPQFWP7c8rO3bt+uVV15R9erVtWrVKmXIkMFh+4QJE/TRRx85qTpzxcXFycPDQy4u/H0fAKyKMzQA4IkICQlRpkyZ1LRpU7Vt29ZhZszNmzeVOXNm9ejRI9nroqKi5OXlpSFDhtjb4uPjNXLkSBUuXFienp7KkyePhg4dqvj4eIfXJq3jFBISopIlS8rT01Pr1q2TJH366ad67rnnlCVLFqVLl04VK1bUt99+m2z869evq3///sqaNasyZMigFi1a6OzZsymuvXL27Fn17NlT2bNnl6enp0qWLKk5c+Y89HsWEBCg4sWL6/jx45KkzZs3y2azafPmzQ77nThxQjabTXPnzrW3Ja17dPToUTVp0kQZMmRQp06dJP37y/Znn32m0qVLy8vLS/7+/mrUqFGKl3itWLFCpUqVsh9P0vuX5OTJk3r11VdVtGhRpUuXTlmyZFG7du2SzZi5efOmPvjgAxUpUkReXl7KkiWLatSooY0bNzrsd/DgQbVt21aZM2eWl5eXKlWqpO+///6+37NTp07pp59+UseOHdWxY0d7cHqnOnXqqFSpUtq3b59q164tb29vFS5c2P4Z2LJli6pUqaJ06dKpaNGi+uGHH5L18dtvv6lx48by9fWVj4+P6tevr507dzrs8/7778tmsyV7bUprEOXPn1/NmjXTtm3bVLlyZXl5ealgwYL6+uuvHV7Xrl07SVLdunXtl5ze+ZlIybFjxxQYGKj06dMrZ86cGjVqlAzDkCQZhqH8+fOrZcuWyV4XFxcnPz8/9e3b9659nzlzRjNnztTzzz+fLLySJFdXVw0ZMkS5c+eWdH+fm/s51rVr16pmzZpKnz69MmTIoKZNm+qvv/5KNv6SJUtUokQJeXl5qVSpUlq+fLm6d++u/PnzO+wXExOjwYMHK0+ePPL09FTRokX16aef2t+nJCmdW9auXftI76EkBQcHq169esqWLZs8PT1VokQJTZ8+Pdl+9/NZSfLXX3+pXr16SpcunXLnzq3Ro0crMTHxnnUk+eCDD2Sz2RQSEpIsvJIkLy8vffjhh3J1dXVo37Vrlxo1aiQ/Pz95e3urdu3a+vnnnx32SfrZOHLkiLp3766MGTPKz89PPXr0UGxsrMO+8fHxGjhwoPz9/e3n4bvN5ruf83DSuXThwoV69913lStXLnl7eysqKuq+3hcAgHMwAwsA8ESEhISodevW8vDw0AsvvKDp06fr119/1bPPPit3d3f973//07JlyzRz5kx5eHjYX7dixQrFx8erY8eOkv4NX1q0aKFt27bppZdeUvHixbV//35NmjRJ//zzj1asWOEw7o8//qjFixfrtddeU9asWe2/sH722Wdq0aKFOnXqpBs3bmjhwoVq166dVq1apaZNm9pf3717dy1evFhdunRR1apVtWXLFoftScLDw1W1alX7L7b+/v5au3atevXqpaioqBR/qf8vN2/e1OnTp5UlS5YHfq0k3bp1S4GBgapRo4Y+/fRTeXt7S5J69eqluXPnqnHjxurdu7du3bqln376STt37lSlSpXsr9+2bZuWLVumV199VRkyZNDnn3+uNm3a6NSpU/aafv31V23fvl0dO3ZU7ty5deLECU2fPl116tTR33//bR/z/fff19ixY9W7d29VrlxZUVFR2r17t/bu3avnn39e0r+/aFevXl25cuXS22+/rfTp02vx4sVq1aqVli5dqv/973//eczffPON0qdPr2bNmildunQqVKiQQkJC9NxzzyXb9+rVq2rWrJk6duyodu3aafr06erYsaNCQkI0YMAAvfzyy3rxxRf1ySefqG3btjp9+rT9l/i//vpLNWvWlK+vr4YOHSp3d3fNnDlTderUsYdfD+PIkSNq27atevXqpW7dumnOnDnq3r27KlasqJIlS6pWrVrq37+/Pv/8cw0fPlzFixeXJPt/7yYhIUGNGjVS1apVNX78eK1bt04jR47UrVu3NGrUKNlsNnXu3Fnjx4/XlStXlDlzZvtrV65cqaioKIfZgXdau3atbt26pS5dutzXcd7P5+a/jnXevHnq1q2bAgMD9fHHHys2NlbTp09XjRo19Ntvv9l/1levXq0OHTqodOnSGjt2rK5evapevXopV65cDjUZhqEWLVpo06ZN6tWrl8qVK6f169frzTff1NmzZ5PNILvz3FKgQIFHeg8lafr06SpZsqRatGghNzc3rVy5Uq+++qoSExPVr18/h33/67MiSWFhYapbt65u3bpl/5maNWuW0qVL95/fo9jYWP3444+qU6eOPXi8Hz/++KMaN26sihUrauTIkXJxcbEHcz/99JMqV67ssH/79u1VoEABjR07Vnv37tWXX36pbNmy6eOPP7bv07t3b82fP18vvviinnvuOf3444+mnIc//PBDeXh4aMiQIYqPj3f4fw8AwIIMAAAes927dxuSjI0bNxqGYRiJiYlG7ty5jTfeeMO+z/r16w1JxsqVKx1e26RJE6NgwYL25/PmzTNcXFyMn376yWG/GTNmGJKMn3/+2d4myXBxcTH++uuvZDXFxsY6PL9x44ZRqlQpo169eva2PXv2GJKMAQMGOOzbvXt3Q5IxcuRIe1uvXr2MHDlyGJcuXXLYt2PHjoafn1+y8e6UL18+o2HDhsbFixeNixcvGn/88YfRsWNHQ5Lx+uuvG4ZhGJs2bTIkGZs2bXJ47fHjxw1JRnBwsL2tW7duhiTj7bffdtj3xx9/NCQZ/fv3T1ZDYmKi/WtJhoeHh3HkyBF72x9//GFIMqZMmWJvS+m4duzYYUgyvv76a3tb2bJljaZNm97zPahfv75RunRpIy4uzqGm5557zihSpMg9X5ukdOnSRqdOnezPhw8fbmTNmtW4efOmw361a9c2JBkLFiywtx08eND+mdm5c6e9Pemzefv726pVK8PDw8M4evSove3cuXNGhgwZjFq1atnbRo4caaT0z63g4GBDknH8+HF7W758+QxJxtatW+1tFy5cMDw9PY3Bgwfb25YsWZLi5+Bukj4LSZ8jw/j3fW3atKnh4eFhXLx40TAMwzh06JAhyZg+fbrD61u0aGHkz5/f4fNxp4EDBxqSjN9+++2+arrfz83djjU6OtrImDGj0adPH4f2sLAww8/Pz6G9dOnSRu7cuY3o6Gh72+bNmw1JRr58+extK1asMCQZo0ePduizbdu2hs1mc/hZuNu55VHeQ8NI+X0JDAx0OAcaxv1/VgYMGGBIMnbt2uWwn5+fX7LP352Sft7vPP8ZhmFcvnzZfq66ePGiER8fbxjGv5+rIkWKGIGBgQ7HGhsbaxQoUMB4/vnn7W1JPxs9e/Z06Pt///ufkSVLFvvz33//3ZBkvPrqqw77vfjiiw99Hk46lxYsWPA/z80AAOvgEkIAwGMXEhKi7Nmzq27dupL+vfymQ4cOWrhwoX3x33r16ilr1qxatGiR/XVXr17Vxo0b1aFDB3vbkiVLVLx4cRUrVkyXLl2yP+rVqydJ2rRpk8PYtWvXVokSJZLVdPsMhKtXryoyMlI1a9bU3r177e1Jl8u9+uqrDq99/fXXHZ4bhqGlS5eqefPmMgzDoa7AwEBFRkY69Hs3GzZskL+/v/z9/VW2bFktWbJEXbp0cZiJ8KBeeeUVh+dLly6VzWZLcf2xOy91a9CggQoVKmR/XqZMGfn6+jrcdez29/HmzZu6fPmyChcurIwZMzocc8aMGfXXX3/p8OHDKdZ55coV/fjjj2rfvr2io6Pt79/ly5cVGBiow4cP6+zZs/c81n379mn//v164YUX7G0vvPCCLl26pPXr1yfb38fHxz6zT5KKFi2qjBkzqnjx4g4zqJK+TjruhIQEbdiwQa1atVLBggXt++XIkUMvvviitm3b9tCXIpUoUUI1a9a0P/f391fRokVNudPba6+9Zv86aYbKjRs37JdHPvPMM6pSpYrD5b1XrlzR2rVr1alTpxQvhUySdLwpXWaWkvv93NzNxo0bFRERYf/+Jj1cXV1VpUoV+3ng3Llz2r9/v7p27SofHx/762vXrq3SpUs79LlmzRq5urqqf//+Du2DBw+WYRhau3atQ3tK55ZHeQ/vfF8iIyN16dIl1a5dW8eOHVNkZKTDvvfzWVmzZo2qVq3qMOvJ39/ffjnxvSR9T29/35IULFjQfq7y9/e3X+b7+++/6/Dhw3rxxRd1+fJl+/clJiZG9evX19atW5Ndvnjn+n41a9bU5cuX7eOvWbNGkpJ9X+6cTfUw5+Fu3brd12w0AIA1cAkhAOCxSkhI0MKFC1W3bl37Wk7Sv6HAhAkTFBoaqoYNG8rNzU1t2rTRggULFB8fL09PTy1btkw3b950CLAOHz6sAwcOyN/fP8XxLly44PC8QIECKe63atUqjR49Wr///rvD2lm3/4J58uRJubi4JOujcOHCDs8vXryoiIgIzZo1S7NmzbqvulJSpUoVjR49WjabTd7e3ipevLgyZsz4n6+7Gzc3t2SX/hw9elQ5c+Z0uLzpbvLmzZusLVOmTLp69ar9+fXr1zV27FgFBwfr7NmzDmsF3f4L96hRo9SyZUs988wzKlWqlBo1aqQuXbqoTJkykv69HMowDI0YMUIjRoxIsZ4LFy4ku+zrdvPnz1f69OlVsGBB+10uvby8lD9/foWEhCS75Ch37tzJAgU/Pz/lyZMnWZsk+3FfvHhRsbGxKlq0aLIaihcvrsTERJ0+fdp+GdeDuJ/3/GG4uLg4hG3Sv2GLJId1p7p27arXXntNJ0+eVL58+bRkyRLdvHnzPy8N9PX1lSRFR0ffVz33+7m5m6QgNCm4vls9J0+elJT8Zzap7fZA4+TJk8qZM2eyEC7pksWkvpLc7dzysO+hJP38888aOXKkduzYkWwdqMjISPtnUbq/z8rJkydTvJw1pc/unZLeh2vXriXb9t133+nmzZv6448/HNYnTPq+dOvW7a79RkZGKlOmTHc9jqRtV69ela+vr/08fHuYntIxPMx5+G7fQwCANRFgAQAeqx9//FHnz5/XwoULtXDhwmTbQ0JC1LBhQ0lSx44dNXPmTK1du1atWrXS4sWLVaxYMZUtW9a+f2JiokqXLq2JEyemON6d4UNKf13/6aef1KJFC9WqVUvTpk1Tjhw55O7uruDgYC1YsOCBjzFpRkHnzp3v+otbUlBzL1mzZlWDBg3uuv1uszfudgt7T0/PR7qj1p0LMye5PWx4/fXXFRwcrAEDBqhatWry8/OTzWZTx44dHWZa1KpVS0ePHtV3332nDRs26Msvv9SkSZM0Y8YM9e7d277vkCFDFBgYmOK4KYUQt9f0zTffKCYmJsUZdxcuXNC1a9ccZpPc7fju57jv14N+z8wc+2F07NhRAwcOVEhIiIYPH6758+erUqVK/xl4FCtWTJK0f/9+lStX7j/Hud/Pzd0k7TNv3jwFBAQk2+7m9vj/iXu3mTsP+x4ePXpU9evXV7FixTRx4kTlyZNHHh4eWrNmjSZNmpTsfXncn5XChQvLzc1Nf/75Z7JttWvXlpT8fU6q8ZNPPrnr5+DOGV1mHcfDnIeZfQUAqQsBFgDgsQoJCVG2bNk0derUZNuWLVum5cuXa8aMGUqXLp1q1aqlHDlyaNGiRapRo4Z+/PFHvfPOOw6vKVSokP744w/Vr1//Py/HuZulS5fKy8tL69evl6enp709ODjYYb98+fIpMTFRx48fV5EiReztSbN7kiTdGSshIeGeAdSjSpqZEBER4dB+58yQeylUqJDWr1+fbJHph/Xtt9+qW7dumjBhgr0tLi4uWY2S7Hea7NGjh65du6ZatWrp/fffV+/eve2zg9zd3R/qPdyyZYvOnDmjUaNGJVvQ/OrVq3rppZe0YsWK/1xE+374+/vL29tbhw4dSrbt4MGDcnFxsQept3/Pbp9N9yDfszs9zOc+MTFRx44ds8+6kqR//vlHkhzuxJc5c2Y1bdpUISEh6tSpk37++WdNnjz5P/tv3LixXF1dNX/+/PuaaXS/n5u7HWvSbJxs2bLd8/OSL18+Scl/ZlNqy5cvn3744QdFR0c7zMI6ePCgQ1//5WHfw5UrVyo+Pl7ff/+9w6ykOy+LfhD58uVL8bLdlD67d0qfPr39pgRnz5695+zHJEnfF19fX9POhUnn4aNHjzqEgHcew5M6DwMAnIc1sAAAj83169e1bNkyNWvWTG3btk32eO211xQdHW1fP8XFxUVt27bVypUrNW/ePN26dcvh8kHp3ztWnT17VrNnz05xvJiYmP+sy9XVVTabzWEWzIkTJ5LdwTBpJtC0adMc2qdMmZKsvzZt2mjp0qUpzla4ePHif9Z0P/LlyydXV1dt3brVof3O+u6lTZs2MgxDH3zwQbJtDzNzw9XVNdnrpkyZkmyG0eXLlx2e+/j4qHDhwvbLN7Nly6Y6depo5syZOn/+fLJx/us9TLp88M0330z2OevTp4+KFCnisC7Ro3B1dVXDhg313XffOVx+Fx4ergULFqhGjRr2S9iSfqG//XsWExOjr7766qHHT58+vaTkQeZ/+eKLL+xfG4ahL774Qu7u7qpfv77Dfl26dNHff/+tN998U66urg7rhN1Nnjx51KdPH23YsCHZz4f0b4A2YcIEnTlzRtL9f27udqyBgYHy9fXVmDFjdPPmzWTjJX1ecubMqVKlSunrr792uBRuy5Yt2r9/v8NrmjRpooSEBIf3SZImTZokm82mxo0b3+stcPAw72HSTKQ7L6e8M1h/EE2aNNHOnTv1yy+/2NsuXrx43z8L7733nhISEtS5c+cULyW883tYsWJFFSpUSJ9++mmK+z/MuTDpff/8888d2u8MBZ/UeRgA4DzMwAIAPDbff/+9oqOj1aJFixS3V61aVf7+/goJCbEHVR06dNCUKVM0cuRIlS5dOtlsmi5dumjx4sV6+eWXtWnTJlWvXl0JCQk6ePCgFi9erPXr16tSpUr3rKtp06aaOHGiGjVqpBdffFEXLlzQ1KlTVbhwYe3bt8++X8WKFdWmTRtNnjxZly9fVtWqVbVlyxb7zJXbZ4eMGzdOmzZtUpUqVdSnTx+VKFFCV65c0d69e/XDDz/oypUrD/Ue3s7Pz0/t2rXTlClTZLPZVKhQIa1ateq+1tdKUrduXXXp0kWff/65Dh8+rEaNGikxMVE//fST6tat67DQ9/1o1qyZ5s2bJz8/P5UoUUI7duzQDz/8oCxZsjjsV6JECdWpU0cVK1ZU5syZtXv3bn377bcO402dOlU1atRQ6dKl1adPHxUsWFDh4eHasWOHzpw5oz/++CPFGuLj47V06VI9//zz8vLySnGfFi1a6LPPPtOFCxeULVu2BzrGlIwePVobN25UjRo19Oqrr8rNzU0zZ85UfHy8xo8fb9+vYcOGyps3r3r16mUPM+bMmSN/f3+dOnXqocYuV66cXF1d9fHHHysyMlKenp6qV6/ePY/Ly8tL69atU7du3VSlShWtXbtWq1ev1vDhw5OtJ9e0aVNlyZJFS5YsUePGje/7/ZowYYKOHj2q/v3724PrTJky6dSpU1qyZIkOHjxoD3Lu93Nzr2OdPn26unTpogoVKqhjx47293T16tWqXr26PYgaM2aMWrZsqerVq6tHjx66evWqvvjiC5UqVcohZGnevLnq1q2rd955RydOnFDZsmW1YcMGfffddxowYECyNZju5WHew4YNG8rDw0PNmzdX3759de3aNc2ePVvZsmVLMdS9H0OHDtW8efPUqFEjvfHGG0qfPr1mzZqlfPnyOZzr7qZmzZr64osv9Prrr6tIkSLq1KmTihUrphs3buiff/5RSEiIPDw87Jdxuri46Msvv1Tjxo1VsmRJ9ejRQ7ly5dLZs2e1adMm+fr6auXKlQ90DOXKldMLL7ygadOmKTIyUs8995xCQ0NTnFX3JM7DAAAneqL3PAQApCnNmzc3vLy8jJiYmLvu0717d8Pd3d1+2/PExEQjT548Kd7OPsmNGzeMjz/+2ChZsqTh6elpZMqUyahYsaLxwQcfGJGRkfb9JBn9+vVLsY+goCCjSJEihqenp1GsWDEjODjYflv328XExBj9+vUzMmfObPj4+BitWrUyDh06ZEgyxo0b57BveHi40a9fPyNPnjyGu7u7ERAQYNSvX9+YNWvWf75X+fLlM5o2bfqf+128eNFo06aN4e3tbWTKlMno27ev8eeffxqSjODgYPt+3bp1M9KnT59iH7du3TI++eQTo1ixYoaHh4fh7+9vNG7c2NizZ499n7u9d/ny5TO6detmf3716lWjR48eRtasWQ0fHx8jMDDQOHjwYLL9Ro8ebVSuXNnImDGjkS5dOqNYsWLGRx99ZNy4ccOh/6NHjxpdu3Y1AgICDHd3dyNXrlxGs2bNjG+//fau78nSpUsNSUZQUNBd99m8ebMhyfjss88MwzCM2rVrGyVLlkzx+FL6PqT0fuzdu9cIDAw0fHx8DG9vb6Nu3brG9u3bk712z549RpUqVQwPDw8jb968xsSJE43g4GBDknH8+PH/HLt27dpG7dq1Hdpmz55tFCxY0HB1dTUkGZs2bbrrsSd9Fo4ePWo0bNjQ8Pb2NrJnz26MHDnSSEhISPE1r776qiHJWLBgwV37TcmtW7eML7/80qhZs6bh5+dnuLu7G/ny5TN69Ohh/Pbbb/b97vdz81/HumnTJiMwMNDw8/MzvLy8jEKFChndu3c3du/e7dDHwoULjWLFihmenp5GqVKljO+//95o06aNUaxYMYf9oqOjjYEDBxo5c+Y03N3djSJFihiffPKJkZiY6LDfvc4tSR7mPfz++++NMmXKGF5eXkb+/PmNjz/+2JgzZ84jfVb27dtn1K5d2/Dy8jJy5cplfPjhh0ZQUFCyPu/lt99+M7p27WrkzZvX8PDwMNKnT2+UKVPGGDx4sHHkyJEU92/durWRJUsWw9PT08iXL5/Rvn17IzQ01L5P0vn24sWLDq9N6Wfj+vXrRv/+/Y0sWbIY6dOnN5o3b26cPn3akGSMHDnS4fX3cx7etGmTIclYsmTJfR0/AMAabIbxhFYFBQDgKfH777+rfPnymj9//n3djh5IbQYOHKigoCCFhYXJ29vb2eU8FuXKlZO/v782btz4WPpPC+8hAABPEmtgAQBwD9evX0/WNnnyZLm4uKhWrVpOqAh4vOLi4jR//ny1adPmqQhebt68qVu3bjm0bd68WX/88Yfq1KnzWMZ82t5DAACsgDWwAAC4h/Hjx2vPnj2qW7eu3NzctHbtWq1du1YvvfSS/U5zwNPgwoUL+uGHH/Ttt9/q8uXLeuONN5xdkinOnj2rBg0aqHPnzsqZM6cOHjyoGTNmKCAgQC+//LKpYz2t7yEAAFZAgAUAwD0899xz2rhxoz788ENdu3ZNefPm1fvvv6933nnH2aUBpvr777/VqVMnZcuWTZ9//rnKlSvn7JJMkSlTJlWsWFFffvmlLl68qPTp06tp06YaN25cskXjH9XT+h4CAGAFrIEFAAAAAAAAS2MNLAAAAAAAAFgaARYAAAAAAAAsLU2ugZWYmKhz584pQ4YMstlszi4HAAAAAADgqWYYhqKjo5UzZ065uDz4fKo0GWCdO3eOO0cBAAAAAAA8YadPn1bu3Lkf+HVpMsDKkCGDpH/fNF9fXydXAwAAAAAA8HSLiopSnjx57JnMg0qTAVbSZYO+vr4EWAAAAAAAAE/Iwy7lxCLuAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsLU2ugQUAAAAAAFKvhIQE3bx509ll4Dbu7u5ydXV9bP0TYAEAAAAAgFTBMAyFhYUpIiLC2aUgBRkzZlRAQMBDL9R+LwRYAAAAAAAgVUgKr7JlyyZvb+/HEpTgwRmGodjYWF24cEGSlCNHDtPHIMACAAAAAACWl5CQYA+vsmTJ4uxycId06dJJki5cuKBs2bKZfjkhi7gDAAAAAADLS1rzytvb28mV4G6SvjePY30yAiwAAAAAAJBqcNmgdT3O7w0BFgAAAAAAACyNAAsAAAAAAMCCunfvrlatWjm7DEsgwAIAAAAAAIClEWABAAAAAAA8hQzD0K1bt5xdhikIsAAAAAAAAO4hOjpanTp1Uvr06ZUjRw5NmjRJderU0YABAyRJ8fHxGjJkiHLlyqX06dOrSpUq2rx5s/31c+fOVcaMGbV+/XoVL15cPj4+atSokc6fP2/fJyEhQYMGDVLGjBmVJUsWDR06VIZhONSRmJiosWPHqkCBAkqXLp3Kli2rb7/91r598+bNstlsWrt2rSpWrChPT09t27btsb43TwoBFgAAAAAAwD0MGjRIP//8s77//ntt3LhRP/30k/bu3Wvf/tprr2nHjh1auHCh9u3bp3bt2qlRo0Y6fPiwfZ/Y2Fh9+umnmjdvnrZu3apTp05pyJAh9u0TJkzQ3LlzNWfOHG3btk1XrlzR8uXLHeoYO3asvv76a82YMUN//fWXBg4cqM6dO2vLli0O+7399tsaN26cDhw4oDJlyjymd+XJcnN2AQAAAAAAAFYVHR2tr776SgsWLFD9+vUlScHBwcqZM6ck6dSpUwoODtapU6fsbUOGDNG6desUHBysMWPGSJJu3rypGTNmqFChQpL+Db1GjRplH2fy5MkaNmyYWrduLUmaMWOG1q9fb98eHx+vMWPG6IcfflC1atUkSQULFtS2bds0c+ZM1a5d277vqFGj9Pzzzz+ut8QpCLAAAAAAAADu4tixY7p586YqV65sb/Pz81PRokUlSfv371dCQoKeeeYZh9fFx8crS5Ys9ufe3t728EqScuTIoQsXLkiSIiMjdf78eVWpUsW+3c3NTZUqVbJfRnjkyBHFxsYmC6Zu3Lih8uXLO7RVqlTpUQ7ZkgiwAAAAAAAAHtK1a9fk6uqqPXv2yNXV1WGbj4+P/Wt3d3eHbTabLdkaV/81jiStXr1auXLlctjm6enp8Dx9+vT33W9qQYAFAAAAAABwFwULFpS7u7t+/fVX5c2bV9K/M6b++ecf1apVS+XLl1dCQoIuXLigmjVrPtQYfn5+ypEjh3bt2qVatWpJkm7duqU9e/aoQoUKkqQSJUrI09NTp06dcrhcMK0gwAIAAAAAALiLDBkyqFu3bnrzzTeVOXNmZcuWTSNHjpSLi4tsNpueeeYZderUSV27dtWECRNUvnx5Xbx4UaGhoSpTpoyaNm16X+O88cYbGjdunIoUKaJixYpp4sSJioiIcKhjyJAhGjhwoBITE1WjRg1FRkbq559/lq+vr7p16/aY3gFrIMACAAAAAAC4h4kTJ+rll19Ws2bN5Ovrq6FDh+r06dPy8vKS9O+i7qNHj9bgwYN19uxZZc2aVVWrVlWzZs3ue4zBgwfr/Pnz6tatm1xcXNSzZ0/973//U2RkpH2fDz/8UP7+/ho7dqyOHTumjBkzqkKFCho+fLjpx2w1NuNBLrh8SkRFRcnPz0+RkZHy9fV1djkAAAAAAOA/xMXF6fjx4ypQoIA9OHKWmJgY5cqVSxMmTFCvXr2cWouV3Ot79KhZDDOwAAAAAAAA7uG3337TwYMHVblyZUVGRmrUqFGSpJYtWzq5srSDAAsAAAAAAOA/fPrppzp06JA8PDxUsWJF/fTTT8qaNauzy0ozCLCekJp9P3R2CXgEP80c4ewSAAAAAABOUr58ee3Zs8fZZaRpBFgAAADAU6zhwmHOLgGPYEPHsc4uAQAswZIB1tmzZ/XWW29p7dq1io2NVeHChRUcHKxKlSpJkgzD0MiRIzV79mxFRESoevXqmj59uooUKeLkygHAOZjlmboxyxMAAAC4NxdnF3Cnq1evqnr16nJ3d9fatWv1999/a8KECcqUKZN9n/Hjx+vzzz/XjBkztGvXLqVPn16BgYGKi4tzYuUAAAAAAAB4HCw3A+vjjz9Wnjx5FBwcbG8rUKCA/WvDMDR58mS9++679tX+v/76a2XPnl0rVqxQx44dn3jNAAAAAAAAeHwsNwPr+++/V6VKldSuXTtly5ZN5cuX1+zZs+3bjx8/rrCwMDVo0MDe5ufnpypVqmjHjh0p9hkfH6+oqCiHBwAAAAAAAFIHywVYx44ds69ntX79er3yyivq37+/vvrqK0lSWFiYJCl79uwOr8uePbt9253Gjh0rPz8/+yNPnjyP9yAAAAAAAABgGssFWImJiapQoYLGjBmj8uXL66WXXlKfPn00Y8aMh+5z2LBhioyMtD9Onz5tYsUAAAAAAAB4nCy3BlaOHDlUokQJh7bixYtr6dKlkqSAgABJUnh4uHLkyGHfJzw8XOXKlUuxT09PT3l6ej6eggEAeETc4j514xb3AAA435O+K/eD3kW6e/fu9ivLbnf48GGNHj06xW2BgYFat26dJCl//vw6efKkvvnmm2Rrf5csWVJ///23goOD1b17d4dtY8eO1bvvvqtx48bpzTffdNg2d+5cDRgwQBEREQ9U8+11PUmWm4FVvXp1HTp0yKHtn3/+Ub58+ST9u6B7QECAQkND7dujoqK0a9cuVatW7YnWCgAAAAAAcD8aNWqk8+fPOzySblqX0rZvvvnG4fV33vBOknbu3KmwsDClT58+xTHnzJmjoUOHas6cOabVfGddT4rlAqyBAwdq586dGjNmjI4cOaIFCxZo1qxZ6tevnyTJZrNpwIABGj16tL7//nvt379fXbt2Vc6cOdWqVSvnFg8AAAAAAJACT09PBQQEODxcXV3vui1TpkwOr+/UqZO2bNnisCzSnDlz1KlTJ7m5Jb/AbsuWLbp+/bpGjRqlqKgobd++3ZSa76zrSbHcJYTPPvusli9frmHDhmnUqFEqUKCAJk+erE6dOtn3GTp0qGJiYvTSSy8pIiJCNWrU0Lp16+Tl5eXEyvE04/Ke1I9LfADg4T3pyzJgrnR1nV0BAMAM2bNnV2BgoL766iu9++67io2N1aJFi7RlyxZ9/fXXyfYPCgrSCy+8IHd3d73wwgsKCgrSc88954TKzWG5GViS1KxZM+3fv19xcXE6cOCA+vTp47DdZrNp1KhRCgsLU1xcnH744Qc988wzTqoWAAAAAADg3latWiUfHx/7o127dnfd5uPjozFjxiTro2fPnpo7d64Mw9C3336rQoUKpbgeeFRUlL799lt17txZktS5c2ctXrxY165de6Sa71bXk2C5GVgAAAAAAABPm7p162r69On257evW3XnNknKnDlzsj6aNm2qvn37auvWrZozZ4569uyZ4ljffPONChUqpLJly0qSypUrp3z58mnRokXq1avXQ9d8t7qeBAIsAAAAAACAxyx9+vQqXLjwA2+7nZubm7p06aKRI0dq165dWr58eYr7BQUF6a+//nJYGysxMVFz5sx5oADrfut6EgiwAAAAAAAAUomePXvq008/VYcOHVJcUH3//v3avXu3Nm/e7DBb6sqVK6pTp44OHjyoYsWKPcmSTUGABQAAAAAA4ETx8fEKCwtzaHNzc1PWrFmT7Vu8eHFdunRJ3t7eKfYVFBSkypUrq1atWsm2PfvsswoKCtInn3wiSUpISNDvv//usI+np6eKFy/+wHU9bgRYAAAAAAAATrRu3TrlyJHDoa1o0aI6ePBgivtnyZIlxfYbN25o/vz5euutt1Lc3qZNG02YMMG+EPu1a9dUvnx5h30KFSqkI0eOPFRdj5PNMAzjiY/qZFFRUfLz81NkZKR8fX2fyJjcfjp1S1c31tkl4BFt6DjW2SU8VpxjUjfOManb035+kTjHpHacY1K3tHCOAe5XXFycjh8/rgIFCsjLy8vZ5SAF9/oePWoW42JWkQAAAAAAAMDjwCWEAAAAAACnYIZn6vfTzBHOLgFpBDOwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNLcnF0AAAAAAADAo2i4cNgTHW9Dx7EPtH/37t311VdfqW/fvpoxY4bDtn79+mnatGnq1q2b5s6da2/fsWOHatSooUaNGmn16tUOrzlx4oQKFCig3377TeXKlUs23ty5c9WjR49k7Z6enoqLi3ug2q2CGVgAAAAAAACPWZ48ebRw4UJdv37d3hYXF6cFCxYob968yfYPCgrS66+/rq1bt+rcuXMPPJ6vr6/Onz/v8Dh58uQjHYMzEWABAAAAAAA8ZhUqVFCePHm0bNkye9uyZcuUN29elS9f3mHfa9euadGiRXrllVfUtGlTh5lZ98tmsykgIMDhkT179kc9DKchwAIAAAAAAHgCevbsqeDgYPvzOXPmpHip3+LFi1WsWDEVLVpUnTt31pw5c2QYxpMs1XIIsAAAAAAAAJ6Azp07a9u2bTp58qROnjypn3/+WZ07d062X1BQkL29UaNGioyM1JYtWx5orMjISPn4+Dg8GjdubMpxOAOLuAMAAAAAADwB/v7+9ksCDcNQ06ZNlTVrVod9Dh06pF9++UXLly+XJLm5ualDhw4KCgpSnTp17nusDBkyaO/evQ5t6dKle+RjcBYCLAAAAAAA8FCe5N3//N0zqE++OlJEOrl6ODfO+OfKmQfaPyo+RtduXNc/V84osF0LjXprhCRp5PjR+ufKGV27cV0u8e7658oZfTJ1sm7duqWcOXPaX28Yhjw8PTTgw2HK4OurMxHnJUknI8PlnUItYdeuSDabEjN7ObTHyHCo/ZnMuR/oOJyJAAsAAAAAAOAJqVm/jm7euCGbzaYa9Wo7bLt165a+W7RUb384QtXr1nLY1q9Lb61a+p1e6NHlSZZrGQRYAAAAAAAAT4irq6vW7thk//p2m9f/oMiISLXt3FEZfH0dtjVs1kTfzl/oEGAdP3I0Wf+Fiz0j6d9ZWxfDLyTbnsU/q1xcUt+S6ARYAAAAAAAAT5CPb4YU278NWaTnatdIFl5JUmDzxvpyynQd/OuAfDL4SJIG9u6XbL8t+36RJF2LjlaNEhWTbd/29x75Z8/2KOU7BQEWAAAAAABI1b5omDzIsZJxUyfdc/u0+UH/2UeZiuV16PJp+/Pbv75T6xfbq/WL7e+/wFQg9c0ZAwAAAAAAQJpCgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAMDyEmXIkCTDcHYpuIvExMTH1rfbY+sZAAAAAADAJBE3YxR9I1Y+lyOUPqOvbG6uzi4p1YuLizOlH8MwdOPGDV28eFEuLi7y8PAwpd/bEWABAAAAAADLS5Chr8/+rIbxpVQoNrtcXbio7JFdvW5qd97e3sqbN69cHsP3hgALAAAAAACkClEJcVoavlverh5K5+Ihm2zOLilVC2o6yLS+XF1d5ebmJpvt8XxPCLAAAAAAAECqYUiKSbihmIQbzi4l1fPy8nJ2CfeN+XYAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClWS7Aev/992Wz2RwexYoVs2+Pi4tTv379lCVLFvn4+KhNmzYKDw93YsUAAAAAAAB4nCwXYElSyZIldf78eftj27Zt9m0DBw7UypUrtWTJEm3ZskXnzp1T69atnVgtAAAAAAAAHic3ZxeQEjc3NwUEBCRrj4yMVFBQkBYsWKB69epJkoKDg1W8eHHt3LlTVatWfdKlAgAAAAAA4DGz5Aysw4cPK2fOnCpYsKA6deqkU6dOSZL27NmjmzdvqkGDBvZ9ixUrprx582rHjh3OKhcAAAAAAACPkeVmYFWpUkVz585V0aJFdf78eX3wwQeqWbOm/vzzT4WFhcnDw0MZM2Z0eE327NkVFhZ21z7j4+MVHx9vfx4VFfW4ygcAAAAAAIDJLBdgNW7c2P51mTJlVKVKFeXLl0+LFy9WunTpHqrPsWPH6oMPPjCrRAAAAAAAADxBlryE8HYZM2bUM888oyNHjiggIEA3btxQRESEwz7h4eEprpmVZNiwYYqMjLQ/Tp8+/ZirBgAAAAAAgFksH2Bdu3ZNR48eVY4cOVSxYkW5u7srNDTUvv3QoUM6deqUqlWrdtc+PD095evr6/AAAAAAAABA6mC5SwiHDBmi5s2bK1++fDp37pxGjhwpV1dXvfDCC/Lz81OvXr00aNAgZc6cWb6+vnr99ddVrVo17kAIAAAAAADwlLJcgHXmzBm98MILunz5svz9/VWjRg3t3LlT/v7+kqRJkybJxcVFbdq0UXx8vAIDAzVt2jQnVw0AAAAAAIDHxXIB1sKFC++53cvLS1OnTtXUqVOfUEUAAAAAAABwJsuvgQUAAAAAAIC0jQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLMyXAOnXqlAzDSNZuGIZOnTplxhAAAAAAAABIo0wJsAoUKKCLFy8ma79y5YoKFChgxhAAAAAAAABIo0wJsAzDkM1mS9Z+7do1eXl5mTEEAAAAAAAA0ii3R3nxoEGDJEk2m00jRoyQt7e3fVtCQoJ27dqlcuXKPVKBAAAAAAAASNseKcD67bffJP07A2v//v3y8PCwb/Pw8FDZsmU1ZMiQR6sQAAAAAAAAadojBVibNm2SJPXo0UOfffaZfH19TSkKAAAAAAAASPJIAVaS4OBgM7oBAAAAAAAAkjElwIqJidG4ceMUGhqqCxcuKDEx0WH7sWPHzBgGAAAAAAAAaZApAVbv3r21ZcsWdenSRTly5EjxjoQAAAAAAADAwzAlwFq7dq1Wr16t6tWrm9EdAAAAAAAAYOdiRieZMmVS5syZzegKAAAAAAAAcGBKgPXhhx/qvffeU2xsrBndAQAAAAAAAHamXEI4YcIEHT16VNmzZ1f+/Pnl7u7usH3v3r1mDAMAAAAAAIA0yJQAq1WrVmZ0AwAAAAAAACRjSoA1cuRIM7oBAAAAAAAAkjFlDSwAAAAAAADgcTElwHJxcZGrq+tdHw9r3LhxstlsGjBggL0tLi5O/fr1U5YsWeTj46M2bdooPDzchKMAAAAAAACAFZlyCeHy5csdnt+8eVO//fabvvrqK33wwQcP1eevv/6qmTNnqkyZMg7tAwcO1OrVq7VkyRL5+fnptddeU+vWrfXzzz8/dP0AAAAAAACwLlMCrJYtWyZra9u2rUqWLKlFixapV69eD9TftWvX1KlTJ82ePVujR4+2t0dGRiooKEgLFixQvXr1JEnBwcEqXry4du7cqapVqz7agQAAAAAAAMByHusaWFWrVlVoaOgDv65fv35q2rSpGjRo4NC+Z88e3bx506G9WLFiyps3r3bs2PHI9QIAAAAAAMB6TJmBlZLr16/r888/V65cuR7odQsXLtTevXv166+/JtsWFhYmDw8PZcyY0aE9e/bsCgsLu2uf8fHxio+Ptz+Piop6oJoAAAAAAADgPKYEWJkyZZLNZrM/NwxD0dHR8vb21vz58++7n9OnT+uNN97Qxo0b5eXlZUZpkqSxY8c+9FpcAAAAAAAAcC5TAqzJkyc7PHdxcZG/v7+qVKmiTJky3Xc/e/bs0YULF1ShQgV7W0JCgrZu3aovvvhC69ev140bNxQREeEwCys8PFwBAQF37XfYsGEaNGiQ/XlUVJTy5Mlz33UBAAAAAADAeUwJsLp162ZGN6pfv77279/v0NajRw8VK1ZMb731lvLkySN3d3eFhoaqTZs2kqRDhw7p1KlTqlat2l379fT0lKenpyk1AgAAAAAA4MkybQ2siIgIBQUF6cCBA5KkkiVLqmfPnvLz87vvPjJkyKBSpUo5tKVPn15ZsmSxt/fq1UuDBg1S5syZ5evrq9dff13VqlXjDoQAAAAAAABPKVPuQrh7924VKlRIkyZN0pUrV3TlyhVNnDhRhQoV0t69e80Ywm7SpElq1qyZ2rRpo1q1aikgIEDLli0zdQwAAAAAAABYhykzsAYOHKgWLVpo9uzZcnP7t8tbt26pd+/eGjBggLZu3frQfW/evNnhuZeXl6ZOnaqpU6c+SskAAAAAAABIJUwJsHbv3u0QXkmSm5ubhg4dqkqVKpkxBAAAAAAAANIoUy4h9PX11alTp5K1nz59WhkyZDBjCAAAAAAAAKRRpgRYHTp0UK9evbRo0SKdPn1ap0+f1sKFC9W7d2+98MILZgwBAAAAAACANMqUSwg//fRT2Ww2de3aVbdu3ZIkubu765VXXtG4cePMGAIAAAAAAABplCkBloeHhz777DONHTtWR48elSQVKlRI3t7eZnQPAAAAAACANMyUACuJt7e3SpcubWaXAAAAAAAASONMCbDi4uI0ZcoUbdq0SRcuXFBiYqLD9r1795oxDAAAAAAAANIgUwKsXr16acOGDWrbtq0qV64sm81mRrcAAAAAAACAOQHWqlWrtGbNGlWvXt2M7gAAAAAAAAA7FzM6yZUrlzJkyGBGVwAAAAAAAIADUwKsCRMm6K233tLJkyfN6A4AAAAAAACwM+USwkqVKikuLk4FCxaUt7e33N3dHbZfuXLFjGEAAAAAAACQBpkSYL3wwgs6e/asxowZo+zZs7OIOwAAAAAAAExjSoC1fft27dixQ2XLljWjOwAAAAAAAMDOlDWwihUrpuvXr5vRFQAAAAAAAODAlABr3LhxGjx4sDZv3qzLly8rKirK4QEAAAAAAAA8LFMuIWzUqJEkqX79+g7thmHIZrMpISHBjGEAAAAAAACQBpkSYG3atMmMbgAAAAAAAIBkTAmwateufddtf/75pxlDAAAAAAAAII0yZQ2sO0VHR2vWrFmqXLkydyYEAAAAAADAIzE1wNq6dau6deumHDly6NNPP1W9evW0c+dOM4cAAAAAAABAGvPIlxCGhYVp7ty5CgoKUlRUlNq3b6/4+HitWLFCJUqUMKNGAAAAAAAApGGPNAOrefPmKlq0qPbt26fJkyfr3LlzmjJlilm1AQAAAAAAAI82A2vt2rXq37+/XnnlFRUpUsSsmgAAAAAAAAC7R5qBtW3bNkVHR6tixYqqUqWKvvjiC126dMms2gAAAAAAAIBHC7CqVq2q2bNn6/z58+rbt68WLlyonDlzKjExURs3blR0dLRZdQIAAAAAACCNMuUuhOnTp1fPnj21bds27d+/X4MHD9a4ceOULVs2tWjRwowhAAAAAAAAkEaZEmDdrmjRoho/frzOnDmjb775xuzuAQAAAAAAkMaYHmAlcXV1VatWrfT9998/riEAAAAAAACQBjy2AAsAAAAAAAAwAwEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLMy3AmjdvnqpXr66cOXPq5MmTkqTJkyfru+++M2sIAAAAAAAApEGmBFjTp0/XoEGD1KRJE0VERCghIUGSlDFjRk2ePNmMIQAAAAAAAJBGmRJgTZkyRbNnz9Y777wjV1dXe3ulSpW0f/9+M4YAAAAAAABAGmVKgHX8+HGVL18+Wbunp6diYmLMGAIAAAAAAABplCkBVoECBfT7778na1+3bp2KFy9uxhAAAAAAAABIo9zM6GTQoEHq16+f4uLiZBiGfvnlF33zzTcaO3asvvzySzOGAAAAAAAAQBplSoDVu3dvpUuXTu+++65iY2P14osvKmfOnPrss8/UsWNHM4YAAAAAAABAGmVKgCVJnTp1UqdOnRQbG6tr164pW7ZsZnUNAAAAAACANMyUNbCuX7+u2NhYSZK3t7euX7+uyZMna8OGDWZ0DwAAAAAAgDTMlACrZcuW+vrrryVJERERqly5siZMmKCWLVtq+vTpZgwBAAAAAACANMqUAGvv3r2qWbOmJOnbb79VQECATp48qa+//lqff/65GUMAAAAAAAAgjTIlwIqNjVWGDBkkSRs2bFDr1q3l4uKiqlWr6uTJk2YMAQAAAAAAgDTKlACrcOHCWrFihU6fPq3169erYcOGkqQLFy7I19fXjCEAAAAAAACQRpkSYL333nsaMmSI8ufPrypVqqhatWqS/p2NVb58eTOGAAAAAAAAQBrlZkYnbdu2VY0aNXT+/HmVLVvW3l6/fn3973//M2MIAAAAAAAApFGmBFiSFBAQoICAAIe2ypUrm9U9AAAAAAAA0ijTAqzdu3dr8eLFOnXqlG7cuOGwbdmyZWYNAwAAAAAAgDTGlDWwFi5cqOeee04HDhzQ8uXLdfPmTf3111/68ccf5efnZ8YQAAAAAAAASKNMCbDGjBmjSZMmaeXKlfLw8NBnn32mgwcPqn379sqbN68ZQwAAAAAAACCNMiXAOnr0qJo2bSpJ8vDwUExMjGw2mwYOHKhZs2aZMQQAAAAAAADSKFMCrEyZMik6OlqSlCtXLv3555+SpIiICMXGxpoxBAAAAAAAANIoUxZxr1WrljZu3KjSpUurXbt2euONN/Tjjz9q48aNql+/vhlDAAAAAAAAII0yJcD64osvFBcXJ0l655135O7uru3bt6tNmzZ69913zRgCAAAAAAAAaZQpAVbmzJntX7u4uOjtt982o1sAAAAAAADAnABLkhITE3XkyBFduHBBiYmJDttq1apl1jAAAAAAAABIY0wJsHbu3KkXX3xRJ0+elGEYDttsNpsSEhLMGAYAAAAAAABpkCkB1ssvv6xKlSpp9erVypEjh2w2mxndAgAAAAAAAOYEWIcPH9a3336rwoULm9EdAAAAAAAAYOdiRidVqlTRkSNHzOgKAAAAAAAAcPDQM7D27dtn//r111/X4MGDFRYWptKlS8vd3d1h3zJlyjx8hQAAAAAAAEjTHjrAKleunGw2m8Oi7T179rR/nbSNRdwBAAAAAADwKB46wDp+/LiZdQAAAAAAAAApeugAK1++fGbWAQAAAAAAAKTIlEXcx44dqzlz5iRrnzNnjj7++GMzhgAAAAAAAEAaZUqANXPmTBUrVixZe8mSJTVjxgwzhgAAAAAAAEAaZUqAFRYWphw5ciRr9/f31/nz580YAgAAAAAAAGmUKQFWnjx59PPPPydr//nnn5UzZ04zhgAAAAAAAEAa9dCLuN+uT58+GjBggG7evKl69epJkkJDQzV06FANHjzYjCEAAAAAAACQRpkSYL355pu6fPmyXn31Vd24cUOS5OXlpbfeekvDhg0zYwgAAAAAAACkUY8cYCUkJOjnn3/W22+/rREjRujAgQNKly6dihQpIk9PTzNqBAAAAAAAQBr2yAGWq6urGjZsqAMHDqhAgQJ69tlnzagLAAAAAAAAkGTSIu6lSpXSsWPHzOgKAAAAAAAAcGBKgDV69GgNGTJEq1at0vnz5xUVFeXwAAAAAAAAAB6WKQFWkyZN9Mcff6hFixbKnTu3MmXKpEyZMiljxozKlCnTA/U1ffp0lSlTRr6+vvL19VW1atW0du1a+/a4uDj169dPWbJkkY+Pj9q0aaPw8HAzDgMAAAAAAAAWZMpdCDdt2mRGN5Kk3Llza9y4cSpSpIgMw9BXX32lli1b6rffflPJkiU1cOBArV69WkuWLJGfn59ee+01tW7dWj///LNpNQAAAAAAAMA6TAmwateubUY3kqTmzZs7PP/oo480ffp07dy5U7lz51ZQUJAWLFigevXqSZKCg4NVvHhx7dy5U1WrVjWtDgAAAAAAAFiDKQHW1q1b77m9Vq1aD9VvQkKClixZopiYGFWrVk179uzRzZs31aBBA/s+xYoVU968ebVjx467Bljx8fGKj4+3P2ddLgAAAAAAgNTDlACrTp06ydpsNpv964SEhAfqb//+/apWrZri4uLk4+Oj5cuXq0SJEvr999/l4eGhjBkzOuyfPXt2hYWF3bW/sWPH6oMPPnigGgAAAAAAAGANpizifvXqVYfHhQsXtG7dOj377LPasGHDA/dXtGhR/f7779q1a5deeeUVdevWTX///fdD1zds2DBFRkbaH6dPn37ovgAAAAAAAPBkmTIDy8/PL1nb888/Lw8PDw0aNEh79ux5oP48PDxUuHBhSVLFihX166+/6rPPPlOHDh1048YNRUREOMzCCg8PV0BAwF378/T0lKen5wPVAAAAAAAAAGswZQbW3WTPnl2HDh165H4SExMVHx+vihUryt3dXaGhofZthw4d0qlTp1StWrVHHgcAAAAAAADWY8oMrH379jk8NwxD58+f17hx41SuXLkH6mvYsGFq3Lix8ubNq+joaC1YsECbN2/W+vXr5efnp169emnQoEHKnDmzfH199frrr6tatWrcgRAAAAAAAOApZUqAVa5cOdlsNhmG4dBetWpVzZkz54H6unDhgrp27arz58/Lz89PZcqU0fr16/X8889LkiZNmiQXFxe1adNG8fHxCgwM1LRp08w4DAAAAAAAAFiQKQHW8ePHHZ67uLjI399fXl5eD9xXUFDQPbd7eXlp6tSpmjp16gP3DQAAAAAAgNTnkQOsEydOaOPGjbpx44bq1KmjkiVLmlEXAAAAAAAAIOkRA6xNmzapWbNmun79+r+dublpzpw56ty5synFAQAAAAAAAI90F8IRI0bo+eef19mzZ3X58mX16dNHQ4cONas2AAAAAAAA4NECrD///FNjxoxRjhw5lClTJn3yySe6cOGCLl++bFZ9AAAAAAAASOMeKcCKiopS1qxZ7c+9vb2VLl06RUZGPnJhAAAAAAAAgGTCIu7r16+Xn5+f/XliYqJCQ0P1559/2ttatGjxqMMAAAAAAAAgjXrkAKtbt27J2vr27Wv/2mazKSEh4VGHAQAAAAAAQBr1SAFWYmKiWXUAAAAAAAAAKXqkNbAAAAAAAACAx40ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNJMC7AiIiL05ZdfatiwYbpy5Yokae/evTp79qxZQwAAAAAAACANcjOjk3379qlBgwby8/PTiRMn1KdPH2XOnFnLli3TqVOn9PXXX5sxDAAAAAAAANIgU2ZgDRo0SN27d9fhw4fl5eVlb2/SpIm2bt1qxhAAAAAAAABIo0wJsH799Vf17ds3WXuuXLkUFhZmxhAAAAAAAABIo0wJsDw9PRUVFZWs/Z9//pG/v78ZQwAAAAAAACCNMiXAatGihUaNGqWbN29Kkmw2m06dOqW33npLbdq0MWMIAAAAAAAApFGmBFgTJkzQtWvXlC1bNl2/fl21a9dW4cKFlSFDBn300UdmDAEAAAAAAIA0ypS7EPr5+Wnjxo3atm2b9u3bp2vXrqlChQpq0KCBGd0DAAAAAAAgDTMlwEpSo0YN1ahRw8wuAQAAAAAAkMaZEmB9/vnnKbbbbDZ5eXmpcOHCqlWrllxdXc0YDgAAAAAAAGmIKQHWpEmTdPHiRcXGxipTpkySpKtXr8rb21s+Pj66cOGCChYsqE2bNilPnjxmDAkAAAAAAIA0wpRF3MeMGaNnn31Whw8f1uXLl3X58mX9888/qlKlij777DOdOnVKAQEBGjhwoBnDAQAAAAAAIA0xZQbWu+++q6VLl6pQoUL2tsKFC+vTTz9VmzZtdOzYMY0fP15t2rQxYzgAAAAAAACkIabMwDp//rxu3bqVrP3WrVsKCwuTJOXMmVPR0dFmDAcAAAAAAIA0xJQAq27duurbt69+++03e9tvv/2mV155RfXq1ZMk7d+/XwUKFDBjOAAAAAAAAKQhpgRYQUFBypw5sypWrChPT095enqqUqVKypw5s4KCgiRJPj4+mjBhghnDAQAAAAAAIA0xZQ2sgIAAbdy4UQcPHtQ///wjSSpatKiKFi1q36du3bpmDAUAAAAAAIA0xpQAK0mxYsVUrFgxM7sEAAAAAABAGmdagHXmzBl9//33OnXqlG7cuOGwbeLEiWYNAwAAAAAAgDTGlAArNDRULVq0UMGCBXXw4EGVKlVKJ06ckGEYqlChghlDAAAAAAAAII0yZRH3YcOGaciQIdq/f7+8vLy0dOlSnT59WrVr11a7du3MGAIAAAAAAABplCkB1oEDB9S1a1dJkpubm65fvy4fHx+NGjVKH3/8sRlDAAAAAAAAII0yJcBKnz69fd2rHDly6OjRo/Ztly5dMmMIAAAAAAAApFGmrIFVtWpVbdu2TcWLF1eTJk00ePBg7d+/X8uWLVPVqlXNGAIAAAAAAABplCkB1sSJE3Xt2jVJ0gcffKBr165p0aJFKlKkCHcgBAAAAAAAwCN55AArISFBZ86cUZkyZST9eznhjBkzHrkwAAAAAAAAQDJhDSxXV1c1bNhQV69eNaMeAAAAAAAAwIEpi7iXKlVKx44dM6MrAAAAAAAAwIEpAdbo0aM1ZMgQrVq1SufPn1dUVJTDAwAAAAAAAHhYpizi3qRJE0lSixYtZLPZ7O2GYchmsykhIcGMYQAAAAAAAJAGmRJgbdq0yYxuAAAAAAAAgGRMCbBq165tRjcAAAAAAABAMqasgSVJP/30kzp37qznnntOZ8+elSTNmzdP27ZtM2sIAAAAAAAApEGmBFhLly5VYGCg0qVLp7179yo+Pl6SFBkZqTFjxpgxBAAAAAAAANIo0+5COGPGDM2ePVvu7u729urVq2vv3r1mDAEAAAAAAIA0ypQA69ChQ6pVq1aydj8/P0VERJgxBAAAAAAAANIoUwKsgIAAHTlyJFn7tm3bVLBgQTOGAAAAAAAAQBplSoDVp08fvfHGG9q1a5dsNpvOnTunkJAQDRkyRK+88ooZQwAAAAAAACCNcjOjk7fffluJiYmqX7++YmNjVatWLXl6emrIkCF6/fXXzRgCAAAAAAAAaZQpAZbNZtM777yjN998U0eOHNG1a9dUokQJ+fj4mNE9AAAAAAAA0jBTLiGcP3++YmNj5eHhoRIlSqhy5cqEVwAAAAAAADCFKQHWwIEDlS1bNr344otas2aNEhISzOgWAAAAAAAAMCfAOn/+vBYuXCibzab27dsrR44c6tevn7Zv325G9wAAAAAAAEjDTAmw3Nzc1KxZM4WEhOjChQuaNGmSTpw4obp166pQoUJmDAEAAAAAAIA0ypRF3G/n7e2twMBAXb16VSdPntSBAwfMHgIAAAAAAABpiCkzsCQpNjZWISEhatKkiXLlyqXJkyfrf//7n/766y+zhgAAAAAAAEAaZMoMrI4dO2rVqlXy9vZW+/btNWLECFWrVs2MrgEAAAAAAJDGmRJgubq6avHixQoMDJSrq6vDtj///FOlSpUyYxgAAAAAAACkQaYEWCEhIQ7Po6Oj9c033+jLL7/Unj17lJCQYMYwAAAAAAAASINMWwNLkrZu3apu3bopR44c+vTTT1WvXj3t3LnTzCEAAAAAAACQxjzyDKywsDDNnTtXQUFBioqKUvv27RUfH68VK1aoRIkSZtQIAAAAAACANOyRZmA1b95cRYsW1b59+zR58mSdO3dOU6ZMMas2AAAAAAAA4NFmYK1du1b9+/fXK6+8oiJFiphVEwAAAAAAAGD3SDOwtm3bpujoaFWsWFFVqlTRF198oUuXLplVGwAAAAAAAPBoAVbVqlU1e/ZsnT9/Xn379tXChQuVM2dOJSYmauPGjYqOjjarTgAAAAAAAKRRptyFMH369OrZs6e2bdum/fv3a/DgwRo3bpyyZcumFi1amDEEAAAAAAAA0ihTAqzbFS1aVOPHj9eZM2f0zTffmN09AAAAAAAA0hjTA6wkrq6uatWqlb7//vvHNQQAAAAAAADSgMcWYAEAAAAAAABmIMACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBplguwxo4dq2effVYZMmRQtmzZ1KpVKx06dMhhn7i4OPXr109ZsmSRj4+P2rRpo/DwcCdVDAAAAAAAgMfJcgHWli1b1K9fP+3cuVMbN27UzZs31bBhQ8XExNj3GThwoFauXKklS5Zoy5YtOnfunFq3bu3EqgEAAAAAAPC4uDm7gDutW7fO4fncuXOVLVs27dmzR7Vq1VJkZKSCgoK0YMEC1atXT5IUHBys4sWLa+fOnapataozygYAAAAAAMBjYrkZWHeKjIyUJGXOnFmStGfPHt28eVMNGjSw71OsWDHlzZtXO3bscEqNAAAAAAAAeHwsNwPrdomJiRowYICqV6+uUqVKSZLCwsLk4eGhjBkzOuybPXt2hYWFpdhPfHy84uPj7c+joqIeW80AAAAAAAAwl6VnYPXr109//vmnFi5c+Ej9jB07Vn5+fvZHnjx5TKoQAAAAAAAAj5tlA6zXXntNq1at0qZNm5Q7d257e0BAgG7cuKGIiAiH/cPDwxUQEJBiX8OGDVNkZKT9cfr06cdZOgAAAAAAAExkuQDLMAy99tprWr58uX788UcVKFDAYXvFihXl7u6u0NBQe9uhQ4d06tQpVatWLcU+PT095evr6/AAAAAAAABA6mC5NbD69eunBQsW6LvvvlOGDBns61r5+fkpXbp08vPzU69evTRo0CBlzpxZvr6+ev3111WtWjXuQAgAAAAAAPAUslyANX36dElSnTp1HNqDg4PVvXt3SdKkSZPk4uKiNm3aKD4+XoGBgZo2bdoTrhQAAAAAAABPguUCLMMw/nMfLy8vTZ06VVOnTn0CFQEAAAAAAMCZLLcGFgAAAAAAAHA7AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZmuQBr69atat68uXLmzCmbzaYVK1Y4bDcMQ++9955y5MihdOnSqUGDBjp8+LBzigUAAAAAAMBjZ7kAKyYmRmXLltXUqVNT3D5+/Hh9/vnnmjFjhnbt2qX06dMrMDBQcXFxT7hSAAAAAAAAPAluzi7gTo0bN1bjxo1T3GYYhiZPnqx3331XLVu2lCR9/fXXyp49u1asWKGOHTs+yVIBAAAAAADwBFhuBta9HD9+XGFhYWrQoIG9zc/PT1WqVNGOHTvu+rr4+HhFRUU5PAAAAAAAAJA6pKoAKywsTJKUPXt2h/bs2bPbt6Vk7Nix8vPzsz/y5MnzWOsEAAAAAACAeVJVgPWwhg0bpsjISPvj9OnTzi4JAAAAAAAA9ylVBVgBAQGSpPDwcIf28PBw+7aUeHp6ytfX1+EBAAAAAACA1CFVBVgFChRQQECAQkND7W1RUVHatWuXqlWr5sTKAAAAAAAA8LhY7i6E165d05EjR+zPjx8/rt9//12ZM2dW3rx5NWDAAI0ePVpFihRRgQIFNGLECOXMmVOtWrVyXtEAAAAAAAB4bCwXYO3evVt169a1Px80aJAkqVu3bpo7d66GDh2qmJgYvfTSS4qIiFCNGjW0bt06eXl5OatkAAAAAAAAPEaWC7Dq1KkjwzDuut1ms2nUqFEaNWrUE6wKAAAAAAAAzpKq1sACAAAAAABA2kOABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClEWABAAAAAADA0giwAAAAAAAAYGkEWAAAAAAAALA0AiwAAAAAAABYGgEWAAAAAAAALI0ACwAAAAAAAJZGgAUAAAAAAABLI8ACAAAAAACApRFgAQAAAAAAwNIIsAAAAAAAAGBpBFgAAAAAAACwNAIsAAAAAAAAWBoBFgAAAAAAACyNAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLAAAAAAAABgaQRYAAAAAAAAsDQCLAAAAAAAAFgaARYAAAAAAAAsjQALAAAAAAAAlkaABQAAAAAAAEsjwAIAAAAAAIClpdoAa+rUqcqfP7+8vLxUpUoV/fLLL84uCQAAAAAAAI9BqgywFi1apEGDBmnkyJHau3evypYtq8DAQF24cMHZpQEAAAAAAMBkqTLAmjhxovr06aMePXqoRIkSmjFjhry9vTVnzhxnlwYAAAAAAACTpboA68aNG9qzZ48aNGhgb3NxcVGDBg20Y8cOJ1YGAAAAAACAx8HN2QU8qEuXLikhIUHZs2d3aM+ePbsOHjyY4mvi4+MVHx9vfx4ZGSlJioqKenyF3uHWjbgnNhbMdys2/r93gqU9yZ93Z+Ack7pxjkndnvbzi8Q5JrXjHJO6Pe3nGM4vqR/nmNTtSZ5jksYyDOOhXm8zHvaVTnLu3DnlypVL27dvV7Vq1eztQ4cO1ZYtW7Rr165kr3n//ff1wQcfPMkyAQAAAAAAcIfTp08rd+7cD/y6VDcDK2vWrHJ1dVV4eLhDe3h4uAICAlJ8zbBhwzRo0CD788TERF25ckVZsmSRzWZ7rPUi9YuKilKePHl0+vRp+fr6OrscAE8ZzjEAHifOMQAeJ84xeBCGYSg6Olo5c+Z8qNenugDLw8NDFStWVGhoqFq1aiXp30AqNDRUr732Woqv8fT0lKenp0NbxowZH3OleNr4+vpyUgbw2HCOAfA4cY4B8DhxjsH98vPze+jXproAS5IGDRqkbt26qVKlSqpcubImT56smJgY9ejRw9mlAQAAAAAAwGSpMsDq0KGDLl68qPfee09hYWEqV66c1q1bl2xhdwAAAAAAAKR+qTLAkqTXXnvtrpcMAmby9PTUyJEjk12GCgBm4BwD4HHiHAPgceIcgycp1d2FEAAAAAAAAGmLi7MLAAAAAAAAAO6FAAsAAAAAAACWRoAFAAAAAAAASyPAAgAAAAAAgKURYAEAAAAAAMDSCLCQJiXdfDMmJsbJlQB4GnGDXwCPW9J55uDBg4qMjHRyNQCeRmvXrlVQUJCzywDsCLCQ5hiGIZvNpnXr1qlr1646ePCgs0sC8BRJOsdI0pIlSzRv3jwnVwTgaWSz2bR8+XJVqFBB//zzjxISEpxdEoCnyK5du/Tiiy/Ky8tLt27dcnY5gCQCLKRBNptNS5cuVYcOHVSiRAn7Xy2ZMQHgUSUmJtrDq/3792vUqFGaPXu2Vq5c6eTKADxtYmJi9Pvvv+ujjz7Ss88+K1dXV2eXBOApcfz4cf3444967bXX1KlTJ84vsAw3ZxcAPGl///23+vfvr/Hjx6tv37729jNnzihPnjxOrAxAaufi8u/fhd5++22dOXNG7u7u2rNnjz744APduHFDbdq0cXKFAJ4Gu3fvVsOGDVWoUCGNGTPG2eUAeEoYhqGwsDDVqFFD0dHR6tWrl6R/JwDcPsMccBZmYCHNOXHihLJmzaq+ffsqKipKQUFBev7551W8eHH169ePdbEAPJJZs2ZpxowZeuONN7R27Vrt2rVLHh4emjp1qlasWOHs8gA8Bfz9/VWzZk3t2bNH0dHRksQlhAAemc1mU44cOTR58mR5e3vr119/1f79++3bAGezGVw3hTTmwIEDqlChglq3bq2DBw8qT548Kly4sKpVq6Z27dppzZo1atSokbPLBJBK9e/fX0eOHNGaNWvsf638888/1b59e3l5eem9995Tq1atnF0mgFTu+PHj6t+/v3bt2qWffvpJRYsWVWJion0mKAA8iiVLlmjAgAFq1aqV3njjDT3zzDPOLgngEkI83ZJ+eQwPD5e7u7tiYmJUvHhxzZs3zz7zqlu3bnrmmWfk6uqqmjVrOrtkAKlUQkKCXF1d5eXlpdjYWCUkJMjFxUW3bt1SqVKlNGrUKHXt2lWzZ8+Wh4eHmjRp4uySAaQCSf+WOX36tGw2m+Li4lS4cGEVKFBA06ZNU58+fVSnTh1t3bpVRYoUIcQCcN+Szi+7d+/W4cOHFR0drSZNmihXrlxq166dbty4obfeeks2m01vvPGGihQp4uySkcbxfzc8tZJOyN9//71at26tWrVqqWHDhvr888/Vtm1brVmzRuPGjVPx4sXl6uqqESNG6Pjx4ypZsqSzSweQCiQmJjo8T1rgtGHDhtq6dauCgoJks9nk5vbv34psNpuef/55Xb16VXPnzuXGEQD+0+3/lmnWrJkaNGigmjVr6osvvpAk5cmTR7Nnz1aZMmVUr149HTx4kPAKwH1JOr8sW7ZMgYGBmjVrlkaMGKGePXtq3rx5MgxDnTp10scff6zVq1fro48+0pEjR5xdNtI4ZmDhqWWz2bRu3Tp16NBBn376qWrUqKFVq1ZpwIABKlWqlOrVqydJWrdunUJCQrRhwwatW7eOhdwB/CfDMOy/JIaEhOjcuXMKCAiw/4L54Ycfql+/frp27ZoaN26sTJkyae7cuWrYsKHKli2rOnXqaPfu3Xr22WedfCQArMxms2nNmjXq1KmTxowZo+eff17Lly9X//79FRERoeHDhytPnjwKCgpS27Zt1apVK+3fv1/u7u7OLh2AxdlsNm3ZskWvvPKKxo8fr169emnfvn2qWLGioqKiFB8fr969e6tTp06Ki4vTxIkT5ePj4+yykcaxBhaeWoZh6KWXXlKOHDk0atQonTp1SvXq1VODBg00Y8YM+z6LFy/Wjz/+qAEDBqh48eJOrhqA1d1+F54333xTX331lbJlyybDMJQrVy6FhITI399fkydP1nvvvaeMGTNKkvz8/PTrr7/q+PHjatGihdasWcNUfAD3FB4err59+6p69ep68803dfr0adWpU0e5cuXS9u3bNXz4cI0YMULu7u46e/asEhISlDdvXmeXDSAVuHXrlj755BNduHBBkyZN0rFjx/T888+ratWqunTpko4dO6bhw4erW7ducnFxUVRUlHx9fZ1dNtI4ZmDhqfDOO+/o1KlTmjdvnr3txo0b2rVrl958801FRUXpueeeU9OmTTV9+nRJ0vTp01WlShV16NBBLVu2lJeXl7PKB5BK3L62zIkTJ3Tq1CmFhoaqcOHCWr9+vSZMmKCWLVtqxYoVGjBggOrXr68LFy7oxo0bCgwMlIuLi4KDg+Xl5WUPtgDgbjw8PFS3bl21a9dO4eHhaty4serVq6fZs2frzTff1EcffaRbt25p9OjRypUrl7PLBZCKuLm5qVWrVjIMQ9euXVOXLl1Up04dBQUF6ejRo6pYsaImTpwowzDUs2dPZciQwdklA6yBhafD888/r6FDhzq0eXp6qkWLFgoNDVXx4sXVvHlzTZs2TTabTbGxsdq+fbs2btyohIQEwisA97R9+3ZJsodX8+fPV4sWLRQREaH8+fMrXbp0atmypYYPHy5XV1e1bNlS4eHhKl26tOrXr6/GjRvr4MGD6tatm4KCgjR//nz5+/s785AApAKZMmVS586dlTNnTn311VcKCAjQuHHjJElZs2ZV4cKFNXv2bF26dMnJlQKwutsvvEpax7NYsWIqUaKEdu/erejoaA0ZMkSSdPnyZVWsWFFly5ZVgwYNJMk++xxwJgIsPBXq1Kmj0qVLa9OmTQ63py9SpIh++OEH5c2bV++++65cXV2VkJCgjz76SNu2bVPbtm3tCy8DQErGjx+voUOHyjAMJSQkKCEhQREREXJ3d9fff/8tb29vSf/+w65Ro0Z655135OnpqerVqysiIkLSvzNCIyMj5enpqS1btqhs2bJOPCIAVpT0y+X+/fv13Xff6ZtvvtHly5eVJUsWSdLBgwfl6elpf37x4kW9++67OnHihLJly+a0ugFYX9LyBz/88IMGDx6sxo0ba86cOfr7778l/fvvlJiYGB09elSGYWjNmjUqVKiQZsyYwWXJsBTWwEKqlvTxtdlsOnPmjA4dOqTmzZurWbNmWrx4sSRp9OjRCg4OVsGCBZUrVy5du3ZNmzZt0g8//KDy5cs7s3wAqcCZM2cUEBAgNzc3HT58WEWKFFFcXJwWL16sDz/8UCVKlNCCBQuUPn16Sf+el7777jtt2LBBU6ZMsYfkhmHo5s2b8vDwcObhALCwpUuXavDgwcqSJYs8PT31559/auXKlapdu7ZCQkLUpUsX9enTR1evXtXGjRu1fft21u8EcF+WL1+ubt266cUXX1SWLFn01VdfqXz58po5c6ZsNpvatm2rS5cuyd3dXefOnVNoaCi/K8FyCLDwVFi2bJlmzpypiRMnKjw8XB06dFCNGjW0fPlySf/eJWz//v3av3+/KlasqE6dOqlo0aJOrhpAarJmzRo1a9ZMy5cvV8uWLRUXF6cFCxZo5syZyp07t+bNm2efjXW7hIQEZnoC+E+//PKLGjVqpPHjx6t37976+++/VapUKY0ZM0Zvv/22EhISNG3aNC1atEj+/v764IMPVKZMGWeXDSAVOH36tJo2bap+/fqpb9++MgxDvr6+6tevn8aMGSMXFxedPXtWq1evVmxsrJo2bcqNZmBJBFhItZKmwp4/f16tWrVSjx499PLLL0uSQkND1bFjR4cQCwAexaFDh/TJJ59oxYoVCg4OVvPmze0h1qxZs5Q3b14FBwfbZ2IBwINYsGCBVq9erZCQEB0/fly1a9dWs2bNNG3aNElSbGysvL29de3aNbm7u8vT09PJFQNILU6fPq1WrVrpp59+0tmzZ1W3bl01adJEs2bNkiTt3LlTzz77LH9wg+WxBhZSLZvNpvXr1+uTTz5RgQIF1KZNG/u2evXqadGiRdq2bZvatWvnxCoBpEYJCQnJ2ooWLaphw4apdevW6tKli1auXCkvLy+9+OKL6tu3r3bv3q0xY8Y4oVoAT4MjR44oLCxMp06dUp06ddS4cWN98cUXkv6daf7uu+8qLi5OPj4+hFcA7ilpjkrSYu2XLl3SpUuXtGfPHjVu3FhNmjTRjBkzJEl//PGHPvvsM+3fv99p9QL3iwALqdqZM2c0efJkrVmzRmFhYfZ2m82munXravHixVq6dKm6devmxCoBpBYxMTGSZP8L5Jw5czR69GiNHTtWklSoUCENHz5c7du3dwixOnbsqClTpmjUqFFOqx1A6vPrr7/qyy+/lCQ1bNhQCQkJKl++vOrXr6+ZM2fa9/vpp58UHh6umzdvOqtUAKmIzWbTzp07ValSJRmGofLly6t69eqqXbu2KlWqpFmzZtnvrLxo0SIdO3ZMAQEBTq4a+G9uzi4AeBS9evVShgwZ1LFjRwUFBWnEiBH2u/PYbDbVqVNHmzdv5oQM4D/17NlT//zzj1atWqWMGTPqnXfe0ZQpU1SlShXt3LlTa9eu1dy5c1WwYEENHz5cNptNPXr00LRp09S+fXs1bdpUEmteAfhvhmEoPj5es2bNUlhYmDp27KhSpUopV65cOnz4sKpXr65bt27p0qVL+vzzzzV//nxt2bJFGTJkcHbpACwuMTFRLi4u8vPz082bN/XJJ59o6NCheuONN3T58mX98ccf2rRpkyIiIrRt2zbNnj1b27Zt4/clpAqsgYVUI2nNq4sXLyomJkZZsmSRt7e3XF1dNXv2bPXt21fvvvuuBg4cqEyZMjm7XACpzK+//qoWLVqocuXKmjx5svr3769Ro0apVKlSunDhgurWrauMGTNqwYIFKly4sE6ePKk333xTkZGRWr9+vf0cBQB3k3SeSPoF85dfflGTJk30zjvvaODAgbp69aq6dOmiU6dO6fTp0ypVqpTOnj2rpUuXcjcwAPeUdH5JWi/v+vXrGjNmjH755RfNnDlT+fPnV2hoqGbPnq1169YpT548yp49uyZOnMgNIZBqEGAhVUg6IS9fvlwffvihzp07pwIFCqh06dL6/PPP5eXlpVmzZunll1/We++9p9dff90+EwsA/kvSrKnff/9dDRs2VJEiRZQhQwZ99dVXyp49uyTp4sWLqlGjhj3EKlSokMLCwpQtWzb7NHwA+C+bN2/Wvn371KlTJ2XJkkXTp0/XiBEjtHz5ctWsWVMxMTE6cOCA9uzZo6JFi6pw4cLKnTu3s8sGkAqEhoaqV69emjZtmho0aKDo6GhVqVJFgYGBmjp1qn2/o0ePKnv27DIMg5mdSFUIsJBqhIaGqmnTpvroo49UokQJ/frrr/r+++/l5+en1atXy8vLS3PmzFHv3r01evRovf322/xSCeCBGIahffv2qX379goPD9cvv/yiZ555xj5b4uLFi6pdu7auX7+ubdu2KVeuXJL+f7o+ANxLbGysSpcurePHj9vXocmYMaM++ugjeXh4aMSIEVzGA+ChvfvuuxozZozKlSunwMBABQYGKmPGjGrYsKGmTp1qv7kV/25BakWAhVQhISFBAwcO1PXr1zV79mx727p16/Tee++pZs2amjhxolxcXBQSEqLy5curRIkSTq4agNVt2rRJMTExatasmd544w1lz55dw4cP1759+9SoUSNVqFBB8+bNU6ZMmewzQcPDwzVgwADNnz+fta4A/KfbLy9OTEzU3LlztWrVKiUmJurIkSPq0qWLDhw4oBMnTmj06NGqUaOGbt26JTc3lqoFcG9J55fbzxnt2rXTxYsX1bBhQ61atUp58+ZVunTpFBsbq0mTJilnzpxOrhp4eARYSDU6duyoixcvKjQ01N5mGIbeeust7dq1Sxs2bOC20gDu28WLF9W9e3ddu3ZN2bJl08qVK/XLL7/Y14H4/fffFRgYqKpVq2ru3LnKlClTsr9YsmA7gPuxfft2FSlSRP7+/jpx4oT69u2rPn36KGfOnFq2bJn+/PNPbdiwQRUqVNDu3budXS6AVCQ0NFS7du1SvXr1VLVqVa1evVrLly9Xhw4dlDt3bvXs2VNHjx7VpUuXtGjRIvssLCA1Yt4gLCkpV71y5Yr96ypVqig2Nla7d+9WQkKCpH/vNFihQgWdO3dOkZGRTqsXQOrj7++v0aNH6+zZs1q2bJkmTJhgD68SExNVrlw5rV+/Xrt27VLPnj11+fLlZNPtCa8A3M2tW7ckSeHh4fr000+VO3duBQcHK0uWLBo+fLh69+4tX19fjRkzRu+8847y5cunQ4cO6dy5c06uHIDVJf1+tH//fq1evVrffPON3nnnHX3xxReqW7euoqOjtX37dhUvXlxbt27Ve++9p3r16qls2bJOrhx4NARYsJykqbCrVq1S27ZttW3bNklS27ZtdfHiRX344YcOf53csWOHcubMqfTp0zurZACpTNI//Ly8vFSwYEHVqlVLK1as0MqVKyVJLi4uunXrlj3E+u677zR+/HhnlgwglTh+/LjCw8Pl5uam7777Th999JG++uorvf3225oyZYpeeOEF3bp1Sx9++KHGjh2riIgI1axZU7/++qsOHjzI5T0A/pPNZtOaNWtUqVIl9ejRQ1999ZUaNWqk4cOH64033tCzzz6rjz76SKtWrZK7u7v69eunlStX6plnnnF26cAj4RJCWNLy5cvVtWtXDRkyRO3bt1fx4sUlSYcPH1bz5s3l4+MjScqbN69CQ0O1ZcsWlStXzokVA0gN7rZo6a5duzR27FhFRkZq0KBBat68uX1bQkKCTpw4ofz58zPjCsA93fi/9u48LMpy/+P4ewZFE7fymKihhIgLKMckN36KWIRpKl65dcwtNTdQXCC1cjlHQs0QMQU5FSqZpsUxVzApFMjtmAuHhEgTPSqKKRjiAjP8/vBiTrSppQ7U53Vd/jH3s/id+WN4ns/cz/e+eZNevXpx6NAhQkJCGDNmDO+//z5/+9vfANi5cydbt25lxYoVtGzZksqVKzN79my6d+9u5cpFpCK5dOkSK1aswGg08sorr1jGs7KyGD58OA0bNuTTTz/Fzc2N999/n8aNG1uxWpF7RwGWlDvZ2dl069aNyZMn4+/vb5mRdeDAAZ588kny8vLYuHEj+/btw97enoEDB9K8eXNrly0i5dwPw6v4+HguXrxISUkJAwYMoEqVKuzZs4cFCxZQUFCAv78/fn5+9OjRA19fXyZNmgSo55WI3F5eXh4eHh7897//5c033yQgIICbN29ia2sL3Aq59u7dy6RJkzhy5AhPPfUUCQkJWhFMRO7IV199RZs2bWjYsCFz5sxh6NChwP+uUQoKCvjggw949913+eabb8jIyKBu3bpWrlrk3lCAJeVOWloaL7zwAps2baJmzZqsXr2azZs3s3fvXry9vS1Lw0LZlX1ERO7EtGnTWLduHdWqVePatWvY2NiwZs0aPD09+eKLL1iyZAl79uyhZs2aXL9+nWPHjlG5cmVrly0iFcSlS5csfWaqVavGrl27sLe3t6wSVnrtcvbsWdauXctzzz1Hs2bNrFy1iJR3P7zvCQwMJCIigrlz5/Lqq69aAvDSEKukpIT8/HwKCwv1WLL8oSjAEqsr/TLOy8ujdu3a5Ofn4+DgwJNPPklWVhYeHh54eHjQvn17hgwZwty5cxk9erS1yxaRCig2NpbJkyezc+dOGjRogMFgYMSIEfz73/9m586duLm5kZaWRmZmJtnZ2UyaNIlKlSppSXsRuSsXLlzAZDLRp08fLl++THJyMvb29paZoFeuXKFmzZq/+FiziEipX/rB3t/fn3feeYd169bh5+d32/1F/ggUYIlVlX7Bbt26lUWLFhESEkKnTp3Iyspi6dKlODg4MHjwYOzt7TEajfj6+tK7d28mTJhg7dJFpJyLi4ujW7du1K5d2zL2j3/8gwMHDrBp06YyN47e3t5cu3aNvXv3/uQ8emxQRH5N6bVMVlYWeXl5GAwGWrduja2tLSdPnmTAgAHk5+dbZmKFh4dz6tQpFi5ciI2NjW40ReQXlX6/pKamkpKSQn5+Pq6urgwePBiAcePGsWrVKtatW0fv3r2tXK3I/aeffMSqDAYDcXFxvPDCC3h5eVG1alUAmjZtypIlSwgKCqJBgwaUlJQwc+ZMjhw5wrPPPmvlqkWkvNu6dSv9+vUjKiqKK1euWMYvXLhAZmYmcGulwRs3bgAQFBTE+fPnOXHixE/OpfBKRH5J6c3lxx9/jJeXF0OGDKFdu3b079+fuLg4HB0d2bBhA3/5y19wcXHh+eefJygoiGHDhlGpUiWFVyLyq0rvlXr06EF6ejoZGRnMmzePfv36ARAZGcmIESMYMmQIGzZssHK1IvefAiyxqhMnTjB16lRCQ0OZM2cOTzzxBHCrD1ZBQQFwa0XCfv36sXr1arZv346Tk5M1SxaRCqBnz55ERkYyc+ZM3n77bfLy8gAYPnw4RUVFzJ49G4AqVaoAYGtrS5UqVRRWichdMRgM7Nu3j5deeonZs2fz6aefkpKSgslkYtmyZXzyySc0btyYhIQEAgMDcXR05OjRo5YeWSIiv+b48eMEBQUxf/58Vq9eTWhoKOfPn6d+/fqWfZYtW0avXr0IDAy03D+J/FHpEUKxqv379zNs2DAOHDhAcXExsbGxxMXFkZqaip+fH3PnzqWoqIg1a9YwcuRIXFxcrF2yiJRzX375JadOneKJJ54gKSmJ4cOHExISQkBAAAaDgfnz5/Ppp5/i6enJa6+9xoULF5g6dSo3b94kPj5e/WhE5K6Eh4ezfv16UlNTLTOq0tLSmDZtGjVr1mT9+vWWcfXTE5E7UTq7c/fu3fj7+3P06FGys7Pp3LkzPXr0ICoqCoDU1FQ8PT0ByMnJwd7e3ppli9x3+gsqVtWkSRPOnDmDn58fp0+fpmXLlnh5eTF79mx8fX3p1asXQ4YMoWXLlrrgE5HbWrNmDYsWLaJhw4a0bt2aN954g8uXLzN58mTMZjMzZ84kMDAQOzs7oqOjiYqKwsHBgVq1apGSkoLRaFRTZRG5I6U3mEajkcLCQgoKCqhRowZms5lWrVoRHByMj48Px44do2XLlgC6lhGRX1Q6r6R0ldKGDRtSo0YN7O3t2b9/P/369ePZZ59l2bJlABw+fJi1a9dSp04dmjdvrvBK/hT0V1QemNILvVOnTgFw5coV3Nzc+Pzzz1m+fDldu3ZlyJAhPPbYY9jY2ODl5YXZbAZ0wScit7d69WrGjh3Le++9R/fu3S3N2ydNmoTBYCAwMBCA6dOnExwczKRJk/jss8+oW7cubdu2xcbGRrMjROSOlc6qatGiBUePHmXTpk0MHjzYEoA/+uijNG/eXN8pInJbX3/9NTt27MDf358NGzYwZ84cduzYQZ06dcjIyKBDhw6MHj2aFStWWI5ZtWoVX331FXXr1rVi5SIPlv6iygNRGl5t3LiRWbNmUVJSwoULFxg0aBCzZs3i3XffLbPva6+9RlpaGl26dLFi1SJSUaSnp7Nw4UIiIiIYNGiQZbw0kJo4cSIAgYGBGAwGxo0bx8MPP0zPnj0t+5pMJt1oisjP+uHMiK+//prc3FwqVapEmzZt8PHxYcaMGYwcORKTyUT37t2pVasWH3zwAcXFxTz88MNWrl5Eyrtdu3YxceJEDh48yKpVq4iJiaFhw4YAxMbG4uPjg9FoJDU1lYceeog1a9YQExNDcnIyderUsXL1Ig+OrtTlgTAYDOzcuZMXX3yRsLAwnn/+ebZv387QoUPx9vamT58+GAwGNm/eTGxsLKmpqWzbto3HH3/c2qWLSAVw5swZCgsL6dKliyUwh1uzN81mMwaDgYkTJ2Jra8v48eMpKCjg1Vdfxc7OznIONXAXkV9Tutrg1KlTMZlM2NjYULVqVTZt2kRISAhGo5GRI0fi6OhI9erVOXPmDAkJCZodISK3NXr0aJKSkli9ejWDBg1i2LBhlJSUUFJSgpeXF+vXr2fixIls2rSJWrVqYWdnR1JSEq1atbJ26SIPlJq4ywMTHBzM9evXiYiI4MSJE3Tv3p2uXbsSHR1t2Wf37t1s2rSJ0aNH06xZMytWKyIVSWhoKGFhYeTm5gKUCbFKffXVV9jZ2bF161bWrFlDSkqKlrAXkV9VWFhItWrVANizZw/PPPMMixcv5v/+7/+4fPkys2fPJj09nd27d9OkSROSk5PJzs7GZDLh5eWFo6Ojdd+AiJRrP7xe8ff35+zZs2zcuJH58+cTFBSEwWCw9ObMycnhu+++w8bGhnr16ml2p/wpKcCSB6K4uBgfHx969uxJQEAATZo0oWfPnkRFRWEwGFiyZAmtW7fG29uboqIiKleubO2SRaQC2bBhA8OGDWPjxo0888wzP7tPcHAweXl5REdHWy4Yfy7oEhEBOHjwIAMHDiQxMZHGjRuzYsUKNmzYQEJCgmXG5vfff4+fnx/fffcdBw4c0PWLiNy11NRUjEYjHTt2BCAiIoLAwEDmz59PcHCwZb+vv/5aK7LLn56WWZL7ojQXzc3N5fr161SqVIm+ffuybds2GjVqRJ8+fYiMjMRgMGAymTh48CBbtmxReCUiv0nbtm2xtbUlOjraslAE/O+76MqVK5w4cQJXV9cy2xReicjPOXLkCN7e3vTq1YvGjRsDt5aoT0tLs4RXxcXF1KhRg1deeYUrV66QlZVlzZJFpAIym81MnDiRoUOH8vnnn2MymZg4cSJLlixh5syZLFiwgNzcXObNm8eAAQPIz89H80/kz0wBltxzpTeFmzdv5uWXX+ajjz7CZDLh5uZGYWEh9erVY/z48RiNRm7cuMGsWbNISkpi7NixCq9E5DdxcnIiKiqKLVu2MGPGDA4dOgT8bynqQYMGkZOTw4QJEyzjCq9E5OccPXqUTp06ERAQwOLFiy3jvr6+ODo6snDhQoqKiiyLPtSpUwez2UxxcbG1ShaRCspoNJKcnEzdunWZNm0au3btwmQyERAQwNtvv82MGTPo3r07ixYt4t1336VWrVq6fpE/NT1CKPfFpk2bGDBgAPPmzaNPnz40bdoUuLXc6/Lly8nPz8fJyQmz2cyhQ4eIj4+nTZs2Vq5aRCoyk8lETEwM48ePp169eri5uWE2m8nPz8dsNpOamkrlypUtzZdFRH7s9OnTPPHEE3Tr1o0PP/zQMr506VLS0tIoKSnh+PHjPPPMM0yfPp2CggLmz59PXFwcSUlJPProo1asXkTKu9If+q9evVpmIZnCwkK6du1KcXExb731Fl26dMHGxoZ9+/aRnZ1Nu3bt1FNPBAVYch/k5OTQp08fBg4cyJQpU36yPTk5mUOHDnHo0CHc3d157rnncHZ2tkKlIvJHdPjwYd577z0yMzNxcHCgTZs2jB07FhsbG4qLiy2zJkREfuzkyZMMGDCA+vXrExwcjKenJ6GhoYSEhJCSkoKjoyOvvfYaiYmJnD17lpYtW/LNN9+wY8cO/RAnIndk165dTJ8+nejo6DKrCF67do0OHTpgNpsJDw+nc+fO2NraWrFSkfJHAZbcczk5OXTo0IGIiAh69+79k+03b97Ul7GIPHCaeSUidyIrK4uJEydia2tLvXr1+OSTT4iNjbUsEFFQUEBOTg7bt2/H3t4eDw8PHn/8cStXLSLl1bVr1zAajZw/fx4HBweuXLmCi4sLzZs3Z/ny5bi6ulpWGkxPT6dt27a0aNGC8PBwvLy8rF2+SLmiHljyu/04A83NzeXq1auWflY3btywbDt69CgffvhhmTERkXvt536bUXglIneiadOmLFmyhGvXrvH+++8THBxsCa9MJhPVq1fH2dmZgIAA+vfvr/BKRH7RsWPHePHFF/Hw8KBJkya0atWKVatWkZmZyenTpxkzZgzp6ekYjbduywsKCujZsyc1atSgUaNGVq5epPxRgCW/S+lz3ElJSYSHhwPQqlUrnn76aUaOHElubi5VqlSx7L9q1Sri4+PV6FRE7is1OBWR38PFxYXIyEg6d+5MYmIiKSkpwK0gXA8viMidSEtLo2PHjtSvX5/AwEDWr1+Ps7MzgYGBBAUFkZSURE5ODmPGjOGzzz4jPz+f+Ph4GjduTGJiosJxkZ+hRwjld/v44495+eWX8fPzIyAggL/+9a+kp6czduxYMjMzWbp0KdevX7f0pUlOTqZ169bWLltERETkV5U+TlhSUsLrr7+Op6entUsSkQogNzcXX19ffH19CQ0NLTO+fv16pkyZwrhx45g/fz5eXl6cPXsWW1tbvv/+exISEtRTT+QXKMCS3+XLL7/Ex8eHBQsWMGrUqDLbTp06xd///neSkpKoXLky9vb2hIeH4+7ubqVqRURERO5OVlYWU6ZM4eLFiyxevJgOHTpYuyQRKecOHTrE0KFDWbt2LS1atMDGxsbS5yo/P5+3336buXPnkpSUhJubGzt27OD69et06tQJJycna5cvUm4pwJLfJTY2lpUrV7J161ZsbW0xGo0UFRVZ+l8BZGdnU7t2bQwGAzVr1rRitSIiIiJ3LyMjg9dff5233npLfWlE5LZWrlzJuHHjuHbtGvC/tiulvv32W9q0acP06dOZPn26tcoUqXDUA0tuy2w2/+LrM2fOkJmZaflFoaSkxBJeffHFFwA0btyYWrVqKbwSERGRCql58+asWbNG4ZWI3BFnZ2fgVqsV+GlvzscffxwnJyfOnz//wGsTqcgUYMltGY1GMjIyePXVV8nOzi7zBdy8eXNsbW1JSEjg+vXrGAwGzGYzZrOZsLAwoqOjrVi5iIiIyL1ha2tr7RJEpIJwdHSkZs2arF69muzsbMt46USAy5cv89BDD9G2bVtrlShSISnAktsqKipi6NChhIaG4uPjQ3BwMOvXrwfAz88PNzc3goKC+OSTT7h06RJ5eXnMmjWLPXv24O3tbeXqRUREREREHpzHHnuMyMhI4uPjef3110lPTwduTQwACAsL4+zZs3Tu3NmaZYpUOOqBJXfkzTffpFKlSri5uZGamkpERAS+vr707t2bF154gf79+3P8+HGysrJwdXUlOzubbdu2aQUNERERERH50zGZTLzzzjv4+/vTpEkTPD09qV+/Pt9++y3bt28nMTFR90oid0kBltyRpKQk+vTpQ2JiIh4eHpw7d47o6GhCQkLo1q0b/fr1o1KlSlSvXp3KlSvTpk0b9YkQEREREZE/tX379rFw4UIyMzOpXbs27u7uBAQE0Lx5c2uXJlLhKMCSOxYUFMS5c+d45513qFq1KoMGDeLIkSO0bduWnJwcdu/eTVhYGP7+/tYuVUREREREpFwwmUwYjUZLv+DSRwlF5O5UsnYBUnG0b9+esLAwbG1tGTVqFElJSSQmJuLq6kpmZiYJCQnqeSUiIiIiIvIDpeEV/HRFQhG5c5qBJXfFy8uLlJQU7O3t2bZtG+7u7tYuSURERERERET+4DR3Ue5Iac75yiuv4OzszLJly3B3d0f5p4iIiIiIiIjcbwqw5I6UTnVt27YtZrOZgwcPlhkXEREREREREblfFGDJXalXrx6zZ89m8eLF7N+/39rliIiIiIiIiMifgAIsuWve3t48+eSTNGjQwNqliIiIiIiIiMifgJq4y29y/fp1qlatau0yRERERERERORPQAGWiIiIiIiIiIiUa3qEUEREREREREREyjUFWCIiIiIiIiIiUq4pwBIRERERERERkXJNAZaIiIiIiIiIiJRrCrBERERERERERKRcU4AlIiIiIiIiIiLlmgIsEREREREREREp1xRgiYiIiPxGOTk5BAQE4OTkRJUqVXBwcKBXr14kJibe0fErV66kdu3a97dIERERkT+AStYuQERERKQiOnnyJJ6entSuXZs333yTVq1aUVRUREJCAhMmTCAjI8PaJd61oqIiKleubO0yRERERH5CM7BEREREfoPx48djMBjYv38/zz//PC4uLri6ujJlyhT27t0LQFhYGK1atcLOzg4HBwfGjx9PQUEBAElJSYwYMYL8/HwMBgMGg4E5c+YAcOPGDaZNm0bDhg2xs7Ojffv2JCUllfn///nPf+Lg4EC1atXo27cvYWFhP5nNFRkZSZMmTbC1taVZs2bExsaW2W4wGIiMjKR3797Y2dkxb948nJ2dWbRoUZn9Dh8+jMFg4Jtvvrl3H6CIiIjIXVCAJSIiInKXLl26RHx8PBMmTMDOzu4n20uDJKPRSEREBOnp6axatYrPPvuM4OBgADp16kR4eDg1a9bk3LlznDt3jmnTpgHg7+/Pnj17WLduHUePHqV///50796drKwsAFJTUxk7diyTJk3i8OHD+Pj4EBISUqaGf/3rX0yaNImpU6fyn//8hzFjxjBixAg+//zzMvvNmTOHvn37kpaWxsiRI3nppZeIiYkps09MTAxdunTB2dn5nnx+IiIiInfLUFJSUmLtIkREREQqkv3799O+fXvi4uLo27fvHR/30UcfMXbsWC5evAjc6oEVGBhIXl6eZZ9Tp07h5OTEqVOnaNCggWX86aefpl27drzxxhsMGjSIgoICtmzZYtn+4osvsmXLFsu5PD09cXV1JTo62rLPgAEDuHr1Klu3bgVuzcAKDAxk8eLFln3Onj1Lo0aN+OKLL2jXrh1FRUU0aNCARYsWMWzYsLv6nERERETuFc3AEhEREblLd/r7386dO3nqqado2LAhNWrUYMiQIXz33XcUFhb+4jFpaWmYTCZcXFyoXr265d+uXbs4fvw4AJmZmbRr167McT9+fezYMTw9PcuMeXp6cuzYsTJjHh4eZV43aNCAnj178t577wGwefNmbty4Qf/+/e/oPYuIiIjcD2riLiIiInKXmjZtisFg+NVG7SdPnuS5555j3LhxhISE8Mgjj5CSksLIkSO5efMm1apV+9njCgoKsLGx4eDBg9jY2JTZVr169Xv6PoCffQRy1KhRDBkyhMWLFxMTE8PAgQN/sV4RERGRB0EzsERERETu0iOPPIKvry/Lli3j6tWrP9mel5fHwYMHMZvNvPXWW3To0AEXFxfOnj1bZj9bW1tMJlOZsTZt2mAymbhw4QLOzs5l/tnb2wPQrFkzDhw4UOa4H79u0aIFqampZcZSU1Np2bLlbd9fjx49sLOzIzIykvj4eF566aXbHiMiIiJyPynAEhEREfkNli1bhslkol27dnz88cdkZWVx7NgxIiIi6NixI87OzhQVFbF06VJOnDhBbGwsUVFRZc7h6OhIQUEBiYmJXLx4kcLCQlxcXBg8eDBDhw4lLi6Ob7/9lv379xMaGmrpXRUQEMC2bdsICwsjKyuLFStWsH37dgwGg+XcQUFBrFy5ksjISLKysggLCyMuLs7SKP7X2NjYMHz4cGbMmEHTpk3p2LHjvf3wRERERO6SAiwRERGR38DJyYkvv/wSb29vpk6dipubGz4+PiQmJhIZGYm7uzthYWEsWLAANzc31qxZQ2hoaJlzdOrUibFjxzJw4EDq1q3LwoULgVur/g0dOpSpU6fSrFkz/Pz8OHDgAI0aNQJu9bKKiooiLCwMd3d34uPjmTx5MlWrVrWc28/PjyVLlrBo0SJcXV1ZsWIFMTExdO3a9Y7eX+mjjiNGjLg3H5iIiIjI76BVCEVERET+AEaPHk1GRgbJycn35HzJyck89dRTnD59mnr16t2Tc4qIiIj8VmriLiIiIlIBLVq0CB8fH+zs7Ni+fTurVq1i+fLlv/u8N27cIDc3lzlz5tC/f3+FVyIiIlIu6BFCERERkQpo//79+Pj40KpVK6KiooiIiGDUqFG/+7xr166lcePG5OXlWR5pFBEREbE2PUIoIiIiIiIiIiLlmmZgiYiIiIiIiIhIuaYAS0REREREREREyjUFWCIiIiIiIiIiUq4pwBIRERERERERkXJNAZaIiIiIiIiIiJRrCrBERERERERERKRcU4AlIiIiIiIiIiLlmgIsEREREREREREp1xRgiYiIiIiIiIhIuaYAS0REREREREREyjUFWCIiIiIiIiIiUq4pwBIRERERERERkXJNAZaIiIiIiIiIiJRrCrBERERERERERKRc+3+H3jZnvpTvPwAAAABJRU5ErkJggg==\n        \"#\n        media_type \"image/png\"\n    }\n    user_query \"What is the average_purchase_amount for each category+gender combination?\"\n  }\n}\n",
     "sql.baml": "// Defining a data model.\nclass SQLQuery {\n  query string\n}\n\n// Create a function to extract the resume from a string.\nfunction GenerateSQLQuery(user_query: string, schema: string, engine: string) -> SQLQuery {\n  client \"google-ai/gemini-2.5-flash\"\n  prompt #\"\n    Given an input question, create a syntactically correct SQL query for the {{ engine }} engine\n    to run to help find the answer. You can order the results by a relevant column to\n    return the most interesting examples in the database.\n\n    Pay attention to use only the column names that you can see in the schema description.\n    Be careful to not query for columns that do not exist. Also, pay attention to which column\n    is in which table.\n\n    Refer to the following schema to build the query:\n    {{ schema }}\n\n    An example of a record:\n    3|50|MALE|Subscription|asdfqwerty@email.com|12345678\n\n    Input question:\n    {{ user_query }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest SQLQuery {\n  functions [GenerateSQLQuery]\n  args {\n    schema #\"\n      Table: \"purchases\"\n      0|customer_id|INTEGER|1||1\n      1|age|INTEGER|0||0\n      2|gender|VARCHAR(6)|0||0\n      3|type|VARCHAR|0||0\n      4|email|VARCHAR|0||0\n      5|phone_number|VARCHAR(14)|0||0\n    \"#\n    user_query \"How many customers are 18 years or older and female?\"\n    engine \"MySQL\"\n  }\n}\n",
 }
@@ -24,6 +24,12 @@ class LlmResponseParser:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    def GeneratePlotSpec(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.PlotSpec:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GeneratePlotSpec", llm_response=llm_response, mode="request")
+        return typing.cast(types.PlotSpec, result)
+
     def GeneratePlotSummary(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> types.PlotSummary:
@@ -44,6 +50,12 @@ class LlmStreamParser:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    def GeneratePlotSpec(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.PlotSpec:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GeneratePlotSpec", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.PlotSpec, result)
+
     def GeneratePlotSummary(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> stream_types.PlotSummary:
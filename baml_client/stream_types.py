@@ -23,9 +23,18 @@ class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
     value: StreamStateValueT
     state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
 # #########################################################################
-# Generated classes (2)
+# Generated classes (3)
 # #########################################################################
 
+class PlotSpec(BaseModel):
+    chart_type: typing.Optional[types.ChartType] = None
+    x: typing.Optional[str] = None
+    y: typing.Optional[str] = None
+    hue: typing.Optional[str] = None
+    title: typing.Optional[str] = None
+    x_label: typing.Optional[str] = None
+    y_label: typing.Optional[str] = None
+
 class PlotSummary(BaseModel):
     summary: typing.Optional[str] = None
     caption: typing.Optional[str] = None
@@ -91,6 +91,20 @@ class BamlSyncClient:
     def parse_stream(self):
       return self.__llm_stream_parser
     
+    def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> types.PlotSpec:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            stream = self.stream.GeneratePlotSpec(user_query=user_query,data_columns=data_columns,data_head=data_head,data_note=data_note,
+                baml_options=baml_options)
+            return stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = self.__options.merge_options(baml_options).call_function_sync(function_name="GeneratePlotSpec", args={
+                "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+            })
+            return typing.cast(types.PlotSpec, result.cast_to(types, types, stream_types, False, __runtime__))
     def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> types.PlotSummary:
@@ -128,6 +142,18 @@ class BamlStreamClient:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.PlotSpec, types.PlotSpec]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="GeneratePlotSpec", args={
+            "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+        })
+        return baml_py.BamlSyncStream[stream_types.PlotSpec, types.PlotSpec](
+          result,
+          lambda x: typing.cast(stream_types.PlotSpec, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.PlotSpec, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
     def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[stream_types.PlotSummary, types.PlotSummary]:
@@ -160,6 +186,13 @@ class BamlHttpRequestClient:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="GeneratePlotSpec", args={
+            "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+        }, mode="request")
+        return result
     def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -182,6 +215,13 @@ class BamlHttpStreamRequestClient:
     def __init__(self, options: DoNotUseDirectlyCallManager):
         self.__options = options
 
+    def GeneratePlotSpec(self, user_query: str,data_columns: str,data_head: str,data_note: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="GeneratePlotSpec", args={
+            "user_query": user_query,"data_columns": data_columns,"data_head": data_head,"data_note": data_note,
+        }, mode="stream")
+        return result
     def GeneratePlotSummary(self, image: baml_py.Image,user_query: str,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -20,20 +20,28 @@ from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIM
 class TypeBuilder(type_builder.TypeBuilder):
     def __init__(self):
         super().__init__(classes=set(
-          ["PlotSummary","SQLQuery",]
+          ["PlotSpec","PlotSummary","SQLQuery",]
         ), enums=set(
-          []
+          ["ChartType",]
         ), runtime=DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME)
 
     # #########################################################################
-    # Generated enums 0
+    # Generated enums 1
     # #########################################################################
 
+    @property
+    def ChartType(self) -> "ChartTypeViewer":
+        return ChartTypeViewer(self)
+
 
     # #########################################################################
-    # Generated classes 2
+    # Generated classes 3
     # #########################################################################
 
+    @property
+    def PlotSpec(self) -> "PlotSpecViewer":
+        return PlotSpecViewer(self)
+
     @property
     def PlotSummary(self) -> "PlotSummaryViewer":
         return PlotSummaryViewer(self)
@@ -45,14 +53,139 @@ class TypeBuilder(type_builder.TypeBuilder):
 
 
 # #########################################################################
-# Generated enums 0
+# Generated enums 1
 # #########################################################################
 
+class ChartTypeAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.enum("ChartType")
+        self._values: typing.Set[str] = set([  "BAR",  "LINE",  "SCATTER",  "BOX",  "HISTOGRAM",  "PIE",  "UNSUPPORTED",  ])
+        self._vals = ChartTypeValues(self._bldr, self._values)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def values(self) -> "ChartTypeValues":
+        return self._vals
+
+
+class ChartTypeViewer(ChartTypeAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_values(self) -> typing.List[typing.Tuple[str, type_builder.EnumValueViewer]]:
+        return [(name, type_builder.EnumValueViewer(self._bldr.value(name))) for name in self._values]
+    
+
+class ChartTypeValues:
+    def __init__(self, enum_bldr: baml_py.EnumBuilder, values: typing.Set[str]):
+        self.__bldr = enum_bldr
+        self.__values = values # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def BAR(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("BAR"))
+    
+    @property
+    def LINE(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("LINE"))
+    
+    @property
+    def SCATTER(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("SCATTER"))
+    
+    @property
+    def BOX(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("BOX"))
+    
+    @property
+    def HISTOGRAM(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("HISTOGRAM"))
+    
+    @property
+    def PIE(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("PIE"))
+    
+    @property
+    def UNSUPPORTED(self) -> type_builder.EnumValueViewer:
+        return type_builder.EnumValueViewer(self.__bldr.value("UNSUPPORTED"))
+    
+    
+
+
 
 # #########################################################################
-# Generated classes 2
+# Generated classes 3
 # #########################################################################
 
+class PlotSpecAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("PlotSpec")
+        self._properties: typing.Set[str] = set([  "chart_type",  "x",  "y",  "hue",  "title",  "x_label",  "y_label",  ])
+        self._props = PlotSpecProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "PlotSpecProperties":
+        return self._props
+
+
+class PlotSpecViewer(PlotSpecAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class PlotSpecProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def chart_type(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("chart_type"))
+    
+    @property
+    def x(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("x"))
+    
+    @property
+    def y(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("y"))
+    
+    @property
+    def hue(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("hue"))
+    
+    @property
+    def title(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("title"))
+    
+    @property
+    def x_label(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("x_label"))
+    
+    @property
+    def y_label(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("y_label"))
+    
+    
+
+
 class PlotSummaryAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
@@ -16,6 +16,9 @@ from . import stream_types
 
 type_map = {
 
+    "types.PlotSpec": types.PlotSpec,
+    "stream_types.PlotSpec": stream_types.PlotSpec,
+
     "types.PlotSummary": types.PlotSummary,
     "stream_types.PlotSummary": stream_types.PlotSummary,
 
@@ -23,4 +26,6 @@ type_map = {
     "stream_types.SQLQuery": stream_types.SQLQuery,
 
 
+    "types.ChartType": types.ChartType,
+
 }
\ No newline at end of file
@@ -37,13 +37,31 @@ def get_checks(checks: typing.Dict[CheckName, Check]) -> typing.List[Check]:
 def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
     return all(check.status == "succeeded" for check in get_checks(checks))
 # #########################################################################
-# Generated enums (0)
+# Generated enums (1)
 # #########################################################################
 
+class ChartType(str, Enum):
+    BAR = "BAR"
+    LINE = "LINE"
+    SCATTER = "SCATTER"
+    BOX = "BOX"
+    HISTOGRAM = "HISTOGRAM"
+    PIE = "PIE"
+    UNSUPPORTED = "UNSUPPORTED"
+
 # #########################################################################
-# Generated classes (2)
+# Generated classes (3)
 # #########################################################################
 
+class PlotSpec(BaseModel):
+    chart_type: ChartType
+    x: typing.Optional[str] = None
+    y: typing.Optional[str] = None
+    hue: typing.Optional[str] = None
+    title: str
+    x_label: typing.Optional[str] = None
+    y_label: typing.Optional[str] = None
+
 class PlotSummary(BaseModel):
     summary: str
     caption: str
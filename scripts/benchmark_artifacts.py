@@ -0,0 +1,68 @@
+import tempfile
+
+from pathlib import Path
+
+import click
+
+from benchmark_fetch import best_of, scale_database
+from src.tools import engine_registry, load_artifact, save_artifact
+from src.tools.artifacts import FeatherFormat, PickleFormat
+from src.tools.tools import execute_sql
+
+FORMATS = {
+    "pickle": PickleFormat(),
+    "feather": FeatherFormat("uncompressed"),
+    "feather lz4": FeatherFormat("lz4"),
+    "feather zstd": FeatherFormat("zstd"),
+}
+
+
+@click.command()
+@click.option(
+    "--db_file",
+    default="data/database.db",
+    show_default=True,
+    help="Database created with scripts/create_db.py.",
+)
+@click.option(
+    "--sizes",
+    default="10000,100000,1000000",
+    show_default=True,
+    help="Comma separated result sizes in rows.",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    help="Runs per format, the best one is reported.",
+)
+def benchmark_artifacts(db_file: str, sizes: str, repeat: int):
+    """Compares write/read times and file sizes of the data artifact formats"""
+    query = "SELECT * FROM purchases"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in [int(size) for size in sizes.split(",")]:
+            database = Path(tmp_dir) / f"purchases_{rows}.db"
+            scale_database(Path(db_file), database, rows)
+            data = execute_sql(query, max_rows=rows, max_bytes=2**62, url=str(database))
+            engine_registry.dispose()
+            database.unlink()
+
+            print(f"{len(data)} rows")
+            for name, artifact_format in FORMATS.items():
+                stem = Path(tmp_dir) / f"data_{name.replace(' ', '_')}"
+                write_time, path = best_of(
+                    repeat, lambda: save_artifact(data, stem, artifact_format)
+                )
+                read_time, loaded = best_of(repeat, lambda: load_artifact(path))
+                assert loaded.equals(data)
+                print(
+                    f"    {name:<13} | write: {write_time * 1000:>8.1f}ms | "
+                    f"read: {read_time * 1000:>8.1f}ms | "
+                    f"size: {path.stat().st_size / 2**20:>7.1f}MB"
+                )
+                path.unlink()
+
+
+if __name__ == "__main__":
+    benchmark_artifacts()
@@ -0,0 +1,91 @@
+import sqlite3
+import tempfile
+
+from pathlib import Path
+
+import click
+import duckdb
+from pandas import read_sql_query
+
+from benchmark_fetch import best_of, scale_database
+from src.tools import engine_registry
+from src.tools.tools import execute_sql
+
+# typical queries generated for the plots, aggregates over the whole table
+QUERIES = [
+    "SELECT category, COUNT(*) AS purchases FROM purchases GROUP BY category",
+    "SELECT gender, season, AVG(purchase_amount) AS average_amount "
+    "FROM purchases GROUP BY gender, season",
+    "SELECT location, SUM(purchase_amount) AS total_amount FROM purchases "
+    "GROUP BY location ORDER BY total_amount DESC LIMIT 10",
+    "SELECT age, AVG(review_rating) AS rating, SUM(previous_purchases) AS previous "
+    "FROM purchases WHERE purchase_amount > 50 GROUP BY age ORDER BY age",
+]
+
+
+def copy_to_duckdb(source: Path, target: Path, chunk_size: int = 500_000):
+    """Copies the purchases table of the sqlite database `source` into a duckdb file"""
+    with sqlite3.connect(source) as conn, duckdb.connect(str(target)) as database:
+        chunks = read_sql_query("SELECT * FROM purchases", conn, chunksize=chunk_size)
+        for index, chunk in enumerate(chunks):
+            if index == 0:
+                database.execute("CREATE TABLE purchases AS SELECT * FROM chunk")
+            else:
+                database.execute("INSERT INTO purchases SELECT * FROM chunk")
+
+
+@click.command()
+@click.option(
+    "--db_file",
+    default="data/database.db",
+    show_default=True,
+    help="Database created with scripts/create_db.py.",
+)
+@click.option(
+    "--sizes",
+    default="100000,1000000,5000000",
+    show_default=True,
+    help="Comma separated table sizes in rows.",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    help="Runs per query, the best one is reported.",
+)
+def benchmark_backends(db_file: str, sizes: str, repeat: int):
+    """Compares the group-by workload on the sqlite and DuckDB backends"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in [int(size) for size in sizes.split(",")]:
+            database = Path(tmp_dir) / f"purchases_{rows}.db"
+            duckdb_file = Path(tmp_dir) / f"purchases_{rows}.duckdb"
+            scale_database(Path(db_file), database, rows)
+            copy_to_duckdb(database, duckdb_file)
+
+            print(f"{rows} rows")
+            sqlite_total = 0.0
+            duckdb_total = 0.0
+            for query in QUERIES:
+                sqlite_time, _ = best_of(
+                    repeat, lambda: execute_sql(query, url=str(database))
+                )
+                duckdb_time, _ = best_of(
+                    repeat, lambda: execute_sql(query, url=f"duckdb:///{duckdb_file}")
+                )
+                sqlite_total += sqlite_time
+                duckdb_total += duckdb_time
+                print(
+                    f"    sqlite: {sqlite_time * 1000:>9.1f}ms | "
+                    f"duckdb: {duckdb_time * 1000:>9.1f}ms | "
+                    f"speedup: {sqlite_time / duckdb_time:>6.1f}x | {query}"
+                )
+            print(
+                f"    total sqlite: {sqlite_total * 1000:.1f}ms, "
+                f"duckdb: {duckdb_total * 1000:.1f}ms, "
+                f"speedup: {sqlite_total / duckdb_total:.1f}x"
+            )
+            engine_registry.dispose()
+
+
+if __name__ == "__main__":
+    benchmark_backends()
@@ -0,0 +1,103 @@
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from pathlib import Path
+
+import click
+from pandas import DataFrame
+from sqlalchemy import create_engine, text
+
+from src.tools import engine_registry
+from src.tools.tools import execute_sql
+
+
+def scale_database(source: Path, target: Path, rows: int):
+    """Copies the purchases table of `source` into `target` until it has `rows` rows"""
+    shutil.copy(source, target)
+    with sqlite3.connect(target) as conn:
+        base = conn.execute(
+            "SELECT COUNT(*), MAX(customer_id) FROM purchases"
+        ).fetchone()
+        count, max_id = base
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(purchases)")]
+        others = ", ".join(columns[1:])
+        # grow by doubling with shifted ids
+        while count < rows:
+            conn.execute(
+                f"INSERT INTO purchases (customer_id, {others}) "
+                f"SELECT customer_id + {count}, {others} FROM purchases "
+                f"LIMIT {min(count, rows - count)}"
+            )
+            count = conn.execute("SELECT COUNT(*) FROM purchases").fetchone()[0]
+        conn.commit()
+    return max_id
+
+
+def fetch_rows(database: Path, query: str) -> DataFrame:
+    """Previous implementation of `run_sql`: SQLAlchemy rows into a DataFrame"""
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.connect() as conn:
+        result = conn.execute(text(query))
+        columns = list(result.keys())
+        data = result.fetchall()
+        return DataFrame(data, columns=columns)
+
+
+def best_of(repeat: int, func) -> tuple[float, DataFrame]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), data
+
+
+@click.command()
+@click.option(
+    "--db_file",
+    default="data/database.db",
+    show_default=True,
+    help="Database created with scripts/create_db.py.",
+)
+@click.option(
+    "--sizes",
+    default="10000,100000,1000000",
+    show_default=True,
+    help="Comma separated result sizes in rows, e.g. add 10000000.",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    help="Runs per size, the best one is reported.",
+)
+def benchmark_fetch(db_file: str, sizes: str, repeat: int):
+    """Compares rows/sec of the typed columnar fetch against SQLAlchemy rows"""
+    query = "SELECT * FROM purchases"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in [int(size) for size in sizes.split(",")]:
+            database = Path(tmp_dir) / f"purchases_{rows}.db"
+            scale_database(Path(db_file), database, rows)
+
+            rows_time, _ = best_of(repeat, lambda: fetch_rows(database, query))
+            typed_time, data = best_of(
+                repeat,
+                lambda: execute_sql(
+                    query, max_rows=rows, max_bytes=2**62, url=str(database)
+                ),
+            )
+            print(
+                f"{len(data):>10} rows | "
+                f"rows: {len(data) / rows_time:>12,.0f} rows/s | "
+                f"typed: {len(data) / typed_time:>12,.0f} rows/s | "
+                f"speedup: {rows_time / typed_time:.2f}x"
+            )
+            engine_registry.dispose()
+            database.unlink()
+
+
+if __name__ == "__main__":
+    benchmark_fetch()
@@ -0,0 +1,101 @@
+import tempfile
+
+from pathlib import Path
+
+import click
+
+from benchmark_fetch import best_of
+from create_db import create_db
+from src.tools import engine_registry
+from src.tools.dictionary import route_dictionary_query
+from src.tools.tools import execute_sql
+
+# group-bys and filters on the dictionary encoded columns
+QUERIES = [
+    "SELECT category, COUNT(*) AS purchases FROM purchases GROUP BY category",
+    "SELECT gender, season, AVG(purchase_amount) AS average_amount "
+    "FROM purchases GROUP BY gender, season",
+    "SELECT location, SUM(purchase_amount) AS total_amount FROM purchases "
+    "GROUP BY location ORDER BY total_amount DESC LIMIT 10",
+    "SELECT item_purchased, COUNT(*) AS purchases FROM purchases "
+    "WHERE season = 'Winter' GROUP BY item_purchased",
+    "SELECT COUNT(*) AS purchases FROM purchases WHERE color IN ('Red', 'Blue')",
+    "SELECT age, AVG(review_rating) AS rating FROM purchases "
+    "WHERE purchase_amount > 50 GROUP BY age ORDER BY age",
+]
+
+
+@click.command()
+@click.option(
+    "--data_file",
+    required=True,
+    help="Path to the csv data file, large enough to measure e.g. 1M+ rows.",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    help="Runs per query, the best one is reported.",
+)
+def benchmark_layouts(data_file: str, repeat: int):
+    """Compares the size and group-by times of the wide and dictionary layouts"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        databases = {}
+        for layout in ("wide", "dictionary"):
+            create_db.main(
+                [
+                    "--data_file",
+                    data_file,
+                    "--db_path",
+                    tmp_dir,
+                    "--db_name",
+                    layout,
+                    "--layout",
+                    layout,
+                ],
+                standalone_mode=False,
+            )
+            databases[layout] = str(Path(tmp_dir) / f"{layout}.db")
+
+        wide_size = Path(databases["wide"]).stat().st_size
+        dictionary_size = Path(databases["dictionary"]).stat().st_size
+        print(
+            f"size wide: {wide_size / 2**20:.1f}MB | "
+            f"dictionary: {dictionary_size / 2**20:.1f}MB | "
+            f"ratio: {wide_size / dictionary_size:.2f}x"
+        )
+
+        totals = {"wide": 0.0, "view": 0.0, "dictionary": 0.0}
+        for query in QUERIES:
+            routed = route_dictionary_query(query, databases["dictionary"])
+            timings = {
+                "wide": best_of(
+                    repeat, lambda: execute_sql(query, url=databases["wide"])
+                )[0],
+                # the view, as queried without the rewrite
+                "view": best_of(
+                    repeat, lambda: execute_sql(query, url=databases["dictionary"])
+                )[0],
+                "dictionary": best_of(
+                    repeat, lambda: execute_sql(routed, url=databases["dictionary"])
+                )[0],
+            }
+            for layout, timing in timings.items():
+                totals[layout] += timing
+            print(
+                f"    wide: {timings['wide'] * 1000:>8.1f}ms | "
+                f"view: {timings['view'] * 1000:>8.1f}ms | "
+                f"dictionary: {timings['dictionary'] * 1000:>8.1f}ms | "
+                f"speedup: {timings['wide'] / timings['dictionary']:>5.2f}x | {query}"
+            )
+        print(
+            f"    total wide: {totals['wide'] * 1000:.1f}ms, "
+            f"view: {totals['view'] * 1000:.1f}ms, "
+            f"dictionary: {totals['dictionary'] * 1000:.1f}ms, "
+            f"speedup: {totals['wide'] / totals['dictionary']:.2f}x"
+        )
+        engine_registry.dispose()
+
+
+if __name__ == "__main__":
+    benchmark_layouts()
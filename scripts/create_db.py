@@ -1,20 +1,540 @@
 from pathlib import Path
 import click
 import csv
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing, contextmanager, nullcontext
+from io import BytesIO
 from enum import Enum as PyEnum
+from itertools import combinations
+from typing import Iterator
+from pandas import DataFrame, read_csv
 from sqlalchemy import (
     Boolean,
     Column,
+    Connection,
     create_engine,
     Enum,
     Float,
-    insert,
     Integer,
     MetaData,
     String,
     Table,
+    text,
 )
 
+TABLE_NAME = "purchases"
+# bookkeeping of the incremental loads, skipped by the schema given to the LLM
+CHUNKS_TABLE = "meta__ingest_chunks"
+DATASET_TABLE = "meta__dataset"
+# dictionary layout: the rows are stored in FACT_TABLE with the text columns of
+# DICTIONARY_COLUMNS replaced by integer codes into one `dim__<column>` table each,
+# and the `purchases` view decodes them under the original column names
+FACT_TABLE = f"fact__{TABLE_NAME}"
+DIMENSION_PREFIX = "dim__"
+DICTIONARY_COLUMNS = [
+    "gender",
+    "item_purchased",
+    "category",
+    "location",
+    "size",
+    "color",
+    "season",
+    "shipping_type",
+    "payment_method",
+    "frequency_of_purchases",
+]
+STAGING_TABLE = f"staging__{TABLE_NAME}"
+
+# applied while creating a database only: no rollback journal nor fsync, the load
+# writes to a temporary file that is deleted when it fails, see `written_atomically`
+BULK_LOAD_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "cache_size": "-262144",
+    "temp_store": "MEMORY",
+    "locking_mode": "EXCLUSIVE",
+    # enum values are already validated by `coerce_frame`, the CHECK constraints would
+    # make every insert several times slower
+    "ignore_check_constraints": "ON",
+}
+# incremental loads write to a live database, keeping the journal so a failed load
+# is rolled back, and the locking
+INCREMENTAL_LOAD_PRAGMAS = {
+    "synchronous": "NORMAL",
+    "cache_size": "-262144",
+    "temp_store": "MEMORY",
+    "ignore_check_constraints": "ON",
+}
+
+
+class Gender(PyEnum):
+    FEMALE = "female"
+    MALE = "male"
+
+
+class ShippingType(PyEnum):
+    TWO_DAY_SHIPPING = "2_day_shipping"
+    EXPRESS = "express"
+    FREE_SHIPPING = "free_shipping"
+    NEXT_DAY_AIR = "next_day_air"
+    STANDARD = "standard"
+    STORE_PICKUP = "store_pickup"
+
+
+class PaymentMethod(PyEnum):
+    BANK_TRANSFER = "bank_transfer"
+    CASH = "cash"
+    CREDIT_CARD = "credit_card"
+    DEBIT_CARD = "debit_card"
+    PAYPAL = "paypal"
+    VENMO = "venmo"
+
+
+class FrequencyOfPurchases(PyEnum):
+    ANNUALLY = "annually"
+    BI_WEEKLY = "bi_weekly"
+    MONTHLY = "monthly"
+    EVERY_3_MONTHS = "every_3_months"
+    FORTNIGHTLY = "fortnightly"
+    QUARTERLY = "quarterly"
+    WEEKLY = "weekly"
+
+
+def normalize_string(string):
+    return string.lower().replace(" ", "_").replace("-", "_")
+
+
+def define_metadata_tables(metadata_obj: MetaData):
+    # checksums of the csv chunks already loaded
+    Table(
+        CHUNKS_TABLE,
+        metadata_obj,
+        Column("checksum", String, primary_key=True),
+        Column("rows", Integer, nullable=False),
+        Column("loaded_at", Float, nullable=False),
+    )
+    # `version` is bumped by every load that changed rows
+    Table(
+        DATASET_TABLE,
+        metadata_obj,
+        Column("key", String, primary_key=True),
+        Column("value", Integer, nullable=False),
+    )
+
+
+def define_columns() -> list[Column]:
+    return [
+        Column("customer_id", Integer, primary_key=True),
+        Column("age", Integer),
+        Column("gender", Enum(Gender, create_constraint=True)),
+        Column("item_purchased", String, nullable=False),
+        Column("category", String),
+        Column("purchase_amount", Integer),
+        Column("location", String),
+        Column("size", String(1)),
+        Column("color", String),
+        Column("season", String),
+        Column("review_rating", Float),
+        Column("subscription_status", Boolean),
+        Column("shipping_type", Enum(ShippingType, create_constraint=True)),
+        Column("discount_applied", Boolean),
+        Column("promo_code_used", Boolean),
+        Column("previous_purchases", Integer),
+        Column("payment_method", Enum(PaymentMethod, create_constraint=True)),
+        Column(
+            "frequency_of_purchases", Enum(FrequencyOfPurchases, create_constraint=True)
+        ),
+    ]
+
+
+def define_table(metadata_obj: MetaData) -> Table:
+    return Table(TABLE_NAME, metadata_obj, *define_columns())
+
+
+def define_dictionary_tables(metadata_obj: MetaData) -> tuple[Table, dict[str, Table]]:
+    """Defines the fact table and the dimension table of every dictionary column"""
+    columns = []
+    dimensions = {}
+    for column in define_columns():
+        if column.name not in DICTIONARY_COLUMNS:
+            columns.append(column)
+            continue
+        # the values keep the type, and so the enum CHECK, of the original column
+        dimensions[column.name] = Table(
+            f"{DIMENSION_PREFIX}{column.name}",
+            metadata_obj,
+            Column("id", Integer, primary_key=True),
+            Column("value", column.type, nullable=False, unique=True),
+        )
+        columns.append(Column(column.name, Integer, nullable=column.nullable))
+    return Table(FACT_TABLE, metadata_obj, *columns), dimensions
+
+
+def view_statement(fact: Table, dimensions: dict[str, Table]) -> str:
+    """View presenting the fact table with the dimension values as `purchases`.
+
+    The values are looked up by scalar subqueries rather than joins: sqlite only
+    evaluates the ones of the columns a query uses, while it keeps every LEFT JOIN
+    of an aggregate query.
+    """
+    select = []
+    for column in fact.columns:
+        if column.name in dimensions:
+            select.append(
+                f"(SELECT value FROM {dimensions[column.name].name} "
+                f"WHERE id = {fact.name}.{column.name}) AS {column.name}"
+            )
+        else:
+            select.append(f"{fact.name}.{column.name} AS {column.name}")
+    return (
+        f"CREATE VIEW IF NOT EXISTS {TABLE_NAME} AS SELECT {', '.join(select)} "
+        f"FROM {fact.name}"
+    )
+
+
+def encode_statements(
+    fact: Table, dimensions: dict[str, Table], mode: str
+) -> list[str]:
+    """Moves the rows of the staging table into the dimension tables and the fact table"""
+    statements = [
+        f"INSERT OR IGNORE INTO {dimension.name} (value) "
+        f"SELECT DISTINCT {column} FROM temp.{STAGING_TABLE} "
+        f"WHERE {column} IS NOT NULL"
+        for column, dimension in dimensions.items()
+    ]
+    select = [
+        (
+            f"(SELECT id FROM {dimensions[column.name].name} "
+            f"WHERE value = {STAGING_TABLE}.{column.name})"
+            if column.name in dimensions
+            else column.name
+        )
+        for column in fact.columns
+    ]
+    # WHERE true tells the parser that ON CONFLICT isn't a join constraint
+    statements.append(
+        insert_statement(
+            fact,
+            mode,
+            f"SELECT {', '.join(select)} FROM temp.{STAGING_TABLE} WHERE true",
+        )
+    )
+    statements.append(f"DELETE FROM temp.{STAGING_TABLE}")
+    return statements
+
+
+# csv columns converted from their values to the enum member names
+ENUM_COLUMNS = {
+    "gender": Gender,
+    "shipping_type": ShippingType,
+    "payment_method": PaymentMethod,
+    "frequency_of_purchases": FrequencyOfPurchases,
+}
+# csv columns with Yes/No values
+BOOLEAN_COLUMNS = ["subscription_status", "discount_applied", "promo_code_used"]
+CSV_DTYPES = {
+    "customer_id": "int64",
+    "age": "int64",
+    "purchase_amount": "int64",
+    "review_rating": "float64",
+    "previous_purchases": "int64",
+}
+
+
+def coerce_frame(frame: DataFrame, columns: list[str]) -> list[tuple]:
+    """Converts parsed csv rows to the values stored by SQLAlchemy: enum names and booleans"""
+    for column, enum in ENUM_COLUMNS.items():
+        names = (
+            frame[column]
+            .str.lower()
+            .str.replace(" ", "_")
+            .str.replace("-", "_")
+            .map({member.value: member.name for member in enum})
+        )
+        if names.isna().any():
+            invalid = frame.loc[names.isna(), column].iloc[0]
+            raise ValueError(f"{invalid!r} is not a valid {enum.__name__}")
+        frame[column] = names
+    for column in BOOLEAN_COLUMNS:
+        frame[column] = frame[column] == "Yes"
+    # python values, sqlite3 can't bind numpy scalars
+    return list(zip(*(frame[column].tolist() for column in columns)))
+
+
+def split_ranges(data_file: str, batch_size: int) -> list[tuple[int, int]]:
+    """Splits the rows of the csv in byte ranges of about `batch_size` rows each.
+
+    Boundaries are defined by the content: a range ends after a row whose hash is a
+    multiple of `batch_size`, and has between a quarter and 4 times `batch_size`
+    rows. Editing, inserting or appending rows only changes the ranges around them,
+    the others keep their checksum and are skipped by incremental loads. Quoted
+    values can't contain line breaks.
+    """
+    min_rows = max(batch_size // 4, 1)
+    max_rows = 4 * batch_size
+    with open(data_file, mode="rb") as file:
+        start = end = len(file.readline())
+        rows = 0
+        ranges = []
+        for line in file:
+            end += len(line)
+            rows += 1
+            if rows >= max_rows or (
+                rows >= min_rows and zlib.crc32(line) % batch_size == 0
+            ):
+                ranges.append((start, end))
+                start = end
+                rows = 0
+        if end > start:
+            ranges.append((start, end))
+    return ranges
+
+
+def read_range(
+    data_file: str, header: list[str], columns: list[str], start: int, end: int
+) -> list[tuple]:
+    """Parses and coerces the rows of a byte range of the csv into `columns` order.
+
+    Run by the worker processes.
+    """
+    with open(data_file, mode="rb") as file:
+        file.seek(start)
+        raw = file.read(end - start)
+    frame = read_csv(
+        BytesIO(raw),
+        header=None,
+        names=header,
+        dtype=CSV_DTYPES,
+        # empty strings are kept as is, like the csv module does
+        keep_default_na=False,
+    )
+    return coerce_frame(frame, columns)
+
+
+def range_checksum(data_file: str, start: int, end: int) -> str:
+    with open(data_file, mode="rb") as file:
+        file.seek(start)
+        return hashlib.blake2b(file.read(end - start), digest_size=16).hexdigest()
+
+
+def read_batches(
+    data_file: str, columns: list[str], ranges: list[tuple[int, int]], workers: int
+) -> Iterator[list[tuple]]:
+    """Streams the byte `ranges` of the csv as batches of rows of `columns`, in order.
+
+    Batches are parsed by a pool of `workers` processes, at most two batches per
+    worker are in flight so memory stays bounded when the writer is slower.
+    """
+    with open(data_file, mode="r", newline="") as file:
+        header = next(csv.reader(file))
+
+    if workers <= 1:
+        for start, end in ranges:
+            yield read_range(data_file, header, columns, start, end)
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for start, end in ranges:
+            pending.append(
+                executor.submit(read_range, data_file, header, columns, start, end)
+            )
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+@contextmanager
+def bulk_load_pragmas(
+    conn: sqlite3.Connection, pragmas: dict[str, str] = BULK_LOAD_PRAGMAS
+) -> Iterator[None]:
+    """Applies `pragmas` and restores the previous values afterwards"""
+    previous = {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in pragmas}
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        # the exclusive lock is only released by the next access
+        conn.execute(f"SELECT 1 FROM {TABLE_NAME} LIMIT 1").fetchall()
+
+
+@contextmanager
+def written_atomically(path: Path) -> Iterator[Path]:
+    """Temporary file renamed to `path` when the block succeeds, deleted otherwise.
+
+    A failed or interrupted load never leaves a half-written `path` behind.
+    """
+    partial = path.with_name(f".{path.name}.partial")
+    journal = partial.with_name(f"{partial.name}-journal")
+    # left by a killed load
+    partial.unlink(missing_ok=True)
+    journal.unlink(missing_ok=True)
+    try:
+        yield partial
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        journal.unlink(missing_ok=True)
+        raise
+    os.replace(partial, path)
+
+
+def insert_statement(table: Table, mode: str, select: str = "") -> str:
+    """INSERT of every column: plain, skipping existing rows or updating them.
+
+    The rows are the parameters of the statement, or the result of `select`.
+    """
+    columns = [column.name for column in table.columns]
+    rows = select or f"VALUES ({', '.join('?' * len(columns))})"
+    statement = f"INSERT INTO {table.name} ({', '.join(columns)}) {rows}"
+    if mode == "append":
+        statement += " ON CONFLICT DO NOTHING"
+    elif mode == "upsert":
+        key = [column.name for column in table.primary_key.columns]
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column not in key
+        )
+        statement += f" ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates}"
+    return statement
+
+
+def loaded_checksums(conn: sqlite3.Connection) -> set[str]:
+    return {row[0] for row in conn.execute(f"SELECT checksum FROM {CHUNKS_TABLE}")}
+
+
+def bulk_load(
+    conn: sqlite3.Connection,
+    statement: str,
+    batches: Iterator[tuple[str, list[tuple]]],
+    after_batch: list[str] | None = None,
+) -> int:
+    """Inserts every (checksum, batch) with `executemany` in a single transaction.
+
+    The statements of `after_batch` run after every batch. The checksums are recorded
+    with the rows and the dataset version is bumped when any row was loaded. Returns
+    the row count.
+    """
+    rows = 0
+    conn.execute("BEGIN")
+    try:
+        for checksum, batch in batches:
+            conn.executemany(statement, batch)
+            for after in after_batch or []:
+                conn.execute(after)
+            conn.execute(
+                f"INSERT OR REPLACE INTO {CHUNKS_TABLE} (checksum, rows, loaded_at) "
+                "VALUES (?, ?, ?)",
+                (checksum, len(batch), time.time()),
+            )
+            rows += len(batch)
+        if rows:
+            conn.execute(
+                f"INSERT INTO {DATASET_TABLE} (key, value) VALUES ('version', 1) "
+                "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+            )
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return rows
+
+
+def dataset_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute(
+        f"SELECT value FROM {DATASET_TABLE} WHERE key = 'version'"
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def index_name(columns: list[str], table_name: str = TABLE_NAME) -> str:
+    return f"idx_{table_name}_{'_'.join(columns)}"
+
+
+def index_statement(columns: list[str], table_name: str = TABLE_NAME) -> str:
+    name = index_name(columns, table_name)
+    return f"CREATE INDEX IF NOT EXISTS {name} ON {table_name} ({', '.join(columns)})"
+
+
+def database_layout(conn: sqlite3.Connection) -> str:
+    """Storage layout of an existing database"""
+    fact = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FACT_TABLE,)
+    ).fetchone()
+    return "dictionary" if fact else "wide"
+
+
+# low cardinality columns that questions usually group by
+CUBE_DIMENSIONS = [
+    "gender",
+    "category",
+    "season",
+    "shipping_type",
+    "payment_method",
+    "frequency_of_purchases",
+    "size",
+    "subscription_status",
+]
+CUBE_MEASURES = ["purchase_amount", "review_rating", "previous_purchases"]
+
+
+def existing_cubes(conn: Connection) -> list[list[str]]:
+    """Dimensions of the cube tables of the database"""
+    tables = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'table'")
+    ).scalars()
+    return [
+        table[len("cube__") :].split("__")
+        for table in tables
+        if table.startswith("cube__")
+    ]
+
+
+def build_cubes(
+    conn: Connection,
+    table_name: str,
+    max_dimensions: int,
+    extra: list[list[str]] | None = None,
+):
+    """Materializes the aggregates of every combination of up to `max_dimensions` dimensions.
+
+    The tables are named `cube__<dimension>__<dimension>` and read by the query router
+    in `src/tools/cube.py`. The cubes of `extra` are rebuilt too.
+    """
+    aggregates = ["COUNT(*) AS row_count"]
+    for measure in CUBE_MEASURES:
+        aggregates += [
+            f"SUM({measure}) AS sum_{measure}",
+            f"COUNT({measure}) AS count_{measure}",
+            f"MIN({measure}) AS min_{measure}",
+            f"MAX({measure}) AS max_{measure}",
+        ]
+
+    cubes = [
+        list(dimensions)
+        for size in range(1, max_dimensions + 1)
+        for dimensions in combinations(CUBE_DIMENSIONS, size)
+    ]
+    cubes += [dimensions for dimensions in extra or [] if dimensions not in cubes]
+    for dimensions in cubes:
+        cube_name = "cube__" + "__".join(dimensions)
+        conn.execute(text(f"DROP TABLE IF EXISTS {cube_name}"))
+        conn.execute(
+            text(
+                f"CREATE TABLE {cube_name} AS "
+                f"SELECT {', '.join(dimensions)}, {', '.join(aggregates)} "
+                f"FROM {table_name} GROUP BY {', '.join(dimensions)}"
+            )
+        )
+
 
 @click.command()
 @click.option(
@@ -34,102 +554,192 @@ from sqlalchemy import (
     show_default=True,
     help="Folder location of the sqlite database.",
 )
-def create_db(data_file: str, db_name: str, db_path: str):
+@click.option(
+    "--cube_dimensions",
+    default=0,
+    show_default=True,
+    help="Build aggregate tables for every combination of up to this many dimensions.",
+)
+@click.option(
+    "--batch_size",
+    default=50000,
+    show_default=True,
+    help="Rows read from the csv and inserted at a time.",
+)
+@click.option(
+    "--workers",
+    default=os.cpu_count(),
+    show_default="number of CPUs",
+    help="Processes parsing the csv.",
+)
+@click.option(
+    "--index",
+    "indexes",
+    multiple=True,
+    help="Comma separated columns of an index built after the load, can be repeated.",
+)
+@click.option(
+    "--mode",
+    type=click.Choice(["create", "append", "upsert"]),
+    default="create",
+    show_default=True,
+    help=(
+        "create a new database, or load into an existing one appending the rows "
+        "with new customer ids or upserting by customer id. Chunks of the csv "
+        "loaded before are skipped."
+    ),
+)
+@click.option(
+    "--layout",
+    type=click.Choice(["wide", "dictionary"]),
+    default="wide",
+    show_default=True,
+    help=(
+        "Storage of a new database: one table, or the text columns encoded as "
+        "integers into dimension tables behind a `purchases` view. Existing "
+        "databases keep their layout."
+    ),
+)
+def create_db(
+    data_file: str,
+    db_name: str,
+    db_path: str,
+    cube_dimensions: int,
+    batch_size: int,
+    workers: int,
+    indexes: tuple[str, ...],
+    mode: str,
+    layout: str,
+):
 
     db_folder = Path(db_path)
     db_folder.mkdir(parents=True, exist_ok=True)
 
     full_name = db_folder / f"{db_name}.db"
-    engine = create_engine(f"sqlite:///{full_name}")
-    metadata_obj = MetaData()
+    if mode == "create" and full_name.exists():
+        raise click.UsageError(
+            f"{full_name} already exists, use --mode append or --mode upsert"
+        )
+    if mode != "create" and not full_name.exists():
+        raise click.UsageError(f"{full_name} doesn't exist, use --mode create")
 
-    class Gender(PyEnum):
-        FEMALE = "female"
-        MALE = "male"
-
-    class ShippingType(PyEnum):
-        TWO_DAY_SHIPPING = "2_day_shipping"
-        EXPRESS = "express"
-        FREE_SHIPPING = "free_shipping"
-        NEXT_DAY_AIR = "next_day_air"
-        STANDARD = "standard"
-        STORE_PICKUP = "store_pickup"
-
-    class PaymentMethod(PyEnum):
-        BANK_TRANSFER = "bank_transfer"
-        CASH = "cash"
-        CREDIT_CARD = "credit_card"
-        DEBIT_CARD = "debit_card"
-        PAYPAL = "paypal"
-        VENMO = "venmo"
-
-    class FrequencyOfPurchases(PyEnum):
-        ANNUALLY = "annually"
-        BI_WEEKLY = "bi_weekly"
-        MONTHLY = "monthly"
-        EVERY_3_MONTHS = "every_3_months"
-        FORTNIGHTLY = "fortnightly"
-        QUARTERLY = "quarterly"
-        WEEKLY = "weekly"
-
-    def normalize_string(string):
-        return string.lower().replace(" ", "_").replace("-", "_")
-
-    # create SQL table
-    table_name = "purchases"
-    purchases_table = Table(
-        table_name,
-        metadata_obj,
-        Column("customer_id", Integer, primary_key=True),
-        Column("age", Integer),
-        Column("gender", Enum(Gender)),
-        Column("item_purchased", String, nullable=False),
-        Column("category", String),
-        Column("purchase_amount", Integer),
-        Column("location", String),
-        Column("size", String(1)),
-        Column("color", String),
-        Column("season", String),
-        Column("review_rating", Float),
-        Column("subscription_status", Boolean),
-        Column("shipping_type", Enum(ShippingType)),
-        Column("discount_applied", Boolean),
-        Column("promo_code_used", Boolean),
-        Column("previous_purchases", Integer),
-        Column("payment_method", Enum(PaymentMethod)),
-        Column("frequency_of_purchases", Enum(FrequencyOfPurchases)),
+    if mode != "create":
+        with closing(sqlite3.connect(full_name)) as conn:
+            layout = database_layout(conn)
+
+    # a new database is loaded into a temporary file renamed once complete, so a
+    # failed load doesn't block the next `--mode create`
+    target = (
+        written_atomically(full_name) if mode == "create" else nullcontext(full_name)
     )
+    with target as db_file:
+        version = load_database(
+            db_file,
+            data_file,
+            cube_dimensions,
+            batch_size,
+            workers,
+            indexes,
+            mode,
+            layout,
+        )
+    print(f"Database saved as: {full_name} (dataset version {version})")
+
+
+def load_database(
+    db_file: Path,
+    data_file: str,
+    cube_dimensions: int,
+    batch_size: int,
+    workers: int,
+    indexes: tuple[str, ...],
+    mode: str,
+    layout: str,
+) -> int:
+    """Loads the csv into `db_file` with its indexes and cubes, returns its version"""
+    engine = create_engine(f"sqlite:///{db_file}")
+    metadata_obj = MetaData()
+
+    # create SQL tables
+    if layout == "dictionary":
+        purchases_table, dimensions = define_dictionary_tables(metadata_obj)
+    else:
+        purchases_table = define_table(metadata_obj)
+    define_metadata_tables(metadata_obj)
     metadata_obj.create_all(engine)
+    if layout == "dictionary":
+        with engine.begin() as conn:
+            conn.execute(text(view_statement(purchases_table, dimensions)))
+    engine.dispose()
+
+    # stream the CSV, the autocommit connection lets the load manage its transaction
+    with closing(sqlite3.connect(db_file, isolation_level=None)) as conn:
+        pragmas = BULK_LOAD_PRAGMAS if mode == "create" else INCREMENTAL_LOAD_PRAGMAS
+        with bulk_load_pragmas(conn, pragmas):
+            start = time.perf_counter()
+            # chunks with the same content as a loaded one are skipped
+            loaded = loaded_checksums(conn)
+            chunks = []
+            skipped = 0
+            for range_start, range_end in split_ranges(data_file, batch_size):
+                checksum = range_checksum(data_file, range_start, range_end)
+                if checksum in loaded:
+                    skipped += 1
+                else:
+                    chunks.append((range_start, range_end, checksum))
 
-    # read CSV
-    with open(data_file, mode="r") as file:
-        reader = csv.DictReader(file)
-        data = []
-        for row in reader:
-            row["customer_id"] = int(row["customer_id"])
-            row["age"] = int(row["age"])
-            row["purchase_amount"] = int(row["purchase_amount"])
-            row["previous_purchases"] = int(row["previous_purchases"])
-            row["review_rating"] = float(row["review_rating"])
-            row["gender"] = Gender(normalize_string(row["gender"]))
-            row["shipping_type"] = ShippingType(normalize_string(row["shipping_type"]))
-            row["payment_method"] = PaymentMethod(
-                normalize_string(row["payment_method"])
+            columns = [column.name for column in define_columns()]
+            if layout == "dictionary":
+                # batches are staged as parsed, then encoded into the fact table
+                conn.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+                    f"({', '.join(columns)})"
+                )
+                statement = (
+                    f"INSERT INTO temp.{STAGING_TABLE} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})"
+                )
+                after_batch = encode_statements(purchases_table, dimensions, mode)
+            else:
+                statement = insert_statement(purchases_table, mode)
+                after_batch = []
+
+            batches = read_batches(
+                data_file, columns, [chunk[:2] for chunk in chunks], workers
+            )
+            rows = bulk_load(
+                conn,
+                statement,
+                zip([chunk[2] for chunk in chunks], batches),
+                after_batch,
             )
-            row["frequency_of_purchases"] = FrequencyOfPurchases(
-                normalize_string(row["frequency_of_purchases"])
+            elapsed = time.perf_counter() - start
+            print(
+                f"Loaded {rows} rows from {len(chunks)} chunks in {elapsed:.2f}s "
+                f"({rows / max(elapsed, 1e-9):,.0f} rows/s), "
+                f"skipped {skipped} unchanged chunks"
             )
-            row["subscription_status"] = row["subscription_status"] is True
-            row["discount_applied"] = row["discount_applied"] is True
-            row["promo_code_used"] = row["promo_code_used"] is True
 
-            data.append(row)
+            # building the indexes once is cheaper than updating them on every insert
+            start = time.perf_counter()
+            for index in indexes:
+                # on the codes of the fact table for the dictionary layout
+                index_columns = [column.strip() for column in index.split(",")]
+                conn.execute(index_statement(index_columns, purchases_table.name))
+            if indexes:
+                print(
+                    f"Built {len(indexes)} indexes in "
+                    f"{time.perf_counter() - start:.2f}s"
+                )
+            version = dataset_version(conn)
 
-        with engine.connect() as conn:
-            transaction = conn.begin()
-            conn.execute(insert(purchases_table), data)
-            transaction.commit()
-        print(f"Database saved as: {full_name}")
+    with engine.begin() as conn:
+        # cubes built before are stale once rows changed
+        stale = existing_cubes(conn) if rows else []
+        if cube_dimensions or stale:
+            build_cubes(conn, TABLE_NAME, cube_dimensions, stale)
+    engine.dispose()
+    return version
 
 
 if __name__ == "__main__":
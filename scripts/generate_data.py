@@ -0,0 +1,311 @@
+import hashlib
+import sqlite3
+import time
+
+from contextlib import closing
+from dataclasses import dataclass, field
+from itertools import combinations
+from pathlib import Path
+from typing import Iterator
+
+import click
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import DataFrame, crosstab, qcut, read_csv
+from pandas.api.types import is_numeric_dtype
+from sqlalchemy import MetaData, create_engine
+
+from create_db import (
+    BULK_LOAD_PRAGMAS,
+    bulk_load,
+    bulk_load_pragmas,
+    coerce_frame,
+    define_metadata_tables,
+    define_table,
+    insert_statement,
+    written_atomically,
+)
+
+# numeric columns with more distinct values are binned by quantiles to learn the
+# dependencies, values are then drawn from the source values of the sampled bin
+NUMERIC_BINS = 10
+
+
+@dataclass
+class ColumnModel:
+    """Distribution of a column, conditioned on the column it depends on"""
+
+    name: str
+    # source values of every state: the category itself or the values of a bin
+    states: list[np.ndarray]
+    marginal: np.ndarray
+    parent: str | None = None
+    # probabilities of the states for every state of the parent
+    conditional: np.ndarray | None = None
+
+
+@dataclass
+class DataModel:
+    """Chow-Liu trees of the columns: every column depends on at most one other column.
+
+    The trees keeping the most mutual information between the columns are the best
+    approximation of the joint distribution by pairwise dependencies, e.g. the
+    category of an item or the promo code used with a discount are kept.
+    """
+
+    columns: list[str]
+    id_column: str | None
+    # in sampling order, parents before their children
+    models: list[ColumnModel] = field(default_factory=list)
+    dtypes: dict[str, np.dtype] = field(default_factory=dict)
+
+
+def discretize(values, bins: int) -> tuple[np.ndarray, list[np.ndarray]]:
+    """State of every value and the source values of every state"""
+    if is_numeric_dtype(values) and values.nunique() > bins:
+        codes = qcut(values, bins, labels=False, duplicates="drop").to_numpy()
+    else:
+        codes = values.astype("category").cat.codes.to_numpy()
+    states = [values.to_numpy()[codes == code] for code in range(codes.max() + 1)]
+    return codes, states
+
+
+def mutual_information(a: np.ndarray, b: np.ndarray) -> float:
+    """Mutual information of two discrete columns, with the Miller-Madow correction.
+
+    The plain estimate is positive for independent columns on a finite sample and
+    grows with their number of states, the correction is about 0 for them.
+    """
+    joint = crosstab(a, b).to_numpy() / len(a)
+    outer = joint.sum(axis=1, keepdims=True) * joint.sum(axis=0, keepdims=True)
+    nonzero = joint > 0
+    information = (joint[nonzero] * np.log(joint[nonzero] / outer[nonzero])).sum()
+    bias = (joint.shape[0] - 1) * (joint.shape[1] - 1) / (2 * len(a))
+    return float(information - bias)
+
+
+def learn_model(
+    data: DataFrame, id_column: str | None = None, bins: int = NUMERIC_BINS
+) -> DataModel:
+    """Learns the marginals and the Chow-Liu tree of the columns of `data`"""
+    model = DataModel(columns=list(data.columns), id_column=id_column)
+    model.dtypes = {column: data[column].dtype for column in data.columns}
+    names = [column for column in data.columns if column != id_column]
+    discrete = {name: discretize(data[name], bins) for name in names}
+
+    information = {
+        (a, b): mutual_information(discrete[a][0], discrete[b][0])
+        for a, b in combinations(names, 2)
+    }
+
+    def weight(a: str, b: str) -> float:
+        return information.get((a, b), information.get((b, a), 0.0))
+
+    # maximum spanning tree (Prim) of the dependent columns, columns independent of
+    # the tree start a new one from the most informative of them
+    parents = {}
+    while len(parents) < len(names):
+        edges = [
+            (child, parent)
+            for child in names
+            if child not in parents
+            for parent in parents
+            if weight(child, parent) > 0
+        ]
+        if edges:
+            child, parent = max(edges, key=lambda edge: weight(*edge))
+            parents[child] = parent
+        else:
+            root = max(
+                (name for name in names if name not in parents),
+                key=lambda name: sum(weight(name, other) for other in names),
+            )
+            parents[root] = None
+
+    for name, parent in parents.items():
+        codes, states = discrete[name]
+        marginal = np.bincount(codes, minlength=len(states)) / len(codes)
+        column = ColumnModel(name=name, states=states, marginal=marginal)
+        if parent is not None:
+            parent_codes, parent_states = discrete[parent]
+            counts = np.zeros((len(parent_states), len(states)))
+            np.add.at(counts, (parent_codes, codes), 1)
+            column.parent = parent
+            column.conditional = counts / counts.sum(axis=1, keepdims=True)
+        model.models.append(column)
+    return model
+
+
+def sample_chunk(
+    model: DataModel, rows: int, start_id: int, rng: np.random.Generator
+) -> DataFrame:
+    """Samples `rows` rows, ids are numbered from `start_id`"""
+    codes = {}
+    values = {}
+    for column in model.models:
+        if column.parent is None:
+            sampled = rng.choice(len(column.states), rows, p=column.marginal)
+        else:
+            parent = codes[column.parent]
+            sampled = np.empty(rows, dtype=np.int64)
+            for state, probabilities in enumerate(column.conditional):
+                matched = np.flatnonzero(parent == state)
+                sampled[matched] = rng.choice(
+                    len(column.states), len(matched), p=probabilities
+                )
+        codes[column.name] = sampled
+
+        # a source value of the sampled state
+        column_values = np.empty(rows, dtype=column.states[0].dtype)
+        for state, source in enumerate(column.states):
+            matched = np.flatnonzero(sampled == state)
+            column_values[matched] = source[
+                rng.integers(len(source), size=len(matched))
+            ]
+        values[column.name] = column_values
+
+    if model.id_column is not None:
+        values[model.id_column] = np.arange(start_id, start_id + rows)
+    return DataFrame({column: values[column] for column in model.columns}).astype(
+        model.dtypes
+    )
+
+
+def generate(
+    model: DataModel, rows: int, chunk_size: int, seed: int
+) -> Iterator[DataFrame]:
+    """Streams `rows` rows in chunks, the same seed and chunk size give the same rows"""
+    generators = np.random.SeedSequence(seed).spawn(-(-rows // chunk_size))
+    for index, sequence in enumerate(generators):
+        start = index * chunk_size
+        yield sample_chunk(
+            model,
+            min(chunk_size, rows - start),
+            start + 1,
+            np.random.default_rng(sequence),
+        )
+
+
+def write_csv(chunks: Iterator[DataFrame], output: Path) -> int:
+    rows = 0
+    with open(output, mode="w", newline="") as file:
+        for index, chunk in enumerate(chunks):
+            chunk.to_csv(file, header=index == 0, index=False)
+            rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks: Iterator[DataFrame], output: Path) -> int:
+    """Writes every chunk as a row group"""
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_sqlite(chunks: Iterator[DataFrame], output: Path, seed: int) -> int:
+    """Loads the chunks into a new database with the schema of `create_db.py`"""
+    engine = create_engine(f"sqlite:///{output}")
+    metadata_obj = MetaData()
+    purchases_table = define_table(metadata_obj)
+    define_metadata_tables(metadata_obj)
+    metadata_obj.create_all(engine)
+    engine.dispose()
+
+    columns = [column.name for column in purchases_table.columns]
+    # generated chunks are identified by the seed, as csv chunks by their content
+    batches = (
+        (
+            hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=16).hexdigest(),
+            coerce_frame(chunk, columns),
+        )
+        for index, chunk in enumerate(chunks)
+    )
+    with closing(sqlite3.connect(output, isolation_level=None)) as conn:
+        with bulk_load_pragmas(conn, BULK_LOAD_PRAGMAS):
+            return bulk_load(conn, insert_statement(purchases_table, "create"), batches)
+
+
+@click.command()
+@click.option(
+    "--data_file",
+    default="data/shopping_trends.csv",
+    show_default=True,
+    help="Csv file the distributions are learnt from.",
+)
+@click.option(
+    "--output",
+    required=True,
+    help="Generated file, the format follows the extension: .csv, .parquet or .db.",
+)
+@click.option(
+    "--rows",
+    default=1_000_000,
+    show_default=True,
+    help="Rows to generate.",
+)
+@click.option(
+    "--seed",
+    default=0,
+    show_default=True,
+    help="Seed of the generator, the same seed generates the same rows.",
+)
+@click.option(
+    "--chunk_size",
+    default=500_000,
+    show_default=True,
+    help="Rows generated and written at a time, part of the seeding.",
+)
+@click.option(
+    "--id_column",
+    default="customer_id",
+    show_default=True,
+    help="Column numbered from 1 instead of sampled.",
+)
+def generate_data(
+    data_file: str, output: str, rows: int, seed: int, chunk_size: int, id_column: str
+):
+    """Generates rows statistically similar to the csv, e.g. to benchmark at scale"""
+    output_path = Path(output)
+    if output_path.exists():
+        raise click.UsageError(f"{output_path} already exists")
+    suffix = output_path.suffix.lower()
+    if suffix not in (".csv", ".parquet", ".db"):
+        raise click.UsageError(f"Unsupported output format {suffix!r}")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    source = read_csv(data_file)
+    model = learn_model(source, id_column if id_column in source else None)
+    for column in model.models:
+        if column.parent is not None:
+            print(f"    {column.parent} -> {column.name}")
+
+    start = time.perf_counter()
+    chunks = generate(model, rows, chunk_size, seed)
+    if suffix == ".csv":
+        written = write_csv(chunks, output_path)
+    elif suffix == ".parquet":
+        written = write_parquet(chunks, output_path)
+    else:
+        # the bulk load has no journal, a failed load must not leave a broken file
+        with written_atomically(output_path) as partial:
+            written = write_sqlite(chunks, partial, seed)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Generated {written} rows in {elapsed:.2f}s "
+        f"({written / max(elapsed, 1e-9):,.0f} rows/s) into {output_path}"
+    )
+
+
+if __name__ == "__main__":
+    generate_data()
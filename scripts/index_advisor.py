@@ -0,0 +1,215 @@
+import json
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from collections import Counter
+from pathlib import Path
+
+import click
+
+from create_db import (
+    FACT_TABLE,
+    TABLE_NAME,
+    database_layout,
+    index_name,
+    index_statement,
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+# clauses whose columns benefit from an index, up to the next clause keyword
+_CLAUSE = re.compile(
+    r"\b(where|on|group\s+by|order\s+by)\b(.*?)"
+    r"(?=\b(?:where|group\s+by|order\s+by|having|limit|union|join|from|select)\b|\)|$)",
+    re.S,
+)
+# names of the purchases table in a query: itself, the fact table and their aliases
+_TABLE_ALIAS = re.compile(
+    rf"\b(?:{FACT_TABLE}|{TABLE_NAME})\b(?:\s+(?:as\s+)?(\w+))?", re.I
+)
+_NOT_ALIASES = set(
+    "where on join inner left right full cross natural group order limit union "
+    "having using window except intersect as".split()
+)
+
+
+def read_log(log_file: str) -> list[dict]:
+    with open(log_file) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def clause_columns(query: str, columns: list[str]) -> dict[str, list[str]]:
+    """Finds the table columns used in the filter, join, group by and order by clauses"""
+    normalized = _STRING_LITERAL.sub("?", query.lower())
+    found: dict[str, list[str]] = {}
+    for clause, body in _CLAUSE.findall(normalized):
+        clause = "filter" if clause in ("where", "on") else " ".join(clause.split())
+        used = [column for column in columns if re.search(rf"\b{column}\b", body)]
+        found.setdefault(clause, []).extend(used)
+    return found
+
+
+def scans_table(query: str, plan: list[str]) -> bool:
+    """Whether the plan of `query` scans the purchases table, not a subquery or CTE"""
+    names = {TABLE_NAME, FACT_TABLE}
+    for match in _TABLE_ALIAS.finditer(_STRING_LITERAL.sub("?", query)):
+        if match.group(1) and match.group(1).lower() not in _NOT_ALIASES:
+            names.add(match.group(1).lower())
+    return any(
+        detail.split()[0] == "SCAN" and detail.split()[1].lower() in names
+        for detail in plan
+        if len(detail.split()) > 1
+    )
+
+
+def storage_table(conn: sqlite3.Connection) -> str:
+    """Table holding the rows, and so the indexes, of the purchases"""
+    return FACT_TABLE if database_layout(conn) == "dictionary" else TABLE_NAME
+
+
+def existing_indexes(conn: sqlite3.Connection) -> set[tuple[str, ...]]:
+    indexes = set()
+    for _, name, *_ in conn.execute(f"PRAGMA index_list({storage_table(conn)})"):
+        indexes.add(
+            tuple(row[2] for row in conn.execute(f'PRAGMA index_info("{name}")'))
+        )
+    return indexes
+
+
+def recommend(
+    entries: list[dict],
+    columns: list[str],
+    indexed: set[tuple[str, ...]],
+    min_count: int,
+) -> list[tuple[tuple[str, ...], float, list[str]]]:
+    """Scores index candidates by the time spent in the queries they could speed up.
+
+    Candidates are the filtered, grouped and ordered columns of queries whose plan
+    scans the purchases table, plus composite (filter, group by) column pairs. Returns
+    (columns, logged seconds, queries) sorted by seconds.
+    """
+    seconds: Counter[tuple[str, ...]] = Counter()
+    counts: Counter[tuple[str, ...]] = Counter()
+    queries: dict[tuple[str, ...], set[str]] = {}
+
+    for entry in entries:
+        if not scans_table(entry["query"], entry.get("plan", [])):
+            continue
+        used = clause_columns(entry["query"], columns)
+        candidates = {
+            (column,)
+            for clause in ("filter", "group by", "order by")
+            for column in used.get(clause, [])
+        }
+        for filtered in used.get("filter", []):
+            for grouped in used.get("group by", []):
+                if filtered != grouped:
+                    candidates.add((filtered, grouped))
+
+        for candidate in candidates:
+            seconds[candidate] += entry["seconds"]
+            counts[candidate] += 1
+            queries.setdefault(candidate, set()).add(entry["query"])
+
+    return [
+        (candidate, total, sorted(queries[candidate]))
+        for candidate, total in seconds.most_common()
+        if counts[candidate] >= min_count
+        # an index whose leading columns match is already there
+        and not any(index[: len(candidate)] == candidate for index in indexed)
+    ]
+
+
+def time_queries(database: Path, queries: list[str], repeat: int) -> float:
+    """Best total time of running every query once"""
+    with sqlite3.connect(database) as conn:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for query in queries:
+                conn.execute(query).fetchall()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option(
+    "--log_file",
+    required=True,
+    help="Query log written by the agent, see QUERY_LOG_PATH.",
+)
+@click.option(
+    "--db_file",
+    default="data/database.db",
+    show_default=True,
+    help="Path to the sqlite database.",
+)
+@click.option(
+    "--min_count",
+    default=2,
+    show_default=True,
+    help="Minimum number of logged queries that an index must help.",
+)
+@click.option(
+    "--top",
+    default=5,
+    show_default=True,
+    help="Maximum number of recommended indexes.",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    help="Runs of the affected queries when timing before/after.",
+)
+@click.option(
+    "--apply",
+    is_flag=True,
+    help="Create the recommended indexes on the database.",
+)
+def index_advisor(
+    log_file: str, db_file: str, min_count: int, top: int, repeat: int, apply: bool
+):
+    """Recommends indexes for the purchases table from the logged queries"""
+    entries = read_log(log_file)
+    with sqlite3.connect(db_file) as conn:
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({TABLE_NAME})")]
+        indexed = existing_indexes(conn)
+        table_name = storage_table(conn)
+
+    recommendations = recommend(entries, columns, indexed, min_count)[:top]
+    print(f"Analyzed {len(entries)} logged queries")
+    if not recommendations:
+        print("No index recommendations")
+        return
+
+    # measured on a copy, the database is only modified with --apply
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy = Path(tmp_dir) / "database.db"
+        shutil.copy(db_file, copy)
+        for candidate, total, queries in recommendations:
+            statement = index_statement(candidate, table_name)
+            before = time_queries(copy, queries, repeat)
+            with sqlite3.connect(copy) as conn:
+                conn.execute(statement)
+            after = time_queries(copy, queries, repeat)
+            # every index is timed against the database without the recommended ones
+            with sqlite3.connect(copy) as conn:
+                conn.execute(f"DROP INDEX {index_name(candidate, table_name)}")
+            print(
+                f"{statement};\n"
+                f"    {len(queries)} queries, {total:.3f}s logged, "
+                f"before: {before * 1000:.1f}ms, after: {after * 1000:.1f}ms"
+            )
+
+    if apply:
+        with sqlite3.connect(db_file) as conn:
+            for candidate, *_ in recommendations:
+                conn.execute(index_statement(candidate, table_name))
+        print(f"Applied {len(recommendations)} indexes to {db_file}")
+
+
+if __name__ == "__main__":
+    index_advisor()
@@ -72,6 +72,11 @@ class AIAgent:
                     print(interrupt_text)
                     params = Command(resume=input())
                 else:
+                    decision = response.get("query_guard")
+                    if decision and decision.action == "reject":
+                        print(f"SQL query rejected: {decision.reason}")
+                    elif response.get("error"):
+                        print(response["error"])
                     print("Ending...")
                     break
 
@@ -1,13 +1,18 @@
 import base64
+import logging
 import os
-import pickle
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from baml_client.sync_client import b
-from baml_client.types import PlotSummary, SQLQuery
+from baml_client.types import PlotSpec, PlotSummary, SQLQuery
 from baml_py import Image
+from baml_py.errors import BamlValidationError
 from dotenv import load_dotenv
 from langchain.agents import initialize_agent, AgentType
 from langchain.chat_models import init_chat_model
@@ -22,12 +27,37 @@ from .tests.agents import (
     SQLTestAgent,
     TestDataManager,
 )
-from src.tools import get_schema, python_repl_tool, run_sql
+from src.tools import (
+    ARTIFACT_SPILL_DIR,
+    artifact_ref,
+    artifact_store,
+    cancellation_registry,
+    compact_frame,
+    content_digest,
+    data_key,
+    DataReduction,
+    DtypeCompaction,
+    get_dialect,
+    get_schema,
+    is_artifact_ref,
+    isolated_repl,
+    python_repl_tool,
+    question_cache,
+    reduce_data,
+    run_sql,
+    schema_fingerprint,
+)
+from src.tools.render import PLOT_SPEC_ENABLED, PlotSpecError, render_plot
 
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 TEST_MODE = os.getenv("TEST_MODE", "False").lower() == "true"
+# sessions whose query result is kept for their next plots, the least recently
+# used ones are dropped above it
+DATA_SESSIONS_MAX = int(os.getenv("DATA_SESSIONS_MAX", "64"))
 
 if TYPE_CHECKING:
     from langchain.agents.agent import AgentExecutor
@@ -39,40 +69,146 @@ class SQLAgent:
     """This agent converts the text query to a SQL query"""
 
     @observe(name="sql-agent", as_type="generation")
-    def invoke(self, query: str, engine: str = "sqlite") -> SQLQuery:
+    def invoke(self, query: str, engine: str | None = None) -> SQLQuery:
+        engine = engine or get_dialect()
+        if question_cache.enabled:
+            # similar questions asked before reuse their SQL, skipping the LLM
+            schema = f"{engine}:{schema_fingerprint()}"
+            if (cached := question_cache.lookup(query, schema)) is not None:
+                return SQLQuery(query=cached)
+
         return b.GenerateSQLQuery(
             query,
-            get_schema(),
+            get_schema(query),
             engine,
         )
 
+    def remember(self, query: str, sql: str, engine: str | None = None) -> None:
+        """Caches the SQL of `query` once the SQL guard accepted it, see `sql_guard_node`"""
+        if question_cache.enabled:
+            engine = engine or get_dialect()
+            question_cache.store(query, sql, f"{engine}:{schema_fingerprint()}")
+
 
 sql_agent = SQLTestAgent() if TEST_MODE else SQLAgent()
 
 
-class DataManager:
-    """This manager retrieves data from the database and handles data serialization"""
+@dataclass
+class DataSession:
+    """Query result of a session, plotted again on every new plot instruction"""
 
     sql: str = ""
-    data: DataFrame
-
-    def save_data(self, uid: str) -> str:
-        path = str(self.generate_data_path(uid))
-        with open(path, "wb") as f:
-            pickle.dump(self.data, f)
-        return path
+    data: DataFrame | None = None
+    data_path: str = ""
+    compaction: DtypeCompaction = field(default_factory=DtypeCompaction)
+    # artifacts the session refers to: its data, reduced data and plots
+    artifacts: set[str] = field(default_factory=set)
 
-    def generate_data_path(self, uid: str) -> Path:
-        path = Path(f"/tmp/data_{uid}.pkl").resolve()
-        return path
 
-    def get_data_and_save(self, query: str, uid: str) -> str:
+class DataManager:
+    """This manager retrieves data from the database and handles data serialization.
+
+    Every session has its own data, keyed by its unique id, so concurrent sessions
+    never read each other's. The least recently used sessions are dropped above
+    `max_sessions`, the artifacts of the sessions kept are never deleted by the
+    artifact collector, see `live_artifacts`.
+    """
+
+    def __init__(self, max_sessions: int = DATA_SESSIONS_MAX) -> None:
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[str, DataSession] = OrderedDict()
+
+    def session(self, uid: str, sql: str = "") -> DataSession:
+        """Data of the session, extracted again from `sql` when the session was dropped"""
+        with self._lock:
+            session = self._sessions.get(uid)
+            if session is not None:
+                self._sessions.move_to_end(uid)
+                return session
+        if not sql:
+            raise KeyError(f"No data for session {uid!r}, extract it again")
+        # dropped as least recently used, e.g. while the user was writing the plot
+        # instructions, the data is usually still stored under its content key
+        return self._extract(sql, uid)
+
+    def _add_session(self, uid: str, session: DataSession) -> None:
+        with self._lock:
+            if (previous := self._sessions.get(uid)) is not None:
+                # the plots of the previous query are still shown in the history
+                session.artifacts.update(
+                    reference
+                    for reference in previous.artifacts
+                    if not is_artifact_ref(reference)
+                )
+            self._sessions[uid] = session
+            self._sessions.move_to_end(uid)
+            while len(self._sessions) > max(self.max_sessions, 1):
+                self._sessions.popitem(last=False)
+
+    def keep(self, uid: str, *references: str) -> None:
+        """Keeps artifacts of the session, e.g. its plots, as long as the session"""
+        with self._lock:
+            if (session := self._sessions.get(uid)) is not None:
+                session.artifacts.update(filter(None, references))
+
+    def live_artifacts(self) -> list[str]:
+        """References and files of the artifacts of the sessions kept"""
+        with self._lock:
+            return [
+                reference
+                for session in self._sessions.values()
+                for reference in session.artifacts
+            ]
+
+    def _extract(self, query: str, uid: str) -> DataSession:
         if not query:
             raise ValueError(f"SQL query is empty")
-        self.sql = query
-        self.data = run_sql(self.sql)
-        data_path = self.save_data(uid)
-        return data_path
+        session = DataSession(sql=query)
+        key = data_key(query)
+        # shared with the other sessions, only read
+        if (stored := artifact_store.lookup(key, copy=False)) is not None:
+            session.data, session.compaction = stored
+        else:
+            # the running query can be cancelled with `cancellation_registry.cancel(uid)`
+            token = cancellation_registry.start(uid)
+            try:
+                data = run_sql(session.sql, token=token)
+            finally:
+                cancellation_registry.finish(uid, token)
+            # smaller frames are faster to reduce and plot, and to spill
+            session.data, session.compaction = compact_frame(data)
+            artifact_store.put(key, session.data, info=session.compaction)
+        session.data_path = artifact_ref(key)
+        session.artifacts.add(session.data_path)
+        # the previous data of the session is kept when the query fails
+        self._add_session(uid, session)
+        return session
+
+    def get_data_and_save(self, query: str, uid: str) -> str:
+        """Extracts the data of `query`, stored once for the sessions running the same query"""
+        return self._extract(query, uid).data_path
+
+    def reduce_and_save(
+        self, query: str, uid: str, sql: str = ""
+    ) -> tuple[str, DataReduction]:
+        """Saves the data reduced for plotting `query`, the full data is kept as is.
+
+        The data is extracted again from `sql` when the session was dropped.
+        """
+        session = self.session(uid, sql)
+        reduced, reduction = reduce_data(session.data, query)
+        if reduction.method == "none":
+            return session.data_path, reduction
+
+        # the same data reduced the same way is stored once too
+        reduced_path = (
+            f"{session.data_path}_{content_digest(reduction.model_dump_json())}"
+        )
+        if reduced_path not in artifact_store:
+            artifact_store.put(reduced_path, reduced)
+        self.keep(uid, reduced_path)
+        return reduced_path, reduction
 
 
 data_manager = TestDataManager() if TEST_MODE else DataManager()
@@ -83,7 +219,7 @@ class PlotAgent:
     llm: "AgentExecutor | CompiledStateGraph"
     prompt: str = (
         "You are a plotting agent that uses plotly and seaborn to generate plots."
-        "You are working with a data extractor colleague. You will be given a pickled DataFrame file path to plot. "
+        "You are working with a data extractor colleague. You will be given a DataFrame to plot and the code loading it. "
         "The user will give you the instructions of the plot or a query that the plot should answer.\n\n"
         "You are NOT allowed to transform or aggregate data in any way. "
         "The DataFrame is already processed and ready for visualization. "
@@ -91,7 +227,7 @@ class PlotAgent:
         "Use the existing columns directly for plotting.\n\n"
         "Generate one plot file; you can do a multiplot if it applies. "
         "If the user's query is too complex, focus on the main question.\n\n"
-        "Generate the plot first, then save the plot to a file (png) in the same folder that the data file is and "
+        "Generate the plot first, then save the plot to a file (png) in the plots folder and "
         "provide its path in your final output, e.g., `Final Answer: /path/to/plot/file.png` (without the backticks).\n"
         "Choose a name for the plot and include the user's unique_id in the file name, e.g., `boxplot_categories_{unique_id}.png`"
     )
@@ -112,20 +248,66 @@ class PlotAgent:
         self.llm = agent
 
     def _prepare_input(self, state: "State") -> dict[str, Any]:
+        # the data may have been downsampled or pre-binned, see `reduce_data`
+        reduction = state.get("plot_data").reduction.describe()
+        reduction_note = f"\n{reduction}\n" if reduction else ""
+        data_path = state.get("plot_data").data_path
+        load_code = artifact_store.load_code(data_path)
         return {
             "input": (
                 f"{self.prompt}\n"
-                f"File is located at `{state.get("plot_data").data_path}`\n"
+                f"Load the DataFrame with:\n```python\n{load_code}\n```\n"
+                f"Plots folder: `{Path(ARTIFACT_SPILL_DIR).resolve()}`\n"
                 f"Data columns: {state.get("plot_data").data_columns}"
+                f"{reduction_note}"
                 f"User's query:\n{state.get("data_query")}"
                 f"User unique id:\n{state.get("unique_id")}"
             )
         }
 
+    def _generate_spec(self, state: "State", data: DataFrame) -> PlotSpec:
+        reduction = state.get("plot_data").reduction.describe()
+        return b.GeneratePlotSpec(
+            state.get("data_query"),
+            str(data.columns.to_list()),
+            data.head().to_string(),
+            reduction,
+        )
+
+    def _render_spec(self, state: "State") -> str | None:
+        """Renders the plot from a spec, None when the spec needs the agent"""
+        data = artifact_store.load(state.get("plot_data").data_path)
+        try:
+            spec = self._generate_spec(state, data)
+        except BamlValidationError:
+            return None
+        name = f"{spec.chart_type.value.lower()}_{state.get('unique_id')}"
+        path = Path(ARTIFACT_SPILL_DIR).resolve() / (
+            f"{name}_{content_digest(spec.model_dump_json())[:8]}.png"
+        )
+        try:
+            return str(render_plot(spec, data, path))
+        except PlotSpecError:
+            return None
+        except Exception:
+            # a valid spec seaborn or matplotlib can't draw, e.g. a pie of negative values
+            logger.exception(f"Rendering the plot spec {spec} failed")
+            path.unlink(missing_ok=True)
+            return None
+
     @observe(name="plot-agent", as_type="generation")
     def invoke(self, state: "State") -> str:
-        llm_input = self._prepare_input(state)
-        llm_response = self.llm.invoke(llm_input)
+        with artifact_store.pinned(state.get("plot_data").data_path):
+            # a single LLM call for the charts a spec expresses
+            if PLOT_SPEC_ENABLED and (plot_path := self._render_spec(state)):
+                return plot_path
+
+            llm_input = self._prepare_input(state)
+            # the REPL runs in process and reads the data from the store while
+            # plotting, with its own variables so concurrent sessions don't overwrite
+            # each other's
+            with isolated_repl():
+                llm_response = self.llm.invoke(llm_input)
 
         response_content = llm_response["output"]
 
@@ -138,7 +320,7 @@ plot_agent = PlotTestAgent() if TEST_MODE else PlotAgent()
 class PlotSummaryAgent:
     """This agent analyzes and summarizes a plot"""
 
-    def _get_base64_img(self, path_str: str | None) -> Image:
+    def _get_base64_img(self, path_str: str | None, uid: str) -> Image:
         if not isinstance(path_str, str):
             raise TypeError(f"Variable plot_path {path_str} is not a valid str")
 
@@ -149,15 +331,17 @@ class PlotSummaryAgent:
         if path.is_dir():
             raise IsADirectoryError(f"File {path_str} is a directory, not a file.")
 
-        with open(path_str, "rb") as image_file:
-            image_b64 = image_file.read()
-            return Image.from_base64(
-                "image/png", base64.b64encode(image_b64).decode("utf-8")
-            )
+        # read once, the UI shows the same bytes from the store
+        image_bytes = artifact_store.read_image(f"plot_{uid}", path_str)
+        return Image.from_base64(
+            "image/png", base64.b64encode(image_bytes).decode("utf-8")
+        )
 
     @observe(name="sql-agent", as_type="generation")
     def invoke(self, state: "State") -> PlotSummary:
-        img = self._get_base64_img(state.get("plot_data").plot_path)
+        img = self._get_base64_img(
+            state.get("plot_data").plot_path, state.get("unique_id")
+        )
         return b.GeneratePlotSummary(
             img,
             state.get("data_query"),
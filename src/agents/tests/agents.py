@@ -3,6 +3,7 @@ import pickle
 from typing import TYPE_CHECKING
 from pandas import DataFrame
 from baml_client.types import PlotSummary, SQLQuery
+from src.tools import DataReduction, DtypeCompaction
 
 if TYPE_CHECKING:
     from src.workflow import State
@@ -16,12 +17,25 @@ class SQLTestAgent:
             query="SELECT category, COUNT(*) FROM purchases GROUP BY category;",
         )
 
+    def remember(self, _query: str, _sql: str, _engine: str = "sqlite") -> None:
+        pass
+
 
 class TestDataManager:
     """This manager is used for testing"""
 
     sql: str = ""
     data: DataFrame
+    compaction: DtypeCompaction = DtypeCompaction()
+
+    def session(self, _uid: str, _sql: str = "") -> "TestDataManager":
+        return self
+
+    def keep(self, _uid: str, *_references: str) -> None:
+        pass
+
+    def live_artifacts(self) -> list[str]:
+        return []
 
     def get_data_and_save(self, query: str, _uid: str) -> str:
         self.sql = query
@@ -30,6 +44,14 @@ class TestDataManager:
             self.data = pickle.load(file)
         return str(path)
 
+    def reduce_and_save(
+        self, _query: str, _uid: str, _sql: str = ""
+    ) -> tuple[str, DataReduction]:
+        path = Path("tests/data/data_12345.pkl").resolve()
+        return str(path), DataReduction(
+            original_rows=len(self.data), rows=len(self.data)
+        )
+
 
 class PlotTestAgent:
     """This agent is used for testing"""
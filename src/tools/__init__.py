@@ -1,3 +1,59 @@
-from .tools import get_schema, python_repl_tool, run_sql
+from .artifact_gc import artifact_collector
+from .artifact_store import (
+    ARTIFACT_SPILL_DIR,
+    artifact_ref,
+    artifact_store,
+    content_digest,
+    data_key,
+    is_artifact_ref,
+)
+from .artifacts import (
+    artifact_format_of,
+    get_artifact_format,
+    load_artifact,
+    save_artifact,
+)
+from .cache import plot_cache, result_cache, schema_cache
+from .cancel import cancellation_registry, QueryCancelledError, QueryTimeoutError
+from .compact import compact_frame, DtypeCompaction
+from .engine import engine_registry, get_dialect
+from .guard import guard_query, QueryGuardDecision
+from .question_cache import question_cache, schema_fingerprint
+from .reduce import DataReduction, HISTOGRAM_COLUMNS, reduce_data
+from .tools import get_schema, isolated_repl, iter_sql, python_repl_tool, run_sql
 
-__all__ = ["get_schema", "python_repl_tool", "run_sql"]
+__all__ = [
+    "artifact_collector",
+    "artifact_format_of",
+    "artifact_ref",
+    "ARTIFACT_SPILL_DIR",
+    "artifact_store",
+    "cancellation_registry",
+    "compact_frame",
+    "content_digest",
+    "data_key",
+    "DataReduction",
+    "DtypeCompaction",
+    "engine_registry",
+    "get_artifact_format",
+    "get_dialect",
+    "get_schema",
+    "guard_query",
+    "HISTOGRAM_COLUMNS",
+    "is_artifact_ref",
+    "isolated_repl",
+    "iter_sql",
+    "load_artifact",
+    "plot_cache",
+    "python_repl_tool",
+    "QueryCancelledError",
+    "QueryGuardDecision",
+    "QueryTimeoutError",
+    "question_cache",
+    "reduce_data",
+    "result_cache",
+    "run_sql",
+    "save_artifact",
+    "schema_cache",
+    "schema_fingerprint",
+]
@@ -0,0 +1,192 @@
+import logging
+import os
+import threading
+import time
+import weakref
+
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from dotenv import load_dotenv
+
+from .artifact_store import (
+    _artifact_key,
+    artifact_store,
+    ArtifactStore,
+    is_artifact_ref,
+)
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# artifacts unused for longer, in seconds, are deleted, 0 disables the expiry
+ARTIFACT_TTL = int(os.getenv("ARTIFACT_TTL", "3600"))
+# disk budget of the artifact files, the least recently used ones are deleted
+# above it, 0 disables it
+ARTIFACT_DISK_QUOTA_BYTES = int(os.getenv("ARTIFACT_DISK_QUOTA_BYTES", str(1024**3)))
+# seconds between the sweeps of the background thread, 0 disables the thread
+ARTIFACT_SWEEP_INTERVAL = int(os.getenv("ARTIFACT_SWEEP_INTERVAL", "60"))
+
+
+class ArtifactCollector:
+    """Deletes the data and plots of finished requests from the artifact store and its folder.
+
+    Artifacts unused for longer than the TTL are deleted, then the least recently
+    used files until the folder fits the disk quota. Artifacts referenced by a
+    watched owner, e.g. the data and plots of the sessions kept by the data manager,
+    and artifacts pinned in the store are never deleted.
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore = artifact_store,
+        ttl: int = ARTIFACT_TTL,
+        quota_bytes: int = ARTIFACT_DISK_QUOTA_BYTES,
+        interval: int = ARTIFACT_SWEEP_INTERVAL,
+    ) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.quota_bytes = quota_bytes
+        self.interval = interval
+        self._lock = threading.Lock()
+        # owners are weakly referenced, e.g. graphs created on every UI rerun
+        self._sources: list[tuple[weakref.ref, Callable[[Any], Iterable[str]]]] = []
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.disk_bytes = 0
+        self.evicted_bytes = 0
+        self.evicted = 0
+        self.expired = 0
+        self.sweeps = 0
+
+    def watch(self, owner: Any, references: Callable[[Any], Iterable[str]]) -> None:
+        """Keeps the artifacts `references(owner)` returns while `owner` is alive.
+
+        References are `artifact://` references or file paths, read on every sweep,
+        so `references` must be cheap: owners track their live artifacts. The
+        background sweeper is started with the first owner.
+        """
+        with self._lock:
+            if not any(source[0]() is owner for source in self._sources):
+                self._sources.append((weakref.ref(owner), references))
+        self.start()
+
+    def referenced(self) -> tuple[set[str], set[Path]]:
+        """Keys and file paths of the artifacts in use"""
+        with self._lock:
+            self._sources = [
+                source for source in self._sources if source[0]() is not None
+            ]
+            sources = list(self._sources)
+
+        keys = set()
+        paths = set()
+        for owner_ref, references in sources:
+            owner = owner_ref()
+            if owner is None:
+                continue
+            for reference in references(owner):
+                if is_artifact_ref(reference):
+                    keys.add(_artifact_key(reference))
+                elif reference:
+                    paths.add(Path(reference).resolve())
+        return keys, paths
+
+    def sweep(self) -> dict[str, int]:
+        """Deletes the expired and least recently used artifacts, returns the stats"""
+        keys, paths = self.referenced()
+        now = time.time()
+
+        owners = {}
+        for key, entry in self.store.items():
+            path = entry.path.resolve() if entry.path is not None else None
+            if key in keys or path in paths:
+                if path is not None:
+                    paths.add(path)
+                continue
+            if path is not None:
+                owners[path] = (key, entry.accessed)
+            elif self.ttl > 0 and now - entry.accessed > self.ttl:
+                # in memory only
+                freed = self.store.evict(key)
+                if freed is not None:
+                    self.evicted_bytes += freed
+                    self.evicted += 1
+                    self.expired += 1
+
+        files = []
+        for path in self.store.spill_dir.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_file():
+                continue
+            path = path.resolve()
+            key, accessed = owners.get(path, (None, stat.st_mtime))
+            files.append((max(accessed, stat.st_mtime), path, key, stat.st_size))
+
+        self.disk_bytes = sum(size for *_, size in files)
+        for accessed, path, key, size in sorted(files, key=lambda file: file[:2]):
+            if path in paths:
+                continue
+            expired = self.ttl > 0 and now - accessed > self.ttl
+            if not expired and (
+                self.quota_bytes <= 0 or self.disk_bytes <= self.quota_bytes
+            ):
+                continue
+            if key is not None:
+                freed = self.store.evict(key)
+                if freed is None:
+                    # pinned since the snapshot
+                    continue
+                self.evicted_bytes += freed
+            path.unlink(missing_ok=True)
+            self.disk_bytes -= size
+            self.evicted_bytes += size
+            self.evicted += 1
+            self.expired += expired
+
+        self.sweeps += 1
+        return self.stats()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception:
+                logger.exception("Artifact sweep failed")
+
+    def start(self) -> None:
+        """Starts the background sweeper, unless the interval is 0"""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="artifact-collector", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "disk_bytes": self.disk_bytes,
+            "memory_bytes": self.store.bytes,
+            "quota_bytes": self.quota_bytes,
+            "evicted_bytes": self.evicted_bytes,
+            "evicted": self.evicted,
+            "expired": self.expired,
+            "sweeps": self.sweeps,
+        }
+
+
+artifact_collector = ArtifactCollector()
@@ -0,0 +1,299 @@
+import hashlib
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import pandas as pd
+from dotenv import load_dotenv
+from pandas import DataFrame
+
+from .artifacts import artifact_format_of, load_artifact, save_artifact
+from .cache import normalize_sql
+from .engine import DATABASE_URL, engine_registry
+
+load_dotenv()
+
+# memory budget of the artifacts kept in process, the least recently used ones are
+# spilled to disk above it, 0 keeps every artifact on disk
+ARTIFACT_STORE_MAX_BYTES = int(
+    os.getenv("ARTIFACT_STORE_MAX_BYTES", str(256 * 1024**2))
+)
+# folder of the artifact files, the spilled artifacts and the plots, which are
+# deleted by the artifact collector
+ARTIFACT_SPILL_DIR = os.getenv("ARTIFACT_SPILL_DIR", "/tmp/plot_agent")
+
+ARTIFACT_PREFIX = "artifact://"
+
+# pandas 3 always copies on write, a shallow copy can't modify the stored frame
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+def is_artifact_ref(path: str | None) -> bool:
+    return isinstance(path, str) and path.startswith(ARTIFACT_PREFIX)
+
+
+def _artifact_key(key_or_ref: str) -> str:
+    return key_or_ref.removeprefix(ARTIFACT_PREFIX)
+
+
+def artifact_ref(key: str) -> str:
+    return f"{ARTIFACT_PREFIX}{key}"
+
+
+def content_digest(*parts: str) -> str:
+    return hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def data_key(query: str, url: str | None = None) -> str:
+    """Content address of the result of `query`, the same for every session.
+
+    It hashes the normalized query and the database version, so a modified
+    database never serves the data of the previous version.
+    """
+    url = url or DATABASE_URL
+    version = engine_registry.version(url)
+    return f"data_{content_digest(normalize_sql(query), url, repr(version))}"
+
+
+@dataclass
+class StoredArtifact:
+    """Data frame or image of a request, in memory or spilled to `path`"""
+
+    value: DataFrame | bytes | None
+    nbytes: int
+    is_frame: bool
+    # file the artifact can be read back from, e.g. the plot written by the agent
+    path: Path | None = None
+    # the file was written by the store and is removed with the artifact
+    spilled: bool = False
+    refs: int = 0
+    # wall-clock time of the last put/get, comparable to file modification times
+    accessed: float = field(default_factory=time.time)
+    # kept with the artifact, e.g. how the data was compacted
+    info: Any = None
+
+
+class ArtifactStore:
+    """Process-wide store of the data and plots handed between the workflow nodes.
+
+    Query results are keyed by their content, see `data_key`, and shared by every
+    session running the same query, plots by the request unique id, e.g.
+    `plot_<uid>`. They are passed around as `artifact://<key>` references, so the
+    plot agent and the plot summary read them from memory instead of a file. Artifacts in use are pinned with
+    `acquire`/`release`, the others are spilled to disk when the memory budget is
+    exceeded and read back on the next `get`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = ARTIFACT_STORE_MAX_BYTES,
+        spill_dir: str = ARTIFACT_SPILL_DIR,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir)
+        # the plot agent saves its plots there too
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        # reentrant, reading a spilled artifact back may spill others
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, StoredArtifact] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.spills = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _size(value: DataFrame | bytes) -> int:
+        if isinstance(value, DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        return len(value)
+
+    def _spill(self, key: str, entry: StoredArtifact) -> None:
+        if entry.path is None:
+            if entry.is_frame:
+                entry.path = save_artifact(entry.value, self.spill_dir / key)
+            else:
+                entry.path = self.spill_dir / key
+                entry.path.write_bytes(entry.value)
+            entry.spilled = True
+        self.bytes -= entry.nbytes
+        entry.value = None
+        self.spills += 1
+
+    def _evict(self, keep: str | None = None) -> None:
+        """Spills the least recently used unpinned artifacts until under the budget"""
+        for key, entry in list(self._entries.items()):
+            if self.bytes <= self.max_bytes:
+                return
+            if key != keep and entry.value is not None and entry.refs == 0:
+                self._spill(key, entry)
+
+    def __contains__(self, key_or_ref: str) -> bool:
+        return _artifact_key(key_or_ref) in self._entries
+
+    def put(
+        self,
+        key: str,
+        value: DataFrame | bytes,
+        path: str | Path | None = None,
+        info: Any = None,
+    ) -> str:
+        """Stores `value` under `key`, replacing the previous artifact, returns its reference.
+
+        `path` is a file holding the same value, it's read back instead of spilling.
+        Pins of the replaced artifact are kept.
+        """
+        key = _artifact_key(key)
+        with self._lock:
+            previous = self._entries.get(key)
+            self.discard(key)
+            entry = StoredArtifact(
+                value=value,
+                nbytes=self._size(value),
+                is_frame=isinstance(value, DataFrame),
+                path=Path(path) if path is not None else None,
+                refs=previous.refs if previous is not None else 0,
+                info=info,
+            )
+            self._entries[key] = entry
+            self.bytes += entry.nbytes
+            self._evict()
+        return artifact_ref(key)
+
+    def lookup(
+        self, key_or_ref: str, copy: bool = True
+    ) -> tuple[DataFrame | bytes, Any] | None:
+        """Value and info of an artifact, None when it doesn't exist.
+
+        A single call, the collector may delete the artifact between a `in` check and
+        a `get`. Frames are copied unless `copy` is False, see `get`.
+        """
+        key = _artifact_key(key_or_ref)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            entry.accessed = time.time()
+            if entry.value is not None:
+                self.hits += 1
+            else:
+                if entry.is_frame:
+                    entry.value = load_artifact(entry.path)
+                else:
+                    entry.value = entry.path.read_bytes()
+                self.bytes += entry.nbytes
+                self.reloads += 1
+                self._evict(keep=key)
+            value = entry.value
+        if copy and entry.is_frame:
+            return value.copy(deep=not _COPY_ON_WRITE), entry.info
+        return value, entry.info
+
+    def get(self, key_or_ref: str, copy: bool = True) -> DataFrame | bytes:
+        """Returns the stored value, frames are copied unless `copy` is False.
+
+        Stored frames are shared by every session using the same data, the copy keeps
+        in-place changes, e.g. by the code of the plot agent, to the caller. Without it
+        the frame must not be modified.
+        """
+        found = self.lookup(key_or_ref, copy)
+        if found is None:
+            raise KeyError(f"Artifact {_artifact_key(key_or_ref)!r} not found")
+        return found[0]
+
+    def info(self, key_or_ref: str) -> Any:
+        with self._lock:
+            return self._entries[_artifact_key(key_or_ref)].info
+
+    def read_image(self, key: str, path: str) -> bytes:
+        """Bytes of the image file `path`, read once and then served from memory"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.path != Path(path):
+                self.put(key, Path(path).read_bytes(), path=path)
+            return self.get(key)
+
+    def acquire(self, key_or_ref: str) -> None:
+        """Pins an artifact in memory until it's released"""
+        with self._lock:
+            self._entries[_artifact_key(key_or_ref)].refs += 1
+
+    def release(self, key_or_ref: str) -> None:
+        with self._lock:
+            entry = self._entries.get(_artifact_key(key_or_ref))
+            if entry is not None and entry.refs > 0:
+                entry.refs -= 1
+                self._evict()
+
+    @contextmanager
+    def pinned(self, path: str | None) -> Iterator[None]:
+        """Pins the artifact referenced by `path` while in the block, files are left as is"""
+        if not is_artifact_ref(path) or _artifact_key(path) not in self._entries:
+            yield
+            return
+        self.acquire(path)
+        try:
+            yield
+        finally:
+            self.release(path)
+
+    def load(self, path: str) -> DataFrame:
+        """Data of an artifact reference or a data file"""
+        if is_artifact_ref(path):
+            return self.get(path)
+        return load_artifact(path)
+
+    def load_code(self, path: str) -> str:
+        """Python code loading an artifact reference or a data file into `df`"""
+        if is_artifact_ref(path):
+            # a copy, the code modifying `df` must not modify the data of other sessions
+            return f"from src.tools import artifact_store\ndf = artifact_store.get({path!r})"
+        return artifact_format_of(path).load_code(Path(path))
+
+    def discard(self, key_or_ref: str) -> None:
+        """Removes an artifact and its spilled file, files it was read from are kept"""
+        key = _artifact_key(key_or_ref)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return
+            if entry.value is not None:
+                self.bytes -= entry.nbytes
+            if entry.spilled:
+                entry.path.unlink(missing_ok=True)
+
+    def evict(self, key_or_ref: str) -> int | None:
+        """Discards an unpinned artifact, returns the freed memory bytes, None if pinned"""
+        key = _artifact_key(key_or_ref)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refs > 0:
+                return None
+            freed = entry.nbytes if entry.value is not None else 0
+            self.discard(key)
+            return freed
+
+    def items(self) -> list[tuple[str, StoredArtifact]]:
+        """Snapshot of the artifacts, least recently used first"""
+        with self._lock:
+            return list(self._entries.items())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "spilled": sum(entry.value is None for entry in self._entries.values()),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "spills": self.spills,
+            "reloads": self.reloads,
+        }
+
+
+artifact_store = ArtifactStore()
@@ -0,0 +1,122 @@
+import os
+import pickle
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+from dotenv import load_dotenv
+from pandas import DataFrame
+
+load_dotenv()
+
+# format of the data files handed from the data extraction to the plot agent
+ARTIFACT_FORMAT = os.getenv("ARTIFACT_FORMAT", "feather")
+# compression of the feather files: uncompressed, lz4 or zstd, only uncompressed
+# files are read zero-copy from a memory map
+ARTIFACT_COMPRESSION = os.getenv("ARTIFACT_COMPRESSION", "uncompressed")
+
+
+class ArtifactFormat(ABC):
+    """Serialization of the DataFrames saved for the plot agent"""
+
+    name: str
+    suffix: str
+
+    @abstractmethod
+    def write(self, data: DataFrame, path: Path) -> None: ...
+
+    @abstractmethod
+    def read(self, path: Path) -> DataFrame: ...
+
+    @abstractmethod
+    def load_code(self, path: Path) -> str:
+        """Python code loading the file into `df`, given to the plot agent"""
+
+
+class PickleFormat(ArtifactFormat):
+    """Pickled DataFrame, the fallback for frames Arrow can't represent"""
+
+    name = "pickle"
+    suffix = ".pkl"
+
+    def write(self, data: DataFrame, path: Path) -> None:
+        with open(path, "wb") as file:
+            pickle.dump(data, file)
+
+    def read(self, path: Path) -> DataFrame:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    def load_code(self, path: Path) -> str:
+        return f"import pandas as pd\ndf = pd.read_pickle({str(path)!r})"
+
+
+class FeatherFormat(ArtifactFormat):
+    """Arrow IPC file, memory-mapped on read"""
+
+    name = "feather"
+    suffix = ".feather"
+
+    def __init__(self, compression: str = ARTIFACT_COMPRESSION) -> None:
+        self.compression = compression
+
+    def write(self, data: DataFrame, path: Path) -> None:
+        feather.write_feather(data, path, compression=self.compression)
+
+    def read(self, path: Path) -> DataFrame:
+        return feather.read_table(path, memory_map=True).to_pandas()
+
+    def load_code(self, path: Path) -> str:
+        return (
+            "import pyarrow.feather as feather\n"
+            f"df = feather.read_table({str(path)!r}, memory_map=True).to_pandas()"
+        )
+
+
+ARTIFACT_FORMATS: dict[str, type[ArtifactFormat]] = {
+    PickleFormat.name: PickleFormat,
+    FeatherFormat.name: FeatherFormat,
+}
+
+
+def get_artifact_format(name: str = ARTIFACT_FORMAT) -> ArtifactFormat:
+    if name not in ARTIFACT_FORMATS:
+        raise ValueError(
+            f"Unknown artifact format {name!r}, expected one of {list(ARTIFACT_FORMATS)}"
+        )
+    return ARTIFACT_FORMATS[name]()
+
+
+def artifact_format_of(path: str | Path) -> ArtifactFormat:
+    """Format of a saved file, by its suffix"""
+    suffix = Path(path).suffix
+    for artifact_format in ARTIFACT_FORMATS.values():
+        if artifact_format.suffix == suffix:
+            return artifact_format()
+    raise ValueError(f"Unknown artifact file type {suffix!r}")
+
+
+def save_artifact(
+    data: DataFrame, path: str | Path, artifact_format: ArtifactFormat | None = None
+) -> Path:
+    """Saves `data` to `path` with the suffix of the format, returns the file path.
+
+    Frames Arrow can't represent, e.g. duplicated column names or columns mixing
+    types, are pickled instead.
+    """
+    artifact_format = artifact_format or get_artifact_format()
+    path = Path(path).with_suffix(artifact_format.suffix)
+    try:
+        artifact_format.write(data, path)
+    except (pa.ArrowException, ValueError):
+        if isinstance(artifact_format, PickleFormat):
+            raise
+        path.unlink(missing_ok=True)
+        return save_artifact(data, path, PickleFormat())
+    return path
+
+
+def load_artifact(path: str | Path) -> DataFrame:
+    return artifact_format_of(path).read(Path(path))
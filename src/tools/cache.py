@@ -0,0 +1,231 @@
+import os
+import re
+import threading
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from dotenv import load_dotenv
+from pandas import DataFrame
+
+from .engine import DatabaseVersion, engine_registry
+
+load_dotenv()
+
+T = TypeVar("T")
+
+# memory budget of the cached query results, 0 disables the cache
+RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024**2)))
+
+# plots kept for their data and plot instructions, 0 disables the cache
+PLOT_CACHE_MAX_ENTRIES = int(os.getenv("PLOT_CACHE_MAX_ENTRIES", "256"))
+
+# string literals and quoted identifiers are kept verbatim when normalizing SQL
+_SQL_TOKEN = re.compile(
+    r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])|(\s+)|([^'"`\[\s]+)"""
+)
+
+
+def normalize_sql(query: str) -> str:
+    """Collapses whitespace and lowercases keywords and identifiers, but not quoted text"""
+    parts = []
+    for quoted, _space, word in _SQL_TOKEN.findall(query.strip().rstrip(";").strip()):
+        if quoted:
+            parts.append(quoted)
+        elif word:
+            parts.append(word.lower())
+        else:
+            parts.append(" ")
+    return "".join(parts)
+
+
+class SchemaCache:
+    """Process-wide cache of schema information, e.g. the rendered schema prompt.
+
+    Entries are shared by every session and invalidated when the sqlite `schema_version`
+    or the database file modification time changes.
+    """
+
+    def __init__(self) -> None:
+        # reentrant, rendering an entry may read other entries, e.g. the columns
+        self._lock = threading.RLock()
+        self._entries: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _cache_key(version: DatabaseVersion) -> tuple[int, int]:
+        return version.mtime_ns, version.schema_version
+
+    def get(self, url: str, render: Callable[[], T], name: str = "prompt") -> T:
+        """Returns the cached `name` entry of `url`, calling `render` when it is stale"""
+        key = self._cache_key(engine_registry.version(url))
+
+        entry = self._entries.get((url, name))
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get((url, name))
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            value = render()
+            self._entries[(url, name)] = (key, value)
+            return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ResultCache:
+    """Process-wide LRU cache of query results with a memory budget.
+
+    Keys are the normalized SQL plus the database version, so results are
+    never served after the database has been modified.
+    """
+
+    def __init__(self, max_bytes: int = RESULT_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            tuple[str, str, DatabaseVersion], tuple[DataFrame, int]
+        ] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def is_cacheable(query: str) -> bool:
+        return normalize_sql(query).startswith(("select", "with"))
+
+    def _evict(self) -> None:
+        while self.bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def get(
+        self, query: str, url: str, execute: Callable[[str], DataFrame]
+    ) -> DataFrame:
+        """Returns the result of `query`, calling `execute` on a cache miss"""
+        if self.max_bytes <= 0 or not self.is_cacheable(query):
+            return execute(query)
+
+        key = (normalize_sql(query), url, engine_registry.version(url))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # callers own the returned frame, never hand out the cached one
+                return entry[0].copy()
+            self.misses += 1
+
+        data = execute(query)
+        size = int(data.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return data
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (data.copy(), size)
+                self.bytes += size
+                self._evict()
+        return data
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+class PlotCache:
+    """Process-wide LRU cache of the plots and summaries made from the data artifacts.
+
+    Data artifacts are content addressed, see `data_key`, so plotting the same data
+    with the same instructions again, e.g. in another session, reuses the plot and
+    its summary instead of calling the agents. Plots deleted from disk are misses.
+    """
+
+    def __init__(self, max_entries: int = PLOT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[str, str, str]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _cache_key(data_path: str, data_query: str) -> tuple[str, str]:
+        return data_path, " ".join(data_query.lower().split())
+
+    def get(
+        self, data_path: str | None, data_query: str
+    ) -> tuple[str, str, str] | None:
+        """Path, caption and summary of the plot of the same data and instructions"""
+        if self.max_entries <= 0 or not data_path:
+            return None
+        key = self._cache_key(data_path, data_query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and Path(entry[0]).is_file():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        data_path: str | None,
+        data_query: str,
+        plot_path: str | None,
+        caption: str,
+        summary: str,
+    ) -> None:
+        if self.max_entries <= 0 or not data_path or not plot_path:
+            return
+        with self._lock:
+            self._entries[self._cache_key(data_path, data_query)] = (
+                plot_path,
+                caption,
+                summary,
+            )
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+schema_cache = SchemaCache()
+result_cache = ResultCache()
+plot_cache = PlotCache()
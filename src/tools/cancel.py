@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+
+
+class QueryCancelledError(Exception):
+    """Raised when a running query is cancelled"""
+
+
+class QueryTimeoutError(QueryCancelledError):
+    """Raised when a running query exceeds its timeout"""
+
+
+class CancellationToken:
+    """Cancels the queries running on the connections attached to it"""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._connections: set[sqlite3.Connection] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+        with self._lock:
+            for connection in self._connections:
+                connection.interrupt()
+
+    def attach(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            self._connections.add(connection)
+
+    def detach(self, connection: sqlite3.Connection) -> None:
+        # detached under the lock, a pooled connection must never be interrupted
+        # once it has been returned to the pool
+        with self._lock:
+            self._connections.discard(connection)
+
+
+class CancellationRegistry:
+    """Tokens of the running queries keyed by the user's unique id"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: dict[str, CancellationToken] = {}
+
+    def start(self, key: str) -> CancellationToken:
+        token = CancellationToken()
+        with self._lock:
+            self._tokens[key] = token
+        return token
+
+    def finish(self, key: str, token: CancellationToken) -> None:
+        with self._lock:
+            if self._tokens.get(key) is token:
+                del self._tokens[key]
+
+    def cancel(self, key: str) -> bool:
+        """Cancels the running query of `key`, returns whether there was one"""
+        with self._lock:
+            token = self._tokens.get(key)
+        if token is None:
+            return False
+        token.cancel()
+        return True
+
+
+cancellation_registry = CancellationRegistry()
@@ -0,0 +1,91 @@
+import os
+
+import numpy as np
+from dotenv import load_dotenv
+from pandas import DataFrame, Series, to_numeric
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+from pydantic import BaseModel
+
+load_dotenv()
+
+DTYPE_COMPACTION_ENABLED = (
+    os.getenv("DTYPE_COMPACTION_ENABLED", "True").lower() == "true"
+)
+# string columns with at most this share of distinct values become categories
+CATEGORY_MAX_RATIO = 0.5
+
+
+class DtypeCompaction(BaseModel):
+    """Dtypes changed to shrink the query result"""
+
+    original_bytes: int = 0
+    bytes: int = 0
+    # old and new dtype of the changed columns
+    columns: dict[str, str] = {}
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.bytes
+
+
+def _is_boolean(column: Series) -> bool:
+    values = column.dropna()
+    return len(values) > 0 and values.map(type).isin((bool, np.bool_)).all()
+
+
+def compact_column(column: Series) -> Series:
+    """Smallest dtype representing every value of `column` as is"""
+    if is_bool_dtype(column) or column.dtype == "category":
+        return column
+    if is_integer_dtype(column):
+        return to_numeric(column, downcast="integer")
+    if is_float_dtype(column):
+        # only when lossless, e.g. prices, not averages
+        compacted = column.astype(np.float32)
+        if np.array_equal(compacted.to_numpy(), column.to_numpy(), equal_nan=True):
+            return compacted
+        return column
+    if is_object_dtype(column) or is_string_dtype(column):
+        if _is_boolean(column):
+            return column.astype("boolean")
+        compacted = column.astype("category")
+        if len(compacted.cat.categories) <= CATEGORY_MAX_RATIO * len(column):
+            return compacted
+    return column
+
+
+def compact_frame(data: DataFrame) -> tuple[DataFrame, DtypeCompaction]:
+    """Converts the columns of a query result to smaller dtypes, reporting the bytes saved.
+
+    Numeric columns are downcast, low cardinality strings become categories and
+    object columns of booleans become booleans. Values are kept as is: a column is
+    only converted when the new dtype represents all of them. Enum columns are
+    categories already, see `typed_array`.
+    """
+    original_bytes = int(data.memory_usage(index=True, deep=True).sum())
+    if not DTYPE_COMPACTION_ENABLED:
+        return data, DtypeCompaction(
+            original_bytes=original_bytes, bytes=original_bytes
+        )
+
+    compacted = data.copy(deep=False)
+    columns = {}
+    # positionally, results may have duplicated column names
+    for position, name in enumerate(data.columns):
+        column = data.iloc[:, position]
+        converted = compact_column(column)
+        if converted.dtype != column.dtype:
+            compacted.isetitem(position, converted)
+            columns[str(name)] = f"{column.dtype} -> {converted.dtype}"
+
+    return compacted, DtypeCompaction(
+        original_bytes=original_bytes,
+        bytes=int(compacted.memory_usage(index=True, deep=True).sum()),
+        columns=columns,
+    )
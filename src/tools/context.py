@@ -0,0 +1,213 @@
+import os
+import re
+
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+from .cache import schema_cache
+from .cube import CUBE_PREFIX
+from .engine import DATABASE_URL
+from .schema import (
+    ColumnInfo,
+    DIMENSION_PREFIX,
+    FACT_PREFIX,
+    get_columns,
+    get_tables,
+)
+
+load_dotenv()
+
+# approximate tokens of the schema given to the LLM, 0 disables the budget
+SCHEMA_TOKEN_BUDGET = int(os.getenv("SCHEMA_TOKEN_BUDGET", "1000"))
+
+# bookkeeping tables of the incremental loads of `scripts/create_db.py`
+METADATA_PREFIX = "meta__"
+
+_WORD = re.compile(r"[a-z0-9]+")
+_SQL_TYPES = {
+    "integer": "INTEGER",
+    "float": "REAL",
+    "boolean": "BOOLEAN",
+    "enum": "TEXT",
+    "string": "TEXT",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of `text`, about 4 characters per token"""
+    return len(text) // 4 + 1
+
+
+def stem(word: str) -> str:
+    """Crude plural stemming, enough to match `categories` to `category`"""
+    if word.endswith("ies") and len(word) > 4:
+        return f"{word[:-3]}y"
+    if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+        return word[:-1]
+    return word
+
+
+def words(text: str) -> set[str]:
+    """Stemmed words of `text`, identifiers are split on underscores"""
+    return {stem(word) for word in _WORD.findall(text.lower().replace("_", " "))}
+
+
+def prefix_index(question: set[str]) -> dict[str, list[str]]:
+    """Words of the question by their first 4 characters, see `match_score`"""
+    prefixes: dict[str, list[str]] = {}
+    for word in question:
+        if len(word) >= 4:
+            prefixes.setdefault(word[:4], []).append(word)
+    return prefixes
+
+
+def match_score(
+    terms: set[str],
+    question: set[str],
+    prefixes: dict[str, list[str]] | None = None,
+) -> int:
+    """Number of `terms` found in the question, a shared prefix of 4+ characters matches"""
+    # words sharing a prefix of 4+ characters share their first 4 characters
+    prefixes = prefix_index(question) if prefixes is None else prefixes
+    score = 0
+    for term in terms:
+        if term in question or any(
+            term.startswith(word) or word.startswith(term)
+            for word in prefixes.get(term[:4], ())
+            if len(term) >= 4
+        ):
+            score += 1
+    return score
+
+
+def render_column(column: ColumnInfo) -> str:
+    line = f"{column.name} {_SQL_TYPES[column.kind]}"
+    if column.primary_key:
+        line += " PRIMARY KEY"
+    elif not column.nullable:
+        line += " NOT NULL"
+    if column.values:
+        line += f" IN ({', '.join(repr(value) for value in column.values)})"
+    return line
+
+
+@dataclass
+class RenderedTable:
+    """Question independent rendering of a table, only ranked per question"""
+
+    name: str
+    header: str
+    # `name TYPE` line of every column, in table order
+    lines: dict[str, str]
+    block: str
+    cost: int
+    table_words: set[str]
+    # stemmed words of the name and of the values of every column
+    column_words: dict[str, tuple[set[str], set[str]]]
+
+
+def render_tables(url: str | None = None) -> list[RenderedTable]:
+    """Renders the tables given to the LLM, cached until the schema changes"""
+    url = url or DATABASE_URL
+
+    def render() -> list[RenderedTable]:
+        tables = []
+        for table in get_tables(url):
+            # cubes are used transparently by `route_query`, dictionary encoded
+            # tables through their view
+            if table.startswith(
+                (CUBE_PREFIX, METADATA_PREFIX, FACT_PREFIX, DIMENSION_PREFIX)
+            ):
+                continue
+            columns = get_columns(table, url)
+            header = f"Table {table}:"
+            lines = {name: render_column(column) for name, column in columns.items()}
+            block = "\n".join([header, *lines.values()])
+            tables.append(
+                RenderedTable(
+                    name=table,
+                    header=header,
+                    lines=lines,
+                    block=block,
+                    cost=estimate_tokens(block),
+                    table_words=words(table),
+                    column_words={
+                        name: (words(name), words(" ".join(column.values)))
+                        for name, column in columns.items()
+                    },
+                )
+            )
+        return tables
+
+    return schema_cache.get(url, render, name="schema_tables")
+
+
+def score_columns(table: RenderedTable, question: set[str]) -> dict[str, int]:
+    """Relevance of every column, matches of its name weigh more than matches of its values"""
+    prefixes = prefix_index(question)
+    return {
+        name: 2 * match_score(name_words, question, prefixes)
+        + match_score(value_words, question, prefixes)
+        for name, (name_words, value_words) in table.column_words.items()
+    }
+
+
+def build_schema_context(
+    question: str = "", url: str | None = None, budget: int = SCHEMA_TOKEN_BUDGET
+) -> str:
+    """Renders a compact schema of the tables relevant to `question` as context for the LLM.
+
+    Every column is a `name TYPE` line with the allowed values of enum columns. Tables
+    and columns are ranked by their lexical overlap with the question and the lowest
+    ranked ones are left out once the rendered schema exceeds `budget` tokens. The
+    rendering is cached, only the ranking is done per question.
+    """
+    question_words = words(question)
+
+    tables = []
+    for table in render_tables(url):
+        scores = score_columns(table, question_words)
+        score = 3 * match_score(table.table_words, question_words) + sum(
+            scores.values()
+        )
+        tables.append((score, table, scores))
+    tables.sort(key=lambda item: (-item[0], item[1].name))
+
+    blocks = []
+    used = 0
+    for score, table, scores in tables:
+        if budget <= 0 or used + table.cost <= budget:
+            blocks.append(table.block)
+            used += table.cost
+            continue
+        if blocks and score == 0:
+            break
+
+        # the most relevant columns that fit, in their table order
+        used += estimate_tokens(table.header)
+        ranked = sorted(table.lines, key=lambda name: -scores[name])
+        kept = set()
+        for name in ranked:
+            line_cost = estimate_tokens(table.lines[name])
+            if kept and (used + line_cost > budget or not scores[name]):
+                break
+            kept.add(name)
+            used += line_cost
+        omitted = len(table.lines) - len(kept)
+        blocks.append(
+            "\n".join(
+                [
+                    table.header,
+                    *(line for name, line in table.lines.items() if name in kept),
+                    f"({omitted} less relevant columns omitted)",
+                ]
+            )
+        )
+        if used >= budget:
+            break
+
+    omitted_tables = len(tables) - len(blocks)
+    if omitted_tables:
+        blocks.append(f"({omitted_tables} less relevant tables omitted)")
+    return "\n\n".join(blocks)
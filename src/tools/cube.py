@@ -0,0 +1,216 @@
+import os
+import re
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from .cache import schema_cache
+from .engine import DATABASE_URL, engine_registry, is_duckdb_url
+from .guard import get_row_counts
+
+load_dotenv()
+
+CUBE_ROUTING_ENABLED = os.getenv("CUBE_ROUTING_ENABLED", "True").lower() == "true"
+
+# cube tables are built by `scripts/create_db.py --cube_dimensions N` and named
+# after their dimensions, e.g. `cube__gender__season`
+CUBE_PREFIX = "cube__"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_QUERY = re.compile(
+    r"""^\s*select\s+(?P<select>.+?)
+    \s+from\s+purchases
+    (?:\s+where\s+(?P<where>.+?))?
+    (?:\s+group\s+by\s+(?P<group>.+?))?
+    (?:\s+having\s+(?P<having>.+?))?
+    (?:\s+order\s+by\s+(?P<order>.+?))?
+    (?:\s+(?P<limit>limit\s+\d+(?:\s+offset\s+\d+)?))?
+    \s*;?\s*$""",
+    re.S | re.X,
+)
+_UNSUPPORTED = re.compile(
+    r"\b(select|join|union|intersect|except|distinct|over)\b|[\"`\[*]"
+)
+_AGGREGATE_CALL = re.compile(r"\b(count|sum|total|avg|min|max)\s*\(\s*(\*|\w+)\s*\)")
+_IDENTIFIER = re.compile(r"(?<![\w.])([a-z_]\w*)\b(?!\s*\()")
+_ALIAS = re.compile(r"\s+as\s+(\w+)\s*$")
+_KEYWORDS = {
+    "and", "or", "not", "in", "is", "null", "like", "glob", "between", "escape",
+    "asc", "desc", "nulls", "first", "last", "case", "when", "then", "else", "end",
+    "as", "collate", "nocase", "true", "false", "integer", "real", "text",
+}  # fmt: skip
+
+
+def get_cubes(url: str | None = None) -> dict[str, tuple[frozenset[str], set[str]]]:
+    """Gets the cube tables with their dimensions and aggregate columns"""
+    url = url or DATABASE_URL
+
+    def render() -> dict[str, tuple[frozenset[str], set[str]]]:
+        cubes = {}
+        with engine_registry.connect(url) as conn:
+            tables = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table'")
+            ).scalars()
+            for table in list(tables):
+                if not table.startswith(CUBE_PREFIX):
+                    continue
+                dimensions = frozenset(table[len(CUBE_PREFIX) :].split("__"))
+                columns = {
+                    row[1]
+                    for row in conn.execute(text(f'PRAGMA table_info("{table}")'))
+                }
+                cubes[table] = (dimensions, columns - dimensions)
+        return cubes
+
+    return schema_cache.get(url, render, name="cubes")
+
+
+def _mask(query: str) -> str:
+    """Lowercases `query` and blanks string literals, keeping every offset unchanged"""
+    return _STRING_LITERAL.sub(
+        lambda literal: "'" + "_" * (len(literal.group()) - 2) + "'", query
+    ).lower()
+
+
+def _split_items(masked: str) -> list[tuple[int, int]]:
+    """Spans of the top level comma separated items"""
+    spans = []
+    depth = 0
+    start = 0
+    for position, char in enumerate(masked):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            spans.append((start, position))
+            start = position + 1
+    spans.append((start, len(masked)))
+    return spans
+
+
+def _rewrite_aggregates(original: str, masked: str, measures: set[str]) -> str | None:
+    """Replaces aggregates of the base table by re-aggregations of the cube columns"""
+    parts = []
+    position = 0
+    for call in _AGGREGATE_CALL.finditer(masked):
+        function, argument = call.groups()
+        if argument == "*" and function == "count":
+            # COUNT is 0 on no rows, SUM is NULL
+            replacement = "COALESCE(SUM(row_count), 0)"
+        elif f"sum_{argument}" not in measures:
+            return None
+        elif function == "count":
+            replacement = f"COALESCE(SUM(count_{argument}), 0)"
+        elif function in ("sum", "total"):
+            replacement = f"{function.upper()}(sum_{argument})"
+        elif function == "avg":
+            replacement = f"(SUM(sum_{argument}) * 1.0 / SUM(count_{argument}))"
+        else:
+            replacement = f"{function.upper()}({function}_{argument})"
+        parts.append(original[position : call.start()])
+        parts.append(replacement)
+        position = call.end()
+    parts.append(original[position:])
+    return "".join(parts)
+
+
+def _identifiers(masked: str) -> set[str]:
+    """Column names referenced by a clause, aggregate calls and keywords excluded"""
+    without_aggregates = _AGGREGATE_CALL.sub("0", _STRING_LITERAL.sub("''", masked))
+    return set(_IDENTIFIER.findall(without_aggregates)) - _KEYWORDS
+
+
+def route_query(query: str, url: str | None = None) -> str:
+    """Rewrites an aggregate query on purchases to read from the smallest matching cube.
+
+    Only single table `SELECT ... FROM purchases [WHERE] [GROUP BY] [HAVING] [ORDER BY]
+    [LIMIT]` queries using COUNT/SUM/TOTAL/AVG/MIN/MAX over the cube measures and
+    filtering/grouping by cube dimensions are routed, anything else is returned as is.
+    """
+    if not CUBE_ROUTING_ENABLED or is_duckdb_url(url or DATABASE_URL):
+        return query
+
+    masked = _mask(query)
+    match = _QUERY.match(masked)
+    if match is None:
+        return query
+    # no subqueries, COUNT(*) is the only allowed `*`
+    body = masked[match.start("select") :].replace("count(*)", "count(_)")
+    if _UNSUPPORTED.search(body):
+        return query
+    cubes = get_cubes(url)
+    if not cubes:
+        return query
+
+    clauses = {
+        name: (query[match.start(name) : match.end(name)], match.group(name))
+        for name in ("select", "where", "group", "having", "order", "limit")
+        if match.group(name) is not None
+    }
+
+    select_original, select_masked = clauses["select"]
+    items = []
+    aliases = set()
+    dimensions = set()
+    for start, end in _split_items(select_masked):
+        item_original = select_original[start:end].strip()
+        item_masked = select_masked[start:end].strip()
+        if alias := _ALIAS.search(item_masked):
+            aliases.add(alias.group(1))
+            item_masked = item_masked[: alias.start()]
+        if _AGGREGATE_CALL.search(item_masked):
+            items.append((item_original, item_masked, alias is not None))
+        else:
+            # plain dimensions are only valid when grouped
+            if "group" not in clauses:
+                return query
+            items.append((item_original, item_masked, True))
+        dimensions |= _identifiers(item_masked)
+
+    for name in ("where", "group"):
+        if name in clauses:
+            dimensions |= _identifiers(clauses[name][1])
+    referenced = set()
+    for name in ("having", "order"):
+        if name in clauses:
+            referenced |= _identifiers(clauses[name][1])
+    dimensions |= referenced - aliases
+
+    row_counts = get_row_counts(url)
+    candidates = [
+        (row_counts.get(table, 0), table)
+        for table, (cube_dimensions, _) in cubes.items()
+        if dimensions <= cube_dimensions
+    ]
+    if not candidates:
+        return query
+    _, cube = min(candidates)
+    measures = cubes[cube][1]
+
+    select = []
+    for item_original, item_masked, has_alias in items:
+        rewritten = _rewrite_aggregates(item_original, item_masked, measures)
+        if rewritten is None:
+            return query
+        if not has_alias:
+            # keep the column name the query had on the base table
+            escaped = item_original.replace('"', '""')
+            rewritten = f'{rewritten} AS "{escaped}"'
+        select.append(rewritten)
+
+    routed = f"SELECT {', '.join(select)} FROM {cube}"
+    for name, keyword in (
+        ("where", "WHERE"),
+        ("group", "GROUP BY"),
+        ("having", "HAVING"),
+        ("order", "ORDER BY"),
+    ):
+        if name in clauses:
+            rewritten = _rewrite_aggregates(*clauses[name], measures)
+            if rewritten is None:
+                return query
+            routed += f" {keyword} {rewritten}"
+    if "limit" in clauses:
+        routed += f" {clauses['limit'][0]}"
+    return routed
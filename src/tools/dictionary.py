@@ -0,0 +1,204 @@
+import os
+import re
+
+from dotenv import load_dotenv
+
+from .cache import schema_cache
+from .cube import (
+    _ALIAS,
+    _IDENTIFIER,
+    _QUERY,
+    _UNSUPPORTED,
+    _mask,
+    _split_items,
+)
+from .engine import DATABASE_URL, is_duckdb_url
+from .schema import DIMENSION_PREFIX, FACT_PREFIX, get_columns, get_tables
+
+load_dotenv()
+
+DICTIONARY_ROUTING_ENABLED = (
+    os.getenv("DICTIONARY_ROUTING_ENABLED", "True").lower() == "true"
+)
+
+TABLE_NAME = "purchases"
+FACT_TABLE = f"{FACT_PREFIX}{TABLE_NAME}"
+
+_LITERALS = r"'_*'|\(\s*'_*'(?:\s*,\s*'_*')*\s*\)"
+# `column = 'value'` and `column IN ('value', ...)` comparisons
+_COMPARISON = re.compile(rf"(?<![\w.])([a-z_]\w*)(\s*=\s*|\s+in\s*)({_LITERALS})")
+_ORDER_TERM = re.compile(
+    r"^(?P<term>.*?)(?:\s+collate\s+\w+)?(?:\s+(?:asc|desc))?"
+    r"(?:\s+nulls\s+(?:first|last))?$",
+    re.S,
+)
+_QUALIFIED = re.compile(rf"\b{TABLE_NAME}\s*\.")
+
+
+def get_dictionary_columns(url: str | None = None) -> dict[str, str]:
+    """Gets the dimension table of every encoded column, empty for other layouts"""
+    url = url or DATABASE_URL
+
+    def render() -> dict[str, str]:
+        tables = set(get_tables(url))
+        if FACT_TABLE not in tables:
+            return {}
+        return {
+            column: f"{DIMENSION_PREFIX}{column}"
+            for column in get_columns(FACT_TABLE, url)
+            if f"{DIMENSION_PREFIX}{column}" in tables
+        }
+
+    return schema_cache.get(url, render, name="dictionary")
+
+
+def _decode(
+    original: str,
+    masked: str,
+    dimensions: dict[str, str],
+    comparisons: bool = True,
+) -> str:
+    """Replaces the encoded columns of a clause by their values.
+
+    Comparisons to literals are turned into comparisons of the codes, the
+    dimension table is then searched once instead of once per row.
+    """
+    replacements = []
+    if comparisons:
+        for comparison in _COMPARISON.finditer(masked):
+            column, operator, _ = comparison.groups()
+            if column not in dimensions:
+                continue
+            literals = original[comparison.start(3) : comparison.end(3)]
+            operator = operator.strip().upper()
+            replacements.append(
+                (
+                    comparison.start(),
+                    comparison.end(),
+                    f"{column} IN (SELECT id FROM {dimensions[column]} "
+                    f"WHERE value {operator} {literals})",
+                )
+            )
+    for identifier in _IDENTIFIER.finditer(masked):
+        column = identifier.group(1)
+        if column not in dimensions or any(
+            start <= identifier.start() < end for start, end, _ in replacements
+        ):
+            continue
+        replacements.append(
+            (
+                identifier.start(),
+                identifier.end(),
+                f"(SELECT value FROM {dimensions[column]} "
+                f"WHERE id = {FACT_TABLE}.{column})",
+            )
+        )
+
+    parts = []
+    position = 0
+    for start, end, replacement in sorted(replacements):
+        parts.append(original[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(original[position:])
+    return "".join(parts)
+
+
+def route_dictionary_query(query: str, url: str | None = None) -> str:
+    """Rewrites a query on the purchases view to group and filter by the integer codes.
+
+    Queries on the view decode every row, the rewritten query reads the fact table
+    grouping by codes, compares codes to the codes of the literals and decodes the
+    values of the result only. Only the single table queries also routed to cubes
+    are rewritten, anything else is returned as is and runs on the view.
+    """
+    if not DICTIONARY_ROUTING_ENABLED or is_duckdb_url(url or DATABASE_URL):
+        return query
+
+    masked = _mask(query)
+    match = _QUERY.match(masked)
+    if match is None:
+        return query
+    body = masked[match.start("select") :].replace("count(*)", "count(_)")
+    if _UNSUPPORTED.search(body) or _QUALIFIED.search(body):
+        return query
+    dimensions = get_dictionary_columns(url)
+    if not dimensions:
+        return query
+    if match.group("group") is None and not any(
+        comparison.group(1) in dimensions
+        for comparison in _COMPARISON.finditer(match.group("where") or "")
+    ):
+        # nothing to gain over decoding the rows of the view
+        return query
+
+    clauses = {
+        name: (query[match.start(name) : match.end(name)], match.group(name))
+        for name in ("select", "where", "group", "having", "order", "limit")
+        if match.group(name) is not None
+    }
+
+    select_original, select_masked = clauses["select"]
+    select = []
+    aliases = set()
+    for start, end in _split_items(select_masked):
+        item_original = select_original[start:end].strip()
+        item_masked = select_masked[start:end].strip()
+        alias = _ALIAS.search(item_masked)
+        if alias:
+            aliases.add(alias.group(1))
+            expression = _decode(
+                item_original[: alias.start()],
+                item_masked[: alias.start()],
+                dimensions,
+                comparisons=False,
+            )
+            select.append(f"{expression}{item_original[alias.start() :]}")
+            continue
+        expression = _decode(item_original, item_masked, dimensions, comparisons=False)
+        if expression != item_original:
+            # keep the column name the query had on the view
+            if item_masked in dimensions:
+                aliases.add(item_masked)
+                expression = f"{expression} AS {item_original}"
+            else:
+                escaped = item_original.replace('"', '""')
+                expression = f'{expression} AS "{escaped}"'
+        select.append(expression)
+
+    routed = f"SELECT {', '.join(select)} FROM {FACT_TABLE}"
+    if "where" in clauses:
+        routed += f" WHERE {_decode(*clauses['where'], dimensions)}"
+    if "group" in clauses:
+        group_original, group_masked = clauses["group"]
+        group = []
+        for start, end in _split_items(group_masked):
+            item_original = group_original[start:end].strip()
+            item_masked = group_masked[start:end].strip()
+            # codes group the same rows as their values
+            if item_masked in dimensions:
+                group.append(item_original)
+            else:
+                group.append(
+                    _decode(item_original, item_masked, dimensions, comparisons=False)
+                )
+        routed += f" GROUP BY {', '.join(group)}"
+    if "having" in clauses:
+        routed += f" HAVING {_decode(*clauses['having'], dimensions)}"
+    if "order" in clauses:
+        order_original, order_masked = clauses["order"]
+        order = []
+        for start, end in _split_items(order_masked):
+            item_original = order_original[start:end].strip()
+            item_masked = order_masked[start:end].strip()
+            # a term naming a result column sorts by that column, already decoded
+            if _ORDER_TERM.match(item_masked).group("term").strip() in aliases:
+                order.append(item_original)
+            else:
+                order.append(
+                    _decode(item_original, item_masked, dimensions, comparisons=False)
+                )
+        routed += f" ORDER BY {', '.join(order)}"
+    if "limit" in clauses:
+        routed += f" {clauses['limit'][0]}"
+    return routed
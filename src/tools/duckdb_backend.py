@@ -0,0 +1,191 @@
+import threading
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+
+from pandas import DataFrame, concat
+
+from .cancel import CancellationToken, QueryCancelledError, QueryTimeoutError
+from .engine import duckdb_path
+
+if TYPE_CHECKING:
+    import duckdb
+
+TABLE_NAME = "purchases"
+# rows of a duckdb vector, results are fetched in multiples of it
+VECTOR_SIZE = 2048
+
+
+class DuckDBBackend:
+    """Analytical backend running the queries on DuckDB instead of sqlite.
+
+    One database is opened per url and shared by the process, every query runs on
+    its own cursor so sessions can query in parallel.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._databases: dict[str, "duckdb.DuckDBPyConnection"] = {}
+
+    def _open(self, url: str) -> "duckdb.DuckDBPyConnection":
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError(
+                "DuckDB backend requires the `duckdb` package, install it with `uv sync --extra duckdb`"
+            ) from e
+
+        path = duckdb_path(url)
+        if not path.exists():
+            raise FileNotFoundError(f"File {path} doesn't exist")
+
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            # loaded once, scanning the csv on every query would dominate the query time
+            database = duckdb.connect()
+            database.execute(
+                f"CREATE TABLE {TABLE_NAME} AS SELECT * FROM read_csv_auto(?)",
+                [str(path)],
+            )
+        elif suffix == ".parquet":
+            database = duckdb.connect()
+            # views can't take prepared parameters
+            escaped = str(path).replace("'", "''")
+            database.execute(
+                f"CREATE VIEW {TABLE_NAME} AS SELECT * FROM read_parquet('{escaped}')"
+            )
+        else:
+            database = duckdb.connect(str(path), read_only=True)
+        return database
+
+    def get(self, url: str) -> "duckdb.DuckDBPyConnection":
+        if url not in self._databases:
+            with self._lock:
+                if url not in self._databases:
+                    self._databases[url] = self._open(url)
+        return self._databases[url]
+
+    @contextmanager
+    def cursor(
+        self,
+        query: str,
+        url: str,
+        timeout: float = 0,
+        token: CancellationToken | None = None,
+    ) -> Iterator["duckdb.DuckDBPyConnection"]:
+        """Executes `query` on a new cursor, interrupted after `timeout` seconds or on cancel"""
+        import duckdb
+
+        cursor = self.get(url).cursor()
+        timer = threading.Timer(timeout, cursor.interrupt) if timeout > 0 else None
+        if token is not None:
+            token.attach(cursor)
+        try:
+            if timer is not None:
+                timer.start()
+            cursor.execute(query)
+            yield cursor
+        except duckdb.InterruptException as e:
+            if token is not None and token.cancelled:
+                raise QueryCancelledError("SQL query was cancelled") from e
+            raise QueryTimeoutError(
+                f"SQL query exceeded the timeout of {timeout:g} seconds"
+            ) from e
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if token is not None:
+                token.detach(cursor)
+            cursor.close()
+
+    def iter_frames(
+        self,
+        query: str,
+        url: str,
+        batch_size: int = VECTOR_SIZE,
+        timeout: float = 0,
+        token: CancellationToken | None = None,
+    ) -> Iterator[DataFrame]:
+        """Yields the result in chunks of about `batch_size` rows converted straight to pandas"""
+        vectors = max(1, batch_size // VECTOR_SIZE)
+        with self.cursor(query, url, timeout, token) as cursor:
+            while not (chunk := cursor.fetch_df_chunk(vectors)).empty:
+                yield chunk
+
+    def execute(
+        self,
+        query: str,
+        url: str,
+        max_rows: int,
+        max_bytes: int,
+        timeout: float = 0,
+        token: CancellationToken | None = None,
+    ) -> DataFrame:
+        """Executes `query`, truncating the result above `max_rows` or `max_bytes`"""
+        with self.cursor(query, url, timeout, token) as cursor:
+            chunks: list[DataFrame] = []
+            n_rows = 0
+            n_bytes = 0
+            truncated = False
+            while not (chunk := cursor.fetch_df_chunk()).empty:
+                if n_rows + len(chunk) > max_rows:
+                    chunk = chunk.iloc[: max_rows - n_rows]
+                    truncated = True
+
+                chunk_bytes = int(chunk.memory_usage(index=False, deep=True).sum())
+                if n_bytes + chunk_bytes > max_bytes:
+                    fit = (max_bytes - n_bytes) * len(chunk) // max(chunk_bytes, 1)
+                    chunk = chunk.iloc[:fit]
+                    chunk_bytes = int(chunk.memory_usage(index=False, deep=True).sum())
+                    truncated = True
+
+                chunks.append(chunk)
+                n_rows += len(chunk)
+                n_bytes += chunk_bytes
+                if truncated:
+                    break
+
+            if not chunks:
+                # the last, empty, chunk still has the columns of the result
+                data = chunk
+            elif len(chunks) == 1:
+                data = chunks[0]
+            else:
+                data = concat(chunks, ignore_index=True)
+
+        data.attrs["truncated"] = truncated
+        return data
+
+    @staticmethod
+    def is_select(query: str) -> bool:
+        """The query parses as a single read-only SELECT statement"""
+        import duckdb
+
+        try:
+            statements = duckdb.extract_statements(query)
+        except duckdb.Error:
+            return False
+        return (
+            len(statements) == 1 and statements[0].type == duckdb.StatementType.SELECT
+        )
+
+    def describe(self, url: str, table: str = TABLE_NAME) -> list[tuple]:
+        """Rows of `DESCRIBE table`: name, type, null, key, default, extra"""
+        cursor = self.get(url).cursor()
+        try:
+            return cursor.execute(f'DESCRIBE "{table}"').fetchall()
+        finally:
+            cursor.close()
+
+    def tables(self, url: str) -> list[str]:
+        cursor = self.get(url).cursor()
+        try:
+            rows = cursor.execute(
+                "SELECT table_name FROM information_schema.tables ORDER BY table_name"
+            ).fetchall()
+            return [row[0] for row in rows]
+        finally:
+            cursor.close()
+
+
+duckdb_backend = DuckDBBackend()
@@ -0,0 +1,259 @@
+import os
+import sqlite3
+import threading
+import time
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Iterator, Literal
+
+from dotenv import load_dotenv
+from sqlalchemy import Connection, Engine, create_engine, event
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# `duckdb:///<path>` selects the DuckDB backend, where path is a duckdb database file
+# or a csv/parquet file loaded in an in-process database. Anything else is the path
+# of a sqlite database.
+DUCKDB_PREFIX = "duckdb:///"
+
+# pool configuration, see https://docs.sqlalchemy.org/en/20/core/pooling.html
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+
+# `;` separated list of `name=value` PRAGMAs applied to every new sqlite connection
+SQLITE_PRAGMAS = os.getenv(
+    "SQLITE_PRAGMAS",
+    "cache_size=-65536;temp_store=MEMORY;mmap_size=268435456",
+)
+
+
+def parse_pragmas(pragmas: str) -> list[tuple[str, str]]:
+    """Parses `name=value;name=value` into a list of (name, value) tuples"""
+    parsed = []
+    for pragma in pragmas.split(";"):
+        if not pragma.strip():
+            continue
+        name, _, value = pragma.partition("=")
+        if not name.strip().isidentifier() or not value.strip():
+            raise ValueError(f"Invalid sqlite PRAGMA: {pragma!r}")
+        parsed.append((name.strip(), value.strip()))
+    return parsed
+
+
+def is_duckdb_url(url: str | None) -> bool:
+    return bool(url) and url.startswith(DUCKDB_PREFIX)
+
+
+def duckdb_path(url: str) -> Path:
+    return Path(url[len(DUCKDB_PREFIX) :])
+
+
+def get_dialect(url: str | None = None) -> Literal["sqlite", "duckdb"]:
+    """SQL dialect of the configured database, passed to the LLM generating the queries"""
+    return "duckdb" if is_duckdb_url(url or DATABASE_URL) else "sqlite"
+
+
+@dataclass(frozen=True)
+class DatabaseVersion:
+    """Fingerprint of the database content, changes whenever the database is modified"""
+
+    mtime_ns: int
+    schema_version: int
+    data_version: int
+
+
+@dataclass
+class PoolStats:
+    """Connection pool counters of a registered engine.
+
+    The counters are updated by the pool events of every thread, use `add`.
+    """
+
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, **counters: float) -> None:
+        """Increments the given counters atomically, e.g. `add(waits=1)`"""
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of checkouts served by an already opened connection"""
+        if not self.checkouts:
+            return 0.0
+        return max(self.checkouts - self.connects, 0) / self.checkouts
+
+    def to_dict(self) -> dict[str, float]:
+        with self._lock:
+            counters = {
+                counter.name: getattr(self, counter.name)
+                for counter in fields(self)
+                if not counter.name.startswith("_")
+            }
+            return {**counters, "hit_ratio": self.hit_ratio}
+
+
+class EngineRegistry:
+    """Process-wide registry of pooled engines keyed by database url.
+
+    Engines are created lazily on first use and shared by every session of the process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._engines: dict[str, Engine] = {}
+        self._stats: dict[str, PoolStats] = {}
+        # dedicated connections used to probe versions, `data_version` is only
+        # comparable when read from the same connection
+        self._watchers: dict[str, tuple[sqlite3.Connection, threading.Lock]] = {}
+
+    def _create_engine(self, url: str, stats: PoolStats) -> Engine:
+        engine = create_engine(
+            f"sqlite:///{url}",
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+            connect_args={"check_same_thread": False},
+        )
+        pragmas = parse_pragmas(SQLITE_PRAGMAS)
+
+        # PRAGMAs are connection scoped, pooled connections keep them between checkouts
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, _connection_record):
+            stats.add(connects=1)
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas:
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(_dbapi_connection, _connection_record, _connection_proxy):
+            stats.add(checkouts=1)
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(_dbapi_connection, _connection_record):
+            stats.add(checkins=1)
+
+        return engine
+
+    def get(self, url: str | None = None) -> Engine:
+        url = url or DATABASE_URL
+        if not url:
+            raise ValueError("DATABASE_URL is not set")
+
+        engine = self._engines.get(url)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            # another thread may have created it while waiting for the lock
+            if url not in self._engines:
+                stats = PoolStats()
+                self._stats[url] = stats
+                self._engines[url] = self._create_engine(url, stats)
+            return self._engines[url]
+
+    @contextmanager
+    def connect(self, url: str | None = None) -> Iterator[Connection]:
+        """Checks out a pooled connection and records the time spent waiting for it"""
+        url = url or DATABASE_URL
+        engine = self.get(url)
+        stats = self._stats[url]
+        pool = engine.pool
+        # every pooled connection is in use, the checkout has to wait or open an overflow one
+        exhausted = pool.checkedin() == 0 and pool.checkedout() >= pool.size()
+
+        start = time.perf_counter()
+        conn = engine.connect()
+        elapsed = time.perf_counter() - start
+        if exhausted:
+            stats.add(waits=1, wait_seconds=elapsed)
+
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def version(self, url: str | None = None) -> DatabaseVersion:
+        """Returns the current version of the database file"""
+        url = url or DATABASE_URL
+        if not url:
+            raise ValueError("DATABASE_URL is not set")
+
+        if is_duckdb_url(url):
+            # duckdb databases are opened read only, only the file can change
+            return DatabaseVersion(
+                mtime_ns=os.stat(duckdb_path(url)).st_mtime_ns,
+                schema_version=0,
+                data_version=0,
+            )
+
+        if url not in self._watchers:
+            with self._lock:
+                if url not in self._watchers:
+                    # read only, probing a missing file must not create an empty database
+                    self._watchers[url] = (
+                        sqlite3.connect(
+                            f"{Path(url).resolve().as_uri()}?mode=ro",
+                            uri=True,
+                            check_same_thread=False,
+                        ),
+                        threading.Lock(),
+                    )
+        watcher, watcher_lock = self._watchers[url]
+
+        with watcher_lock:
+            schema_version = watcher.execute("PRAGMA schema_version").fetchone()[0]
+            data_version = watcher.execute("PRAGMA data_version").fetchone()[0]
+        return DatabaseVersion(
+            mtime_ns=os.stat(url).st_mtime_ns,
+            schema_version=schema_version,
+            data_version=data_version,
+        )
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Pool statistics per database url, intended for monitoring"""
+        result = {}
+        for url, engine in list(self._engines.items()):
+            pool = engine.pool
+            result[url] = {
+                **self._stats[url].to_dict(),
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        return result
+
+    def dispose(self) -> None:
+        """Closes every pooled connection and forgets the registered engines"""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            for watcher, _ in self._watchers.values():
+                watcher.close()
+            self._engines.clear()
+            self._stats.clear()
+            self._watchers.clear()
+
+
+engine_registry = EngineRegistry()
@@ -0,0 +1,79 @@
+import numpy as np
+
+from typing import Any
+
+from pandas import Categorical, DataFrame, array
+
+from .schema import ColumnInfo
+
+_NUMPY_DTYPES = {"integer": np.int64, "float": np.float64, "boolean": np.bool_}
+
+
+def typed_array(values: tuple | list, column: ColumnInfo | None) -> Any:
+    """Converts the values of one result column to an array typed after its declaration.
+
+    Columns without a declaration (aggregates, expressions) or with values that don't
+    match their declared type are left to pandas type inference. Declarations are
+    found by column name, so expressions aliased to an enum column, e.g.
+    `lower(gender) AS gender`, are only categories when all their values are, and
+    to a boolean column, e.g. `SUM(discount_applied) AS discount_applied`, only
+    booleans when all their values are 0 or 1.
+    """
+    kind = column.kind if column is not None else None
+
+    if kind == "enum":
+        if set(values).difference(column.values, (None,)):
+            return list(values)
+        return Categorical(values, categories=column.values)
+
+    if kind in _NUMPY_DTYPES:
+        dtype = _NUMPY_DTYPES[kind]
+        if not values:
+            return np.empty(0, dtype=dtype)
+        # sqlite returns ints for INTEGER and BOOLEAN columns, numpy infers the array
+        # type in C, aliased expressions may still return other types
+        inferred = np.asarray(values)
+        if inferred.dtype.kind == "i" and kind == "boolean":
+            if ((inferred == 0) | (inferred == 1)).all():
+                return inferred.astype(dtype, copy=False)
+            return inferred.astype(np.int64, copy=False)
+        if inferred.dtype.kind == "i" and kind == "integer":
+            return inferred.astype(dtype, copy=False)
+        if inferred.dtype.kind in "if" and kind == "float":
+            return inferred.astype(dtype, copy=False)
+        if inferred.dtype == object and kind == "boolean":
+            if set(values) <= {0, 1, None}:
+                return array(values, dtype="boolean")
+            return list(values)
+        if inferred.dtype == object and kind == "float":
+            # None becomes NaN
+            return np.array(values, dtype=np.float64)
+
+    return list(values)
+
+
+def drop_unused_categories(data: DataFrame) -> DataFrame:
+    """Removes the enum values missing from the result, plots would show them empty"""
+    # positionally, results may have duplicated column names
+    for position, dtype in enumerate(data.dtypes):
+        if dtype == "category":
+            data.isetitem(
+                position, data.iloc[:, position].cat.remove_unused_categories()
+            )
+    return data
+
+
+def build_frame(
+    rows: list[tuple], columns: list[str], declared: list[ColumnInfo | None]
+) -> DataFrame:
+    """Builds a DataFrame column by column from raw cursor rows"""
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    data = DataFrame(
+        {
+            position: typed_array(column_values, column)
+            for position, (column_values, column) in enumerate(zip(values, declared))
+        }
+    )
+    # set positionally, results may have duplicated column names
+    data.columns = columns
+    return data
@@ -0,0 +1,293 @@
+import math
+import os
+import re
+import sqlite3
+
+from typing import Literal
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from .cache import normalize_sql, schema_cache
+from .duckdb_backend import duckdb_backend
+from .engine import DATABASE_URL, engine_registry, is_duckdb_url
+
+load_dotenv()
+
+SQL_GUARD_ENABLED = os.getenv("SQL_GUARD_ENABLED", "True").lower() == "true"
+# estimated rows visited by the query, including nested loops and temp b-tree sorts
+SQL_MAX_COST = float(os.getenv("SQL_MAX_COST", "50000000"))
+# the cost budget grows with the data: full sorts of the largest table allowed to a
+# query, so scans, group bys and sorts are never rejected, nested loops over it are
+SQL_MAX_TABLE_SORTS = float(os.getenv("SQL_MAX_TABLE_SORTS", "2"))
+# estimated rows returned by the query, larger results get a LIMIT
+SQL_MAX_RESULT_ROWS = int(os.getenv("SQL_MAX_RESULT_ROWS", "100000"))
+
+# heuristic selectivities, sqlite doesn't expose row estimates without sqlite_stat1
+_EQUALITY_SELECTIVITY = 0.1
+_RANGE_SELECTIVITY = 0.33
+
+_LOOP = re.compile(r"^(SCAN|SEARCH) (\w+|\(subquery-\d+\))(?: AS \w+)?(.*)$")
+# subqueries and CTEs evaluated before the loops scanning them
+_DERIVED = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (.+)$")
+_LIMIT = re.compile(r"\blimit\s+(\d+)\s*(?:offset\s+\d+\s*)?$")
+_AGGREGATE = re.compile(r"\b(count|sum|avg|min|max|total|group_concat)\s*\(")
+# top-level select list of a single select, up to its first FROM
+_SELECT_LIST = re.compile(r"^select\s+(?!distinct\b)(.*?)\bfrom\b", re.S)
+# window functions and compound selects return more than one row per select
+_MULTI_ROW = re.compile(r"\b(over|union|intersect|except|group by)\b")
+# authorizer actions of a read-only SELECT, anything else is denied while preparing
+_READ_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+}
+
+
+class WriteQueryError(ValueError):
+    """The SQL query isn't a read-only SELECT"""
+
+
+class QueryGuardDecision(BaseModel):
+    """Outcome of the cost check done on a generated SQL query before running it"""
+
+    action: Literal["accept", "limit", "reject"]
+    # query to execute, rewritten when a LIMIT was added
+    query: str
+    estimated_cost: float = 0.0
+    estimated_rows: float = 0.0
+    reason: str = ""
+    plan: list[str] = []
+
+
+class PlanNode:
+    def __init__(self, node_id: int, detail: str) -> None:
+        self.id = node_id
+        self.detail = detail
+        self.children: list["PlanNode"] = []
+
+
+def explain_query_plan(query: str, url: str | None = None) -> list[PlanNode]:
+    """Runs `EXPLAIN QUERY PLAN` and returns the root nodes of the plan tree.
+
+    The statement is prepared with an authorizer denying anything but reads, raises
+    `WriteQueryError` when it isn't a read-only SELECT, e.g. `WITH ... DELETE ...`.
+    """
+    denied = []
+
+    def authorize(action: int, *_) -> int:
+        if action in _READ_ACTIONS:
+            return sqlite3.SQLITE_OK
+        denied.append(action)
+        return sqlite3.SQLITE_DENY
+
+    with engine_registry.connect(url) as conn:
+        dbapi_connection = conn.connection.dbapi_connection
+        dbapi_connection.set_authorizer(authorize)
+        try:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}").fetchall()
+        except DBAPIError:
+            if denied:
+                raise WriteQueryError("Only SELECT queries are allowed") from None
+            raise
+        finally:
+            dbapi_connection.set_authorizer(None)
+
+    nodes = {0: PlanNode(0, "")}
+    for node_id, parent, _, detail in rows:
+        node = PlanNode(node_id, detail)
+        nodes[node_id] = node
+        nodes.get(parent, nodes[0]).children.append(node)
+    return nodes[0].children
+
+
+def flatten_plan(nodes: list[PlanNode]) -> list[str]:
+    """Lists the details of the plan tree in depth-first order"""
+    plan = []
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        plan.append(node.detail)
+        stack.extend(reversed(node.children))
+    return plan
+
+
+def get_row_counts(url: str | None = None) -> dict[str, int]:
+    """Gets the row count of every table, cached until the database file changes"""
+    url = url or DATABASE_URL
+
+    def render() -> dict[str, int]:
+        with engine_registry.connect(url) as conn:
+            tables = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table'")
+            ).scalars()
+            return {
+                table: conn.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar()
+                for table in list(tables)
+            }
+
+    return schema_cache.get(url, render, name="row_counts")
+
+
+def estimate_plan(
+    nodes: list[PlanNode],
+    row_counts: dict[str, int],
+    derived: dict[str, float] | None = None,
+) -> tuple[float, float]:
+    """Estimates the cost (rows visited) and cardinality (rows produced) of a plan level.
+
+    Sibling SCAN/SEARCH nodes are nested loops, each one runs once per row of the
+    loops before it. Subqueries and CTEs are scanned as the rows they produce,
+    compound selects produce the rows of all their parts. Other names that are not
+    tables (aliases) are estimated as the largest table.
+    """
+    largest = max(row_counts.values(), default=1)
+    # rows of the subqueries and CTEs of the query, by name
+    derived = {} if derived is None else derived
+    cost = 0.0
+    rows = 1.0
+    for node in nodes:
+        if node.detail == "COMPOUND QUERY":
+            parts = [
+                estimate_plan(part.children, row_counts, derived)
+                for part in node.children
+            ]
+            cost += sum(part_cost for part_cost, _ in parts)
+            rows *= sum(part_rows for _, part_rows in parts)
+            continue
+
+        # scalar subqueries are evaluated on their own
+        child_cost, child_rows = estimate_plan(node.children, row_counts, derived)
+        cost += child_cost
+        if source := _DERIVED.match(node.detail):
+            derived[source.group(1)] = child_rows
+            continue
+
+        loop = _LOOP.match(node.detail)
+        if loop:
+            kind, name, rest = loop.groups()
+            table_rows = derived.get(name, row_counts.get(name, largest))
+            if kind == "SCAN":
+                if "CONSTANT ROW" in node.detail:
+                    continue
+                cost += rows * table_rows
+                rows *= table_rows
+            elif "=?" in rest and ("PRIMARY KEY" in rest or "rowid" in rest):
+                cost += rows * math.log2(table_rows + 1)
+            else:
+                selectivity = (
+                    _RANGE_SELECTIVITY
+                    if ">" in rest or "<" in rest
+                    else _EQUALITY_SELECTIVITY
+                )
+                matched = max(table_rows * selectivity, 1.0)
+                cost += rows * (math.log2(table_rows + 1) + matched)
+                rows *= matched
+        elif node.detail.startswith("USE TEMP B-TREE"):
+            # every row goes through the b-tree, which is as large as its output
+            if "GROUP BY" in node.detail or "DISTINCT" in node.detail:
+                # most group by columns of purchases have a handful of values
+                output = math.sqrt(rows)
+            else:
+                output = rows
+            cost += rows + output * math.log2(output + 1)
+            rows = output
+    return cost, rows
+
+
+def cost_budget(row_counts: dict[str, int], max_cost: float = SQL_MAX_COST) -> float:
+    """Cost budget of a query, `max_cost` or more on large tables, see `SQL_MAX_TABLE_SORTS`"""
+    largest = max(row_counts.values(), default=0)
+    return max(max_cost, SQL_MAX_TABLE_SORTS * largest * math.log2(largest + 1))
+
+
+def is_single_row_aggregate(normalized: str) -> bool:
+    """Whether the normalized query aggregates every row into one, e.g. `SELECT COUNT(*) FROM t`.
+
+    Only a top-level select list of aggregates qualifies, without GROUP BY, window
+    functions, subqueries in the select list or compound selects.
+    """
+    match = _SELECT_LIST.match(normalized)
+    if match is None or re.search(r"\bselect\b", match.group(1)):
+        return False
+    return (
+        _AGGREGATE.search(match.group(1)) is not None
+        and _MULTI_ROW.search(normalized) is None
+    )
+
+
+def add_limit(query: str, limit: int) -> str:
+    """Wraps `query` so that at most `limit` rows are returned"""
+    return f"SELECT * FROM ({query.strip().rstrip(';')}) LIMIT {limit}"
+
+
+def guard_query(
+    query: str,
+    url: str | None = None,
+    max_cost: float = SQL_MAX_COST,
+    max_rows: int = SQL_MAX_RESULT_ROWS,
+) -> QueryGuardDecision:
+    """Checks the query plan of `query` against the cost and result size budgets.
+
+    Only read-only SELECT statements are accepted. Queries returning too many rows
+    get a LIMIT. Queries over the cost budget, which grows with the largest table,
+    are limited too when sqlite can stream them (no temp b-tree), otherwise rejected.
+    """
+    if not SQL_GUARD_ENABLED:
+        return QueryGuardDecision(action="accept", query=query)
+
+    normalized = normalize_sql(query)
+    if is_duckdb_url(url or DATABASE_URL):
+        # the plan estimates are specific to sqlite, duckdb queries are bounded by
+        # the fetch ceilings and the timeout only
+        if not duckdb_backend.is_select(query):
+            return QueryGuardDecision(
+                action="reject", query=query, reason="Only SELECT queries are allowed"
+            )
+        return QueryGuardDecision(action="accept", query=query)
+
+    try:
+        nodes = explain_query_plan(query, url)
+    except WriteQueryError as e:
+        return QueryGuardDecision(action="reject", query=query, reason=str(e))
+    except DBAPIError as e:
+        return QueryGuardDecision(
+            action="reject", query=query, reason=f"Invalid SQL query: {e.orig}"
+        )
+
+    plan = flatten_plan(nodes)
+    row_counts = get_row_counts(url)
+    max_cost = cost_budget(row_counts, max_cost)
+    cost, rows = estimate_plan(nodes, row_counts)
+    if is_single_row_aggregate(normalized):
+        rows = 1.0
+    if limit := _LIMIT.search(normalized):
+        rows = min(rows, float(limit.group(1)))
+
+    decision = QueryGuardDecision(
+        action="accept",
+        query=query,
+        estimated_cost=cost,
+        estimated_rows=rows,
+        plan=plan,
+    )
+
+    streamable = not any(detail.startswith("USE TEMP B-TREE") for detail in plan)
+    if cost > max_cost and not streamable:
+        decision.action = "reject"
+        decision.reason = (
+            f"Estimated cost of {cost:,.0f} rows visited "
+            f"exceeds the budget of {max_cost:,.0f}"
+        )
+    elif cost > max_cost or rows > max_rows:
+        decision.action = "limit"
+        decision.query = add_limit(query, max_rows)
+        decision.estimated_rows = min(rows, max_rows)
+        decision.reason = (
+            f"Estimated {rows:,.0f} result rows and {cost:,.0f} rows visited, "
+            f"limited to {max_rows:,} rows"
+        )
+    return decision
@@ -0,0 +1,45 @@
+import json
+import os
+import threading
+import time
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# JSON lines file where every executed query is logged, empty disables the log
+QUERY_LOG_PATH = os.getenv("QUERY_LOG_PATH", "")
+
+
+class QueryLog:
+    """Append-only log of the executed queries, read by `scripts/index_advisor.py`"""
+
+    def __init__(self, path: str = QUERY_LOG_PATH) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def record(self, query: str, seconds: float, rows: int, plan: list[str]) -> None:
+        if self.path is None:
+            return
+
+        line = json.dumps(
+            {
+                "timestamp": time.time(),
+                "query": query,
+                "seconds": seconds,
+                "rows": rows,
+                "plan": plan,
+            }
+        )
+        with self._lock:
+            with open(self.path, "a") as file:
+                file.write(f"{line}\n")
+
+
+query_log = QueryLog()
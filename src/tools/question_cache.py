@@ -0,0 +1,275 @@
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable
+
+from dotenv import load_dotenv
+
+from .cache import schema_cache
+from .context import build_schema_context, stem, words
+from .engine import DATABASE_URL, get_dialect
+from .schema import get_columns, get_tables
+
+load_dotenv()
+
+QUESTION_CACHE_ENABLED = os.getenv("QUESTION_CACHE_ENABLED", "True").lower() == "true"
+# sqlite file persisting the cached questions, empty keeps them in memory only
+QUESTION_CACHE_PATH = os.getenv("QUESTION_CACHE_PATH", "")
+# minimum cosine similarity of two questions to reuse the SQL of the cached one
+QUESTION_CACHE_THRESHOLD = float(os.getenv("QUESTION_CACHE_THRESHOLD", "0.9"))
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+# words starting with a capital after the first one, e.g. states or brands
+_PROPER_NOUN = re.compile(r"(?<=\w)\W+([A-Z][A-Za-z0-9]*)")
+_CONTRACTED_NEGATION = re.compile(r"\w+n['’]t\b", re.I)
+_NGRAM_SIZE = 3
+# words that don't change the SQL of a question
+_STOP_WORDS = {
+    "a", "an", "the", "of", "per", "by", "for", "in", "on", "to", "with", "from",
+    "is", "are", "was", "were", "be", "there", "what", "which", "how", "many",
+    "much", "do", "does", "show", "me", "give", "list", "plot", "chart", "graph",
+    "please", "each", "every", "all", "that", "their", "it", "can", "you",
+}  # fmt: skip
+# words changing the filter, the order or the limit of the SQL, stemmed
+_COMPARISONS = {
+    "more", "less", "fewer", "greater", "smaller", "larger", "bigger", "higher",
+    "lower", "above", "below", "over", "under", "least", "most", "top", "bottom",
+    "max", "maximum", "min", "minimum", "highest", "lowest", "biggest", "smallest",
+    "largest", "between", "before", "after", "older", "younger", "oldest",
+    "youngest", "than", "equal", "exceed", "exceeding", "ascending", "descending",
+    "first", "last", "only", "increasing", "decreasing",
+}  # fmt: skip
+_NEGATIONS = {
+    "not", "no", "non", "without", "except", "excluding", "exclude", "never",
+    "neither", "nor", "other", "beside", "none",
+}  # fmt: skip
+
+
+def question_features(question: str) -> Counter[str]:
+    """Stemmed words and character trigrams of the normalized question"""
+    tokens = sorted(words(question) - _STOP_WORDS)
+    normalized = f" {' '.join(tokens)} "
+    features = Counter(f"w:{token}" for token in tokens)
+    features.update(
+        normalized[i : i + _NGRAM_SIZE]
+        for i in range(len(normalized) - _NGRAM_SIZE + 1)
+    )
+    return features
+
+
+def cosine_similarity(
+    a: Counter[str], b: Counter[str], norm_a: float, norm_b: float
+) -> float:
+    if not norm_a or not norm_b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(count * b[feature] for feature, count in a.items()) / (norm_a * norm_b)
+
+
+def schema_vocabulary(url: str | None = None) -> frozenset[str]:
+    """Stemmed words of the column names and enum values, cached until the schema changes"""
+    url = url or DATABASE_URL
+
+    def render() -> frozenset[str]:
+        vocabulary = set()
+        for table in get_tables(url):
+            for name, column in get_columns(table, url).items():
+                vocabulary |= words(name) | words(" ".join(column.values))
+        return frozenset(vocabulary - _STOP_WORDS)
+
+    return schema_cache.get(url, render, name="vocabulary")
+
+
+def key_terms(question: str, vocabulary: frozenset[str]) -> tuple[str, ...]:
+    """Terms of `question` changing its SQL, similar questions only match when they are equal.
+
+    They are the numbers, the column names and values of the schema, proper nouns,
+    comparisons and negations: "female customers" isn't "male customers" and "with
+    a discount" isn't "without a discount", however similar the rest is.
+    """
+    tokens = words(question)
+    terms = [f"number:{number}" for number in _NUMBER.findall(question)]
+    terms += [f"schema:{token}" for token in tokens & vocabulary]
+    # values missing from the schema, e.g. of the text columns
+    nouns = {stem(noun.lower()) for noun in _PROPER_NOUN.findall(question)}
+    terms += [f"name:{noun}" for noun in nouns - vocabulary]
+    terms += [f"comparison:{token}" for token in tokens & _COMPARISONS]
+    terms += [f"negation:{token}" for token in tokens & _NEGATIONS]
+    if _CONTRACTED_NEGATION.search(question):
+        terms.append("negation:not")
+    return tuple(sorted(set(terms)))
+
+
+def schema_fingerprint(url: str | None = None) -> str:
+    """Hash of the full schema and the SQL dialect, cached SQL is only valid for it"""
+    url = url or DATABASE_URL
+
+    def render() -> str:
+        schema = build_schema_context(url=url, budget=0)
+        return hashlib.sha256(f"{get_dialect(url)}\n{schema}".encode()).hexdigest()
+
+    return schema_cache.get(url, render, name="fingerprint")
+
+
+@dataclass
+class CachedQuestion:
+    id: int
+    question: str
+    sql: str
+    terms: tuple[str, ...]
+    features: Counter[str]
+    norm: float
+
+
+class QuestionCache:
+    """Question to SQL cache, reusing the SQL generated for a similar enough question.
+
+    Questions are compared by the cosine similarity of their words and character
+    trigrams, looked up through an inverted index of their words. Questions with
+    different key terms never match, see `key_terms`: "older than 30" isn't "older
+    than 40" and "female customers" isn't "male customers". Entries are kept in a
+    sqlite database and dropped when the schema they were generated for changes.
+    """
+
+    def __init__(
+        self,
+        path: str = QUESTION_CACHE_PATH,
+        threshold: float = QUESTION_CACHE_THRESHOLD,
+        enabled: bool = QUESTION_CACHE_ENABLED,
+        vocabulary: Callable[[], frozenset[str]] = schema_vocabulary,
+    ) -> None:
+        self.enabled = enabled
+        self.path = path or ":memory:"
+        self.threshold = threshold
+        self.vocabulary = vocabulary
+        self._terms: frozenset[str] = frozenset()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._schema: str | None = None
+        self._entries: dict[int, CachedQuestion] = {}
+        self._index: dict[str, set[int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS questions ("
+                "id INTEGER PRIMARY KEY, question TEXT NOT NULL, sql TEXT NOT NULL, "
+                "schema TEXT NOT NULL, created REAL NOT NULL, "
+                "hits INTEGER NOT NULL DEFAULT 0)"
+            )
+        return self._conn
+
+    def _add(self, id_: int, question: str, sql: str) -> None:
+        features = question_features(question)
+        entry = CachedQuestion(
+            id=id_,
+            question=question,
+            sql=sql,
+            terms=key_terms(question, self._terms),
+            features=features,
+            norm=math.sqrt(sum(count**2 for count in features.values())),
+        )
+        self._entries[id_] = entry
+        for feature in features:
+            if feature.startswith("w:"):
+                self._index.setdefault(feature, set()).add(id_)
+
+    def _load(self, schema: str) -> None:
+        """Loads the entries of `schema`, deleting the ones of previous schemas"""
+        if self._schema == schema:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM questions WHERE schema != ?", (schema,))
+        self._entries.clear()
+        self._index.clear()
+        self._terms = self.vocabulary()
+        for id_, question, sql in conn.execute(
+            "SELECT id, question, sql FROM questions"
+        ):
+            self._add(id_, question, sql)
+        self._schema = schema
+
+    def _match(self, question: str) -> CachedQuestion | None:
+        """Most similar cached question above the threshold with the same key terms"""
+        features = question_features(question)
+        norm = math.sqrt(sum(count**2 for count in features.values()))
+        terms = key_terms(question, self._terms)
+        candidates = set().union(
+            *(
+                self._index.get(feature, ())
+                for feature in features
+                if feature.startswith("w:")
+            )
+        )
+        best, best_similarity = None, self.threshold
+        for id_ in candidates:
+            entry = self._entries[id_]
+            if entry.terms != terms:
+                continue
+            similarity = cosine_similarity(features, entry.features, norm, entry.norm)
+            if similarity >= best_similarity:
+                best, best_similarity = entry, similarity
+        return best
+
+    def lookup(self, question: str, schema: str) -> str | None:
+        """SQL of the most similar cached question above the threshold"""
+        with self._lock:
+            self._load(schema)
+            best = self._match(question)
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE questions SET hits = hits + 1 WHERE id = ?", (best.id,)
+                )
+            return best.sql
+
+    def store(self, question: str, sql: str, schema: str) -> None:
+        """Caches the SQL of `question`, unless the cache already serves it"""
+        with self._lock:
+            self._load(schema)
+            if (best := self._match(question)) is not None and best.sql == sql:
+                return
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT INTO questions (question, sql, schema, created) "
+                    "VALUES (?, ?, ?, ?)",
+                    (question, sql, schema, time.time()),
+                )
+            self._add(cursor.lastrowid, question, sql)
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def invalidate(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM questions")
+            self._entries.clear()
+            self._index.clear()
+
+
+question_cache = QuestionCache()
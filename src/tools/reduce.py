@@ -0,0 +1,236 @@
+import math
+import os
+import re
+
+from typing import Literal
+
+import numpy as np
+from dotenv import load_dotenv
+from pandas import DataFrame
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+)
+from pydantic import BaseModel
+
+load_dotenv()
+
+# results above this many rows are reduced before plotting, 0 disables the reduction
+PLOT_MAX_POINTS = int(os.getenv("PLOT_MAX_POINTS", "5000"))
+# bins of the pre-binned histograms
+PLOT_HISTOGRAM_BINS = int(os.getenv("PLOT_HISTOGRAM_BINS", "50"))
+# columns with at most this many distinct values are used as strata/series
+MAX_GROUPS = 50
+# columns of a pre-binned histogram, after the group columns
+HISTOGRAM_COLUMNS = ["bin_start", "bin_end", "count"]
+
+ReductionMethod = Literal[
+    "none", "uniform_sample", "stratified_sample", "lttb", "histogram"
+]
+
+_HISTOGRAM_QUERY = re.compile(r"\b(histogram|distribution|distributed)\b", re.I)
+
+
+class DataReduction(BaseModel):
+    """Reduction applied to the query result before plotting"""
+
+    method: ReductionMethod = "none"
+    original_rows: int = 0
+    rows: int = 0
+    # columns the reduction is based on: x/y of LTTB, binned column, strata
+    columns: list[str] = []
+    groups: list[str] = []
+
+    def describe(self) -> str:
+        """Explains the reduction to the plot agent"""
+        if self.method == "none":
+            return ""
+        if self.method == "histogram":
+            return (
+                f"The {self.original_rows} values of `{self.columns[0]}` were pre-binned "
+                f"into a histogram: plot `count` as bars spanning `bin_start` to `bin_end`"
+                + (f", one series per {self.groups}." if self.groups else ".")
+            )
+        if self.method == "lttb":
+            return (
+                f"The series were downsampled from {self.original_rows} to {self.rows} "
+                "points keeping their visual shape (LTTB), plot them as lines."
+            )
+        return (
+            f"The data is a {self.method.replace('_', ' ')} of {self.rows} rows out of "
+            f"{self.original_rows}."
+        )
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    `x` must be sorted. The first and last points are always kept, every other
+    bucket keeps the point forming the largest triangle with the previously kept
+    point and the average of the next bucket.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(float)
+    y = np.nan_to_num(y.astype(float))
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+    return indices
+
+
+def uniform_sample(data: DataFrame, n: int, seed: int = 0) -> DataFrame:
+    """Uniform sample of `n` rows, in the original order"""
+    rng = np.random.default_rng(seed)
+    return data.iloc[np.sort(rng.choice(len(data), n, replace=False))]
+
+
+def stratified_sample(
+    data: DataFrame, by: list[str], n: int, seed: int = 0
+) -> DataFrame:
+    """Sample of about `n` rows proportional to the groups of `by`, every group is kept"""
+    rng = np.random.default_rng(seed)
+    shuffled = data.iloc[rng.permutation(len(data))]
+    grouped = shuffled.groupby(by, observed=True, dropna=False, sort=False)
+    groups = grouped.ngroup().to_numpy()
+    sizes = np.bincount(groups)
+    quota = np.maximum(1, np.round(sizes * n / len(data))).astype(int)
+    keep = grouped.cumcount().to_numpy() < quota[groups]
+    return shuffled[keep].sort_index()
+
+
+def histogram(
+    data: DataFrame, column: str, bins: int, by: list[str] | None = None
+) -> DataFrame:
+    """Counts of `column` in `bins` equal width bins shared by the groups of `by`"""
+    by = by or []
+    values = data[column].to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(values)
+    if is_integer_dtype(data[column]) and valid.any():
+        # integer wide bins, fractional widths would alias with the integer values
+        low, high = values[valid].min(), values[valid].max()
+        width = max(1, math.ceil((high - low + 1) / bins))
+        edges = low + width * np.arange(math.ceil((high - low + 1) / width) + 1)
+    else:
+        edges = np.histogram_bin_edges(values[valid], bins)
+    # the last bin includes its upper edge, as in numpy
+    bin_ids = np.clip(
+        np.searchsorted(edges, values, side="right") - 1, 0, len(edges) - 2
+    )
+
+    binned = data.loc[valid, by].assign(bin=bin_ids[valid])
+    counts = (
+        binned.groupby([*by, "bin"], observed=True).size().reset_index(name="count")
+    )
+    counts["bin_start"] = edges[counts["bin"]]
+    counts["bin_end"] = edges[counts["bin"] + 1]
+    return counts[[*by, *HISTOGRAM_COLUMNS]]
+
+
+def _is_measure(data: DataFrame, column: str) -> bool:
+    return is_numeric_dtype(data[column]) and not is_bool_dtype(data[column])
+
+
+def _lttb(
+    data: DataFrame, x: str, ys: list[str], by: list[str], max_points: int
+) -> DataFrame | None:
+    """LTTB of every y column and series, None when `x` isn't sorted within a series"""
+    series = [frame for _, frame in data.groupby(by, observed=True)] if by else [data]
+    threshold = max(3, max_points // (len(series) * len(ys)))
+    kept = []
+    for frame in series:
+        if not frame[x].is_monotonic_increasing:
+            return None
+        x_values = frame[x].to_numpy(
+            dtype="int64" if is_datetime64_any_dtype(frame[x]) else float
+        )
+        positions = set()
+        for y in ys:
+            y_values = frame[y].to_numpy(dtype=float, na_value=np.nan)
+            positions.update(lttb_indices(x_values, y_values, threshold).tolist())
+        kept.append(frame.index[sorted(positions)])
+    return data.loc[np.concatenate(kept)].sort_index()
+
+
+def reduce_data(
+    data: DataFrame,
+    query: str = "",
+    max_points: int = PLOT_MAX_POINTS,
+    bins: int = PLOT_HISTOGRAM_BINS,
+) -> tuple[DataFrame, DataReduction]:
+    """Reduces a result with more than `max_points` rows to what a plot can show.
+
+    - a single measure, alone or with low cardinality columns, is pre-binned into a
+      histogram when `query` asks for a distribution
+    - measures ordered by a sorted first column, per series of the low cardinality
+      columns, are downsampled with LTTB
+    - anything else is sampled, stratified by the low cardinality columns if any
+    - columns with duplicated names, e.g. two `count(*)` of a join, are sampled
+    """
+    reduction = DataReduction(original_rows=len(data), rows=len(data))
+    if max_points <= 0 or len(data) <= max_points:
+        return data, reduction
+
+    if data.columns.has_duplicates:
+        # the columns can't be told apart by name, the sample only selects rows
+        reduced = uniform_sample(data, max_points).reset_index(drop=True)
+        reduced.attrs = dict(data.attrs)
+        reduction.method = "uniform_sample"
+        reduction.rows = len(reduced)
+        return reduced, reduction
+
+    measures = [column for column in data.columns if _is_measure(data, column)]
+    others = [column for column in data.columns if column not in measures]
+    groups = [column for column in others if data[column].nunique() <= MAX_GROUPS]
+
+    if len(measures) == 1 and others == groups and _HISTOGRAM_QUERY.search(query):
+        reduced = histogram(data, measures[0], bins, groups)
+        reduction.method = "histogram"
+        reduction.columns = measures
+        reduction.groups = groups
+    else:
+        x = data.columns[0]
+        ys = [column for column in measures if column != x]
+        reduced = None
+        if (
+            x not in groups
+            and (_is_measure(data, x) or is_datetime64_any_dtype(data[x]))
+            and ys
+            and set(data.columns) == {x, *ys, *groups}
+        ):
+            reduced = _lttb(data, x, ys, groups, max_points)
+            reduction.method = "lttb"
+            reduction.columns = [x, *ys]
+            reduction.groups = groups
+        if reduced is None and groups:
+            reduced = stratified_sample(data, groups, max_points)
+            reduction.method = "stratified_sample"
+            reduction.columns = []
+            reduction.groups = groups
+        elif reduced is None:
+            reduced = uniform_sample(data, max_points)
+            reduction.method = "uniform_sample"
+            reduction.columns = []
+            reduction.groups = []
+
+    reduced = reduced.reset_index(drop=True)
+    reduced.attrs = dict(data.attrs)
+    reduction.rows = len(reduced)
+    return reduced, reduction
@@ -0,0 +1,135 @@
+import os
+
+from pathlib import Path
+
+import seaborn as sns
+from baml_client.types import ChartType, PlotSpec
+from dotenv import load_dotenv
+from matplotlib.figure import Figure
+from pandas import DataFrame
+from pandas.api.types import is_numeric_dtype
+
+from .reduce import HISTOGRAM_COLUMNS
+
+load_dotenv()
+
+# plot specs are rendered natively, the plot agent only draws the ones the renderer
+# can't, disabled every plot goes through the agent
+PLOT_SPEC_ENABLED = os.getenv("PLOT_SPEC_ENABLED", "True").lower() == "true"
+
+# columns every chart type needs, and the ones that must be numeric
+_REQUIRED = {
+    ChartType.BAR: ("x", "y"),
+    ChartType.LINE: ("x", "y"),
+    ChartType.SCATTER: ("x", "y"),
+    ChartType.BOX: ("y",),
+    ChartType.HISTOGRAM: ("x",),
+    ChartType.PIE: ("x", "y"),
+}
+_NUMERIC = {
+    ChartType.BAR: ("y",),
+    ChartType.LINE: ("y",),
+    ChartType.SCATTER: ("x", "y"),
+    ChartType.BOX: ("y",),
+    ChartType.PIE: ("y",),
+}
+
+
+class PlotSpecError(ValueError):
+    """The plot spec can't be drawn from the data as it is"""
+
+
+def validate_spec(spec: PlotSpec, data: DataFrame) -> None:
+    """Raises `PlotSpecError` unless `spec` plots the columns of `data` without transforming them"""
+    if spec.chart_type not in _REQUIRED:
+        raise PlotSpecError(f"Chart type {spec.chart_type.value} is not supported")
+    if data.columns.has_duplicates:
+        raise PlotSpecError("Data has duplicated column names")
+
+    for encoding in ("x", "y", "hue"):
+        if encoding == "x" and _is_binned(spec, data):
+            # the binned column, whatever it's called
+            continue
+        column = getattr(spec, encoding)
+        if column is None:
+            if encoding in _REQUIRED[spec.chart_type]:
+                raise PlotSpecError(
+                    f"{spec.chart_type.value} needs a {encoding} column"
+                )
+        elif column not in data.columns:
+            raise PlotSpecError(f"Unknown {encoding} column {column!r}")
+    for encoding in _NUMERIC.get(spec.chart_type, ()):
+        if not is_numeric_dtype(data[getattr(spec, encoding)]):
+            raise PlotSpecError(
+                f"{encoding} column of {spec.chart_type.value} isn't numeric"
+            )
+
+    if spec.chart_type in (ChartType.BAR, ChartType.PIE):
+        # several rows per bar or slice would need an aggregation
+        keys = [column for column in (spec.x, spec.hue) if column is not None]
+        if data.duplicated(keys).any():
+            raise PlotSpecError(f"Several rows per {spec.chart_type.value} {keys}")
+    if spec.chart_type == ChartType.PIE and spec.hue is not None:
+        raise PlotSpecError("Pie charts have no hue")
+
+
+def _is_binned(spec: PlotSpec, data: DataFrame) -> bool:
+    """Histogram of data pre-binned by `reduce_data`"""
+    return spec.chart_type == ChartType.HISTOGRAM and set(HISTOGRAM_COLUMNS) <= set(
+        data.columns
+    )
+
+
+def _histogram(spec: PlotSpec, data: DataFrame, ax) -> None:
+    if not _is_binned(spec, data):
+        sns.histplot(data, x=spec.x, hue=spec.hue, ax=ax)
+        return
+    # pre-binned by `reduce_data`
+    start, end, count = HISTOGRAM_COLUMNS
+    edges = sorted({*data[start].dropna(), *data[end].dropna()})
+    sns.histplot(data, x=start, weights=count, bins=edges, hue=spec.hue, ax=ax)
+
+
+def render_plot(spec: PlotSpec, data: DataFrame, path: str | Path) -> Path:
+    """Draws `spec` from the columns of `data` as they are and saves it as a png.
+
+    Figures are created without pyplot, so concurrent requests don't share state.
+    """
+    validate_spec(spec, data)
+
+    figure = Figure(figsize=(10, 6), layout="constrained")
+    ax = figure.add_subplot()
+    chart = spec.chart_type
+    if chart == ChartType.BAR:
+        sns.barplot(data, x=spec.x, y=spec.y, hue=spec.hue, errorbar=None, ax=ax)
+    elif chart == ChartType.LINE:
+        sns.lineplot(
+            data.sort_values(spec.x),
+            x=spec.x,
+            y=spec.y,
+            hue=spec.hue,
+            estimator=None,
+            errorbar=None,
+            ax=ax,
+        )
+    elif chart == ChartType.SCATTER:
+        sns.scatterplot(data, x=spec.x, y=spec.y, hue=spec.hue, ax=ax)
+    elif chart == ChartType.BOX:
+        sns.boxplot(data, x=spec.x, y=spec.y, hue=spec.hue, ax=ax)
+    elif chart == ChartType.HISTOGRAM:
+        _histogram(spec, data, ax)
+    else:
+        ax.pie(data[spec.y], labels=data[spec.x].astype(str), autopct="%1.1f%%")
+
+    ax.set_title(spec.title)
+    if chart != ChartType.PIE:
+        ax.set_xlabel(spec.x_label or spec.x or ax.get_xlabel())
+        ax.set_ylabel(spec.y_label or spec.y or ax.get_ylabel())
+        if chart in (ChartType.BAR, ChartType.BOX) and spec.x is not None:
+            ax.tick_params(
+                axis="x", labelrotation=45 if data[spec.x].nunique() > 6 else 0
+            )
+
+    path = Path(path)
+    figure.savefig(path, format="png")
+    return path
@@ -0,0 +1,157 @@
+import re
+
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import Connection, text
+
+from .cache import schema_cache
+from .duckdb_backend import duckdb_backend
+from .engine import DATABASE_URL, engine_registry, is_duckdb_url
+
+ColumnKind = Literal["integer", "float", "boolean", "enum", "string"]
+
+# the dictionary layout of `scripts/create_db.py` stores a table in `fact__<table>`
+# with integer codes into one `dim__<column>` table per encoded column, the table
+# itself is a view decoding them
+FACT_PREFIX = "fact__"
+DIMENSION_PREFIX = "dim__"
+
+# SQLAlchemy renders `Enum(..., create_constraint=True)` as `CHECK (column IN ('A', 'B'))`
+_ENUM_CHECK = re.compile(
+    r"CHECK\s*\(\s*[\"`]?(\w+)[\"`]?\s+IN\s*\(([^)]*)\)\s*\)", re.I
+)
+_QUOTED = re.compile(r"'((?:[^']|'')*)'")
+
+
+@dataclass(frozen=True)
+class ColumnInfo:
+    """Declared type information of a table column"""
+
+    name: str
+    type: str
+    nullable: bool = True
+    primary_key: bool = False
+    # allowed values of enum columns
+    values: tuple[str, ...] = ()
+
+    @property
+    def kind(self) -> ColumnKind:
+        """Kind of the column following the sqlite type affinity rules"""
+        declared = self.type.upper()
+        if self.values:
+            return "enum"
+        if "BOOL" in declared:
+            return "boolean"
+        if "INT" in declared:
+            return "integer"
+        if any(name in declared for name in ("REAL", "FLOA", "DOUB", "NUMERIC")):
+            return "float"
+        return "string"
+
+
+def parse_enum_values(table_sql: str) -> dict[str, tuple[str, ...]]:
+    """Extracts the allowed values of enum columns from a CREATE TABLE statement"""
+    enums = {}
+    for column, values in _ENUM_CHECK.findall(table_sql or ""):
+        enums[column] = tuple(
+            value.replace("''", "'") for value in _QUOTED.findall(values)
+        )
+    return enums
+
+
+def read_columns(conn: Connection, table: str) -> list[ColumnInfo]:
+    """Reads the columns of `table` from the sqlite catalog"""
+    table_type, table_sql = conn.execute(
+        text("SELECT type, sql FROM sqlite_master WHERE name = :table"),
+        {"table": table},
+    ).one_or_none() or (None, None)
+    enums = parse_enum_values(table_sql)
+
+    # views don't have constraints, the ones of the dictionary layout take them from
+    # the fact table and the enum values from the dimension tables
+    stored = {}
+    if table_type == "view":
+        stored = {
+            column.name: column
+            for column in read_columns(conn, f"{FACT_PREFIX}{table}")
+        }
+        dimensions = conn.execute(
+            text("SELECT name, sql FROM sqlite_master WHERE type = 'table'")
+        ).all()
+        for name, sql in dimensions:
+            column = name[len(DIMENSION_PREFIX) :]
+            if name.startswith(DIMENSION_PREFIX) and column in stored:
+                if values := parse_enum_values(sql).get("value"):
+                    enums[column] = values
+
+    columns = []
+    # cid, name, type, notnull, default value, pk
+    for _, name, type_, notnull, _, pk in conn.execute(
+        text(f'PRAGMA table_info("{table}")')
+    ):
+        if name in stored:
+            notnull, pk = not stored[name].nullable, stored[name].primary_key
+        columns.append(
+            ColumnInfo(
+                name=name,
+                type=type_,
+                nullable=not notnull,
+                primary_key=bool(pk),
+                values=enums.get(name, ()),
+            )
+        )
+    return columns
+
+
+def read_duckdb_columns(url: str, table: str) -> list[ColumnInfo]:
+    """Reads the columns of `table` from a DuckDB database, ENUM types are enum columns"""
+    columns = []
+    for name, type_, null, key, *_ in duckdb_backend.describe(url, table):
+        values = ()
+        if type_.startswith("ENUM("):
+            values = tuple(value.replace("''", "'") for value in _QUOTED.findall(type_))
+        columns.append(
+            ColumnInfo(
+                name=name,
+                type=type_,
+                nullable=null == "YES",
+                primary_key=key == "PRI",
+                values=values,
+            )
+        )
+    return columns
+
+
+def get_columns(
+    table: str = "purchases", url: str | None = None
+) -> dict[str, ColumnInfo]:
+    """Gets the columns of `table` by name, cached until the schema changes"""
+    url = url or DATABASE_URL
+
+    def render() -> dict[str, ColumnInfo]:
+        if is_duckdb_url(url):
+            return {column.name: column for column in read_duckdb_columns(url, table)}
+        with engine_registry.connect(url) as conn:
+            return {column.name: column for column in read_columns(conn, table)}
+
+    return schema_cache.get(url, render, name=f"columns:{table}")
+
+
+def get_tables(url: str | None = None) -> list[str]:
+    """Gets the names of the tables and views, cached until the schema changes"""
+    url = url or DATABASE_URL
+
+    def render() -> list[str]:
+        if is_duckdb_url(url):
+            return duckdb_backend.tables(url)
+        with engine_registry.connect(url) as conn:
+            tables = conn.execute(
+                text(
+                    "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') "
+                    "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+                )
+            ).scalars()
+            return list(tables)
+
+    return schema_cache.get(url, render, name="tables")
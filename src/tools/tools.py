@@ -1,45 +1,239 @@
 import os
+import sqlite3
+import time
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
 from dotenv import load_dotenv
-
-from pandas import DataFrame
-from typing import Annotated
+from pandas import DataFrame, concat
+from typing import Annotated, Iterator
 
 from langchain.tools import Tool
 from langchain_core.tools import tool
 from langchain_experimental.utilities import PythonREPL
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine
+
+from .cache import result_cache
+from .cancel import CancellationToken, QueryCancelledError, QueryTimeoutError
+from .context import build_schema_context
+from .cube import route_query
+from .dictionary import route_dictionary_query
+from .duckdb_backend import duckdb_backend
+from .engine import DATABASE_URL, engine_registry, is_duckdb_url
+from .fetch import build_frame, drop_unused_categories
+from .guard import explain_query_plan, flatten_plan
+from .query_log import query_log
+from .schema import ColumnInfo, get_columns
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+# rows pulled from the cursor at a time
+SQL_FETCH_BATCH_SIZE = int(os.getenv("SQL_FETCH_BATCH_SIZE", "10000"))
+# ceilings of a single query result, larger results are truncated
+SQL_MAX_ROWS = int(os.getenv("SQL_MAX_ROWS", "1000000"))
+SQL_MAX_BYTES = int(os.getenv("SQL_MAX_BYTES", str(256 * 1024**2)))
+# wall-clock limit of a single query in seconds, 0 disables it
+SQL_TIMEOUT = float(os.getenv("SQL_TIMEOUT", "30"))
+# sqlite virtual machine instructions between timeout/cancellation checks
+SQL_PROGRESS_STEPS = 10000
+
+
+def get_engine() -> Engine:
+    """Returns the shared pooled engine of the configured database"""
+    return engine_registry.get()
+
+
+@contextmanager
+def _raw_cursor(
+    query: str,
+    url: str | None = None,
+    timeout: float = SQL_TIMEOUT,
+    token: CancellationToken | None = None,
+) -> Iterator[tuple[sqlite3.Cursor, list[ColumnInfo | None]]]:
+    """Executes `query` on a pooled connection, returning the raw sqlite3 cursor.
+
+    Rows are read straight from the driver, skipping the SQLAlchemy `Row` objects,
+    together with the declared type of every result column that maps to a column
+    of the table.
+
+    The query, including fetching its rows, is interrupted after `timeout` seconds
+    or when `token` is cancelled.
+    """
+    declared_columns = get_columns(url=url)
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+
+    def should_interrupt() -> int:
+        if token is not None and token.cancelled:
+            return 1
+        return int(deadline is not None and time.monotonic() > deadline)
+
+    with engine_registry.connect(url) as conn:
+        dbapi_connection = conn.connection.dbapi_connection
+        dbapi_connection.set_progress_handler(should_interrupt, SQL_PROGRESS_STEPS)
+        if token is not None:
+            token.attach(dbapi_connection)
+        cursor = dbapi_connection.cursor()
+        try:
+            if token is not None and token.cancelled:
+                raise QueryCancelledError("SQL query was cancelled")
+            cursor.execute(query)
+            if cursor.description is None:
+                raise ValueError("SQL query doesn't return rows")
+            declared = [
+                declared_columns.get(description[0])
+                for description in cursor.description
+            ]
+            yield cursor, declared
+        except sqlite3.OperationalError as e:
+            if str(e) != "interrupted":
+                raise
+            if token is not None and token.cancelled:
+                raise QueryCancelledError("SQL query was cancelled") from e
+            raise QueryTimeoutError(
+                f"SQL query exceeded the timeout of {timeout:g} seconds"
+            ) from e
+        finally:
+            cursor.close()
+            if token is not None:
+                token.detach(dbapi_connection)
+            dbapi_connection.set_progress_handler(None, 0)
+
+
+def iter_sql(
+    query: str,
+    batch_size: int = SQL_FETCH_BATCH_SIZE,
+    timeout: float = SQL_TIMEOUT,
+    token: CancellationToken | None = None,
+) -> Iterator[DataFrame]:
+    """Executes SQL on the database and yields the result in chunks of `batch_size` rows.
+
+    Meant for consumers that only need aggregates and never hold the full result.
+    """
+    if is_duckdb_url(DATABASE_URL):
+        yield from duckdb_backend.iter_frames(
+            query, DATABASE_URL, batch_size, timeout, token
+        )
+        return
 
+    with _raw_cursor(query, timeout=timeout, token=token) as (cursor, declared):
+        columns = [description[0] for description in cursor.description]
+        while rows := cursor.fetchmany(batch_size):
+            yield build_frame(rows, columns, declared)
 
-def get_engine():
-    return create_engine(f"sqlite:///{DATABASE_URL}")
 
+def execute_sql(
+    query: str,
+    batch_size: int = SQL_FETCH_BATCH_SIZE,
+    max_rows: int = SQL_MAX_ROWS,
+    max_bytes: int = SQL_MAX_BYTES,
+    url: str | None = None,
+    timeout: float = SQL_TIMEOUT,
+    token: CancellationToken | None = None,
+) -> DataFrame:
+    """Executes SQL on the database, bypassing the result cache.
 
-def run_sql(query: str) -> DataFrame:
-    """Executes validated SQL on the database"""
-    engine = get_engine()
-    with engine.connect() as conn:
-        result = conn.execute(text(query))
-        columns = list(result.keys())
-        data = result.fetchall()
+    Rows are fetched in batches into typed column arrays and the result is truncated
+    once it exceeds `max_rows` or `max_bytes`, in which case
+    `DataFrame.attrs["truncated"]` is set. Raises `QueryTimeoutError` after `timeout`
+    seconds and `QueryCancelledError` when `token` is cancelled.
 
-        return DataFrame(data, columns=columns)
+    On a DuckDB database the result is fetched in vectorized chunks instead.
+    """
+    url = url or DATABASE_URL
+    if is_duckdb_url(url):
+        start = time.perf_counter()
+        data = drop_unused_categories(
+            duckdb_backend.execute(query, url, max_rows, max_bytes, timeout, token)
+        )
+        if query_log.enabled:
+            query_log.record(
+                query, seconds=time.perf_counter() - start, rows=len(data), plan=[]
+            )
+        return data
 
+    start = time.perf_counter()
+    with _raw_cursor(query, url, timeout, token) as (cursor, declared):
+        columns = [description[0] for description in cursor.description]
 
-def get_schema():
-    """Gets information on the schema as context for the LLM"""
-    engine = get_engine()
-    with engine.connect() as conn:
-        schema = conn.execute(text("PRAGMA table_info(purchases);")).fetchall()
-        # add metainfo on each column
-        return f'Table: "purchases":\n{schema}'
+        chunks: list[DataFrame] = []
+        n_rows = 0
+        n_bytes = 0
+        truncated = False
+        while rows := cursor.fetchmany(batch_size):
+            chunk = build_frame(rows, columns, declared)
+            if n_rows + len(chunk) > max_rows:
+                chunk = chunk.iloc[: max_rows - n_rows]
+                truncated = True
+
+            chunk_bytes = int(chunk.memory_usage(index=False, deep=True).sum())
+            if n_bytes + chunk_bytes > max_bytes:
+                # keep the rows that still fit, assuming evenly sized rows
+                fit = (max_bytes - n_bytes) * len(chunk) // max(chunk_bytes, 1)
+                chunk = chunk.iloc[:fit]
+                chunk_bytes = int(chunk.memory_usage(index=False, deep=True).sum())
+                truncated = True
+
+            chunks.append(chunk)
+            n_rows += len(chunk)
+            n_bytes += chunk_bytes
+            if truncated:
+                break
+
+    if not chunks:
+        data = build_frame([], columns, declared)
+    elif len(chunks) == 1:
+        data = chunks[0]
+    else:
+        data = concat(chunks, ignore_index=True)
+    # the chunks share the categories of the enum columns, kept until concatenated
+    data = drop_unused_categories(data)
+    data.attrs["truncated"] = truncated
+
+    if query_log.enabled:
+        query_log.record(
+            query,
+            seconds=time.perf_counter() - start,
+            rows=len(data),
+            plan=flatten_plan(explain_query_plan(query, url)),
+        )
+    return data
+
+
+def run_sql(
+    query: str,
+    timeout: float = SQL_TIMEOUT,
+    token: CancellationToken | None = None,
+) -> DataFrame:
+    """Executes validated SQL on the database, repeated queries are served from the result cache.
+
+    Aggregates that can be answered from a cube table are routed to it, queries on a
+    dictionary encoded table are rewritten to group and filter by its codes.
+    """
+    query = route_dictionary_query(route_query(query))
+    return result_cache.get(
+        query, DATABASE_URL, partial(execute_sql, timeout=timeout, token=token)
+    )
+
+
+def get_schema(question: str = "") -> str:
+    """Gets a compact schema of the tables and columns relevant to `question` as context for the LLM"""
+    return build_schema_context(question)
 
 
 repl = PythonREPL()
+# REPL the tools run the code in, see `isolated_repl`
+_current_repl: ContextVar[PythonREPL] = ContextVar("current_repl", default=repl)
+
+
+@contextmanager
+def isolated_repl() -> Iterator[PythonREPL]:
+    """Runs the REPL tools of the block in a new REPL, e.g. one per plot request"""
+    token = _current_repl.set(PythonREPL())
+    try:
+        yield _current_repl.get()
+    finally:
+        _current_repl.reset(token)
 
 
 # for not gemini models
@@ -51,7 +245,7 @@ def python_repl_tool_react(
     that generates plots. Only print the plot once.
     This is visible to the user."""
     try:
-        result = repl.run(code)
+        result = _current_repl.get().run(code)
     except BaseException as e:
         return f"Failed to execute. Error: {repr(e)}"
 
@@ -64,7 +258,7 @@ def repl_tool_gemini(code: str) -> str:
     that generates plots. Only print the plot once.
     This is visible to the user."""
     try:
-        result = repl.run(code)
+        result = _current_repl.get().run(code)
     except BaseException as e:
         return f"Failed to execute. Error: {repr(e)}"
 
@@ -12,6 +12,16 @@ from langgraph.types import Command
 from pydantic import BaseModel
 
 from src.agents import data_manager, plot_agent, plot_summary_agent, sql_agent
+from src.tools import (
+    artifact_collector,
+    DataReduction,
+    DtypeCompaction,
+    guard_query,
+    HISTOGRAM_COLUMNS,
+    plot_cache,
+    QueryCancelledError,
+    QueryGuardDecision,
+)
 
 if TYPE_CHECKING:
     from langgraph.graph.state import CompiledStateGraph
@@ -39,6 +49,12 @@ class PlotData(BaseModel):
     data_head: str | None = None
     plot_path: str | None = None
     plot_caption: str = ""
+    # the query result exceeded the row/memory ceiling and was cut
+    truncated: bool = False
+    # downsampling/pre-binning applied to the data before plotting
+    reduction: DataReduction = DataReduction()
+    # dtypes of the query result changed to save memory
+    compaction: DtypeCompaction = DtypeCompaction()
 
 
 class State(TypedDict):
@@ -50,9 +66,12 @@ class State(TypedDict):
     data_query: str
     plot_data: PlotData
     plot_summary: str
+    query_guard: QueryGuardDecision
+    # error that ended the last run early
+    error: str
 
 
-def sql_node(state: State) -> Command[Literal["extract_data"]]:
+def sql_node(state: State) -> Command[Literal["sql_guard"]]:
     user_query = state.get("user_query", "")
     if not user_query:
         raise ValueError("Query can't be empty")
@@ -63,31 +82,119 @@ def sql_node(state: State) -> Command[Literal["extract_data"]]:
         update={
             "sql_query": sql.query,
             "data_query": user_query,
+            "error": "",
         },
-        goto="extract_data",
+        goto="sql_guard",
     )
 
 
-def extract_data_node(state: State) -> Command[Literal["plot"]]:
-    data_path = data_manager.get_data_and_save(
-        state.get("sql_query", ""), state.get("unique_id")
+def sql_guard_node(state: State) -> Command[Literal["extract_data", END]]:  # type: ignore
+    """Checks the cost of the generated SQL query, limiting or rejecting expensive ones"""
+    decision = guard_query(state.get("sql_query", ""))
+
+    if decision.action == "reject":
+        return Command(
+            update={
+                "query_guard": decision,
+                "plot_data": PlotData(),
+                "plot_summary": f"The generated SQL query was rejected. {decision.reason}",
+            },
+            goto=END,
+        )
+
+    # served again to similar questions, rejected SQL never is
+    sql_agent.remember(state.get("user_query", ""), state.get("sql_query", ""))
+    return Command(
+        update={
+            "sql_query": decision.query,
+            "query_guard": decision,
+        },
+        goto="extract_data",
     )
 
+
+def extract_data_node(state: State) -> Command[Literal["reduce_data", END]]:  # type: ignore
+    try:
+        data_path = data_manager.get_data_and_save(
+            state.get("sql_query", ""), state.get("unique_id")
+        )
+    except QueryCancelledError as e:
+        # timed out or cancelled by the user
+        return Command(
+            update={
+                "error": str(e),
+                "plot_data": PlotData(),
+                "plot_summary": f"{e}.",
+            },
+            goto=END,
+        )
+
+    session = data_manager.session(state.get("unique_id"), state.get("sql_query", ""))
+    data = session.data
     return Command(
         update={
             "plot_data": PlotData(
                 data_path=data_path,
-                data_columns=data_manager.data.columns.to_list(),
+                data_columns=data.columns.to_list(),
+                data_head=str(data.head()),
+                truncated=data.attrs.get("truncated", False),
+                compaction=session.compaction,
             ),
         },
+        goto="reduce_data",
+    )
+
+
+def reduce_data_node(state: State) -> Command[Literal["plot", END]]:  # type: ignore
+    """Reduces large results to the points a plot can show before plotting them"""
+    try:
+        data_path, reduction = data_manager.reduce_and_save(
+            state.get("data_query", ""),
+            state.get("unique_id"),
+            state.get("sql_query", ""),
+        )
+    except QueryCancelledError as e:
+        # the session was dropped and extracting its data again timed out
+        return Command(
+            update={
+                "error": str(e),
+                "plot_data": PlotData(),
+                "plot_summary": f"{e}.",
+            },
+            goto=END,
+        )
+    plot_data = state.get("plot_data")
+    plot_data.data_path = data_path
+    plot_data.reduction = reduction
+    if reduction.method == "histogram":
+        plot_data.data_columns = [*reduction.groups, *HISTOGRAM_COLUMNS]
+
+    return Command(
+        update={
+            "plot_data": plot_data,
+        },
         goto="plot",
     )
 
 
-def plot_node(state: State) -> Command[Literal["plot_summarizer"]]:
-    plot_path = plot_agent.invoke(state)
+def plot_node(state: State) -> Command[Literal["plot_summarizer", END]]:  # type: ignore
     plot_data = state.get("plot_data")
+    # same data and instructions as an earlier request, e.g. of another session
+    cached = plot_cache.get(plot_data.data_path, state.get("data_query", ""))
+    if cached is not None:
+        plot_data.plot_path, plot_data.plot_caption, plot_summary = cached
+        data_manager.keep(state.get("unique_id"), plot_data.plot_path)
+        return Command(
+            update={
+                "plot_summary": plot_summary,
+                "plot_data": plot_data,
+            },
+            goto=END,
+        )
+
+    plot_path = plot_agent.invoke(state)
     plot_data.plot_path = plot_path
+    data_manager.keep(state.get("unique_id"), plot_path)
 
     return Command(
         update={
@@ -102,6 +209,13 @@ def plot_summarizer_node(state: State) -> Command[Literal[END]]:  # type: ignore
     result = plot_summary_agent.invoke(state)
     plot_data = state.get("plot_data")
     plot_data.plot_caption = result.caption
+    plot_cache.put(
+        plot_data.data_path,
+        state.get("data_query", ""),
+        plot_data.plot_path,
+        result.caption,
+        result.summary,
+    )
 
     return Command(
         update={
@@ -126,13 +240,18 @@ def initialize_graph() -> "CompiledStateGraph":
     graph = StateGraph(State)
 
     graph.add_node("sql_generator", sql_node)
+    graph.add_node("sql_guard", sql_guard_node)
     graph.add_node("extract_data", extract_data_node)
+    graph.add_node("reduce_data", reduce_data_node)
     graph.add_node("plot", plot_node)
     graph.add_node("plot_summarizer", plot_summarizer_node)
 
     graph.add_edge(START, "sql_generator")
 
-    return graph.compile(checkpointer=memory)
+    workflow = graph.compile(checkpointer=memory)
+    # the data and plots of the sessions kept are never deleted
+    artifact_collector.watch(data_manager, lambda manager: manager.live_artifacts())
+    return workflow
 
 
 def create_config(thread_id: str | None = None) -> "RunnableConfig":
@@ -7,6 +7,13 @@ from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command, interrupt
 
 from src.agents import data_manager, plot_agent, plot_summary_agent, sql_agent
+from src.tools import (
+    artifact_collector,
+    guard_query,
+    HISTOGRAM_COLUMNS,
+    plot_cache,
+    QueryCancelledError,
+)
 from src.workflow import PlotData, State
 
 if TYPE_CHECKING:
@@ -16,14 +23,30 @@ if TYPE_CHECKING:
 load_dotenv()
 
 
-def sql_node(state: State) -> Command[Literal["user_confirm_sql"]]:
+def sql_node(state: State) -> Command[Literal["sql_guard"]]:
     query = state.get("user_query", "")
     if not query:
         raise ValueError("Query can't be empty")
 
     sql = sql_agent.invoke(query)
     return Command(
-        update={"sql_query": sql.query},
+        update={"sql_query": sql.query, "error": ""},
+        goto="sql_guard",
+    )
+
+
+def sql_guard_node(state: State) -> Command[Literal["user_confirm_sql", END]]:  # type: ignore
+    """Checks the cost of the generated SQL query before the user confirms it"""
+    decision = guard_query(state.get("sql_query", ""))
+
+    if decision.action == "reject":
+        return Command(update={"query_guard": decision}, goto=END)
+
+    return Command(
+        update={
+            "sql_query": decision.query,
+            "query_guard": decision,
+        },
         goto="user_confirm_sql",
     )
 
@@ -31,25 +54,39 @@ def sql_node(state: State) -> Command[Literal["user_confirm_sql"]]:
 def user_confirm_sql_node(state: State) -> Command[Literal["extract_data", END]]:  # type: ignore
     """This node intentionally pauses execution for user to confirm the SQL query generated"""
 
+    decision = state.get("query_guard")
+    guard_note = f"{decision.reason}\n" if decision and decision.reason else ""
+
     is_approved = interrupt(
-        f"Generated SQL query:\n{state["sql_query"]}\nDo you want to continue? (yes/no) "
+        f"Generated SQL query:\n{state["sql_query"]}\n{guard_note}Do you want to continue? (yes/no) "
     ).lower() in {"yes", "y", "ye", "yeah", "sure"}
 
     if is_approved:
+        # accepted by the SQL guard and the user, served again to similar questions
+        sql_agent.remember(state.get("user_query", ""), state.get("sql_query", ""))
         return Command(goto="extract_data")
     return Command(goto=END)
 
 
-def extract_data_node(state: State) -> Command[Literal["user_confirm_data"]]:
-    data_path = data_manager.get_data_and_save(
-        state.get("sql_query", ""), state.get("unique_id")
-    )
+def extract_data_node(state: State) -> Command[Literal["user_confirm_data", END]]:  # type: ignore
+    try:
+        data_path = data_manager.get_data_and_save(
+            state.get("sql_query", ""), state.get("unique_id")
+        )
+    except QueryCancelledError as e:
+        # timed out or cancelled by the user
+        return Command(update={"error": str(e)}, goto=END)
 
+    session = data_manager.session(state.get("unique_id"), state.get("sql_query", ""))
+    data = session.data
     return Command(
         update={
             "plot_data": PlotData(
                 data_path=data_path,
-                data_columns=data_manager.data.columns.to_list(),
+                data_columns=data.columns.to_list(),
+                data_head=str(data.head()),
+                truncated=data.attrs.get("truncated", False),
+                compaction=session.compaction,
             ),
         },
         goto="user_confirm_data",
@@ -60,7 +97,7 @@ def user_confirm_data_node(state: State) -> Command[Literal["data_query", END]]:
     """This node intentionally pauses execution for user to confirm the the extracted data"""
 
     is_approved = interrupt(
-        f"First five rows of the data:\n```{data_manager.data.head()}\n```\nDo you want to continue? (yes/no)"
+        f"First five rows of the data:\n```{state.get("plot_data").data_head}\n```\nDo you want to continue? (yes/no)"
     ).lower() in {"yes", "y", "ye", "yeah", "sure"}
 
     if is_approved:
@@ -68,7 +105,7 @@ def user_confirm_data_node(state: State) -> Command[Literal["data_query", END]]:
     return Command(goto=END)
 
 
-def data_query_node(state: State) -> Command[Literal["plot", END]]:  # type: ignore
+def data_query_node(state: State) -> Command[Literal["reduce_data", END]]:  # type: ignore
     """This node prompts the user for information on the extracted data or terminate"""
 
     data_query: str = interrupt(
@@ -87,14 +124,58 @@ def data_query_node(state: State) -> Command[Literal["plot", END]]:  # type: ign
             "plot_summary": "",
             "plot_data": plot_data,
         },
+        goto="reduce_data",
+    )
+
+
+def reduce_data_node(state: State) -> Command[Literal["plot", END]]:  # type: ignore
+    """Reduces large results for the requested plot, the full data is kept for the next ones"""
+    try:
+        # extracted again when the session was dropped while waiting for the user
+        session = data_manager.session(
+            state.get("unique_id"), state.get("sql_query", "")
+        )
+        data_path, reduction = data_manager.reduce_and_save(
+            state.get("data_query", ""),
+            state.get("unique_id"),
+            state.get("sql_query", ""),
+        )
+    except QueryCancelledError as e:
+        # timed out or cancelled by the user
+        return Command(update={"error": str(e)}, goto=END)
+    plot_data = state.get("plot_data")
+    plot_data.data_path = data_path
+    plot_data.reduction = reduction
+    plot_data.data_columns = session.data.columns.to_list()
+    if reduction.method == "histogram":
+        plot_data.data_columns = [*reduction.groups, *HISTOGRAM_COLUMNS]
+
+    return Command(
+        update={
+            "plot_data": plot_data,
+        },
         goto="plot",
     )
 
 
-def plot_node(state: State) -> Command[Literal["plot_summarizer"]]:
-    plot_path = plot_agent.invoke(state)
+def plot_node(state: State) -> Command[Literal["plot_summarizer", "data_query"]]:
     plot_data = state.get("plot_data")
+    # same data and instructions as an earlier request, e.g. of another session
+    cached = plot_cache.get(plot_data.data_path, state.get("data_query", ""))
+    if cached is not None:
+        plot_data.plot_path, plot_data.plot_caption, plot_summary = cached
+        data_manager.keep(state.get("unique_id"), plot_data.plot_path)
+        return Command(
+            update={
+                "plot_summary": plot_summary,
+                "plot_data": plot_data,
+            },
+            goto="data_query",
+        )
+
+    plot_path = plot_agent.invoke(state)
     plot_data.plot_path = plot_path
+    data_manager.keep(state.get("unique_id"), plot_path)
 
     return Command(
         update={
@@ -109,6 +190,13 @@ def plot_summarizer_node(state: State) -> Command[Literal["data_query"]]:
     result = plot_summary_agent.invoke(state)
     plot_data = state.get("plot_data")
     plot_data.plot_caption = result.caption
+    plot_cache.put(
+        plot_data.data_path,
+        state.get("data_query", ""),
+        plot_data.plot_path,
+        result.caption,
+        result.summary,
+    )
 
     return Command(
         update={
@@ -125,13 +213,19 @@ def initialize_graph() -> "CompiledStateGraph":
     graph = StateGraph(State)
 
     graph.add_node("sql_generator", sql_node)
+    graph.add_node("sql_guard", sql_guard_node)
     graph.add_node("user_confirm_sql", user_confirm_sql_node)
     graph.add_node("extract_data", extract_data_node)
     graph.add_node("user_confirm_data", user_confirm_data_node)
     graph.add_node("data_query", data_query_node)
+    graph.add_node("reduce_data", reduce_data_node)
     graph.add_node("plot", plot_node)
     graph.add_node("plot_summarizer", plot_summarizer_node)
 
     graph.add_edge(START, "sql_generator")
 
-    return graph.compile(checkpointer=memory)
+    workflow = graph.compile(checkpointer=memory)
+    # the data and plots of the sessions kept are never deleted, e.g. the full data
+    # plotted again on the next plot instructions
+    artifact_collector.watch(data_manager, lambda manager: manager.live_artifacts())
+    return workflow
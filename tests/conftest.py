@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from create_db import create_db
+
+CSV = Path(__file__).parent.parent / "data" / "shopping_trends.csv"
+
+
+def build_database(folder: Path, *options: str) -> str:
+    """Loads the shopping trends csv into a new database, returns its path"""
+    result = CliRunner().invoke(
+        create_db,
+        ["--data_file", str(CSV), "--db_path", str(folder), "--workers", "1", *options],
+    )
+    assert result.exit_code == 0, result.output
+    return str(folder / "database.db")
+
+
+@pytest.fixture(scope="session")
+def database(tmp_path_factory) -> str:
+    return build_database(tmp_path_factory.mktemp("wide"))
+
+
+@pytest.fixture(scope="session")
+def cube_database(tmp_path_factory) -> str:
+    return build_database(tmp_path_factory.mktemp("cube"), "--cube_dimensions", "2")
+
+
+@pytest.fixture(scope="session")
+def dictionary_database(tmp_path_factory) -> str:
+    return build_database(
+        tmp_path_factory.mktemp("dictionary"), "--layout", "dictionary"
+    )
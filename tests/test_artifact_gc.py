@@ -0,0 +1,112 @@
+import gc
+import os
+import time
+
+import pytest
+from pandas import DataFrame
+
+from src.tools.artifact_gc import ArtifactCollector
+from src.tools.artifact_store import ArtifactStore
+
+HOUR = 3600
+
+
+class Session:
+    """Owner of artifacts, as the data manager"""
+
+    def __init__(self, *references: str) -> None:
+        self.references = list(references)
+
+
+def frame(rows: int = 100) -> DataFrame:
+    return DataFrame({"value": range(rows)})
+
+
+def age(store: ArtifactStore, key: str, seconds: float) -> None:
+    """Makes the artifact `key` and its file look unused for `seconds`"""
+    for stored_key, entry in store.items():
+        if stored_key == key:
+            entry.accessed -= seconds
+            if entry.path is not None:
+                age_file(entry.path, seconds)
+
+
+def age_file(path, seconds: float) -> None:
+    accessed = time.time() - seconds
+    os.utime(path, (accessed, accessed))
+
+
+def write_file(path, size: int, seconds: float = 0) -> str:
+    path.write_bytes(b"x" * size)
+    age_file(path, seconds)
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path) -> ArtifactStore:
+    return ArtifactStore(max_bytes=1024**2, spill_dir=str(tmp_path / "artifacts"))
+
+
+def collector(store: ArtifactStore, **options) -> ArtifactCollector:
+    return ArtifactCollector(
+        store, **{"ttl": HOUR, "quota_bytes": 0, **options}, interval=0
+    )
+
+
+def test_artifacts_unused_for_longer_than_the_ttl_are_deleted(store):
+    store.put("data_old", frame())
+    store.put("data_new", frame())
+    age(store, "data_old", 2 * HOUR)
+    old_plot = write_file(store.spill_dir / "plot_old.png", 100, seconds=2 * HOUR)
+    new_plot = write_file(store.spill_dir / "plot_new.png", 100)
+
+    stats = collector(store).sweep()
+    assert "data_old" not in store and "data_new" in store
+    assert not os.path.exists(old_plot) and os.path.exists(new_plot)
+    assert stats["expired"] == 2
+
+
+def test_least_recently_used_files_are_deleted_above_the_quota(store):
+    plots = [
+        write_file(store.spill_dir / f"plot_{index}.png", 1000, seconds=60 - index)
+        for index in range(3)
+    ]
+    stats = collector(store, quota_bytes=2500).sweep()
+    assert [os.path.exists(plot) for plot in plots] == [False, True, True]
+    assert stats["disk_bytes"] == 2000
+    assert stats["expired"] == 0
+
+
+def test_spilled_artifacts_count_towards_the_quota(tmp_path):
+    store = ArtifactStore(max_bytes=0, spill_dir=str(tmp_path / "artifacts"))
+    store.put("data_old", frame(10_000))
+    store.put("data_new", frame(10_000))
+    age(store, "data_old", 60)
+    size = sum(path.stat().st_size for path in store.spill_dir.iterdir())
+
+    collector(store, quota_bytes=size * 3 // 4).sweep()
+    assert "data_old" not in store and "data_new" in store
+    assert len(list(store.spill_dir.iterdir())) == 1
+
+
+def test_live_and_pinned_artifacts_are_kept(store):
+    store.put("data_live", frame())
+    store.put("data_pinned", frame())
+    live_plot = write_file(store.spill_dir / "plot_live.png", 1000, seconds=2 * HOUR)
+    for key in ("data_live", "data_pinned"):
+        age(store, key, 2 * HOUR)
+
+    sweeper = collector(store, quota_bytes=1)
+    session = Session("artifact://data_live", live_plot)
+    sweeper.watch(session, lambda owner: owner.references)
+    with store.pinned("artifact://data_pinned"):
+        sweeper.sweep()
+        assert "data_live" in store and "data_pinned" in store
+        assert os.path.exists(live_plot)
+
+    # the artifacts of a dropped session are collected
+    del session
+    gc.collect()
+    sweeper.sweep()
+    assert "data_live" not in store and "data_pinned" not in store
+    assert not os.path.exists(live_plot)
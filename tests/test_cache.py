@@ -0,0 +1,86 @@
+import shutil
+import sqlite3
+
+import pytest
+from pandas import DataFrame
+
+from src.tools.cache import ResultCache
+from src.tools.tools import execute_sql
+
+
+class CountingExecute:
+    """`execute_sql` on a database, counting the queries actually run"""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.queries: list[str] = []
+
+    def __call__(self, query: str) -> DataFrame:
+        self.queries.append(query)
+        return execute_sql(query, url=self.url)
+
+
+@pytest.fixture
+def database_copy(database, tmp_path) -> str:
+    return str(shutil.copy(database, tmp_path / "database.db"))
+
+
+def test_repeated_queries_are_served_from_the_cache(database):
+    cache = ResultCache(max_bytes=1024**2)
+    execute = CountingExecute(database)
+    query = "SELECT category, COUNT(*) AS n FROM purchases GROUP BY category"
+
+    first = cache.get(query, database, execute)
+    # the same query once normalized
+    second = cache.get(query.replace(" ", "  ").lower(), database, execute)
+    assert execute.queries == [query]
+    assert second.equals(first)
+    assert cache.stats()["hits"] == 1
+
+    # callers own the returned frames
+    second["n"] = 0
+    assert cache.get(query, database, execute).equals(first)
+
+
+def test_least_recently_used_results_are_evicted_above_the_budget(database):
+    execute = CountingExecute(database)
+    queries = [
+        f"SELECT customer_id, age FROM purchases WHERE season = '{season}'"
+        for season in ("Winter", "Spring", "Summer")
+    ]
+    size = int(execute_sql(queries[0], url=database).memory_usage(deep=True).sum())
+    cache = ResultCache(max_bytes=int(size * 2.5))
+
+    cache.get(queries[0], database, execute)
+    cache.get(queries[1], database, execute)
+    cache.get(queries[0], database, execute)
+    cache.get(queries[2], database, execute)
+    assert cache.stats()["evictions"] == 1
+    assert cache.bytes <= cache.max_bytes
+
+    cache.get(queries[0], database, execute)
+    cache.get(queries[1], database, execute)
+    # the second query was the least recently used
+    assert execute.queries == [queries[0], queries[1], queries[2], queries[1]]
+
+
+def test_results_larger_than_the_budget_are_not_cached(database):
+    cache = ResultCache(max_bytes=1024)
+    execute = CountingExecute(database)
+    query = "SELECT * FROM purchases"
+    assert len(cache.get(query, database, execute)) == 3900
+    assert len(cache.get(query, database, execute)) == 3900
+    assert execute.queries == [query, query]
+    assert cache.stats()["entries"] == 0
+
+
+def test_results_are_not_served_once_the_database_changed(database_copy):
+    cache = ResultCache(max_bytes=1024**2)
+    execute = CountingExecute(database_copy)
+    query = "SELECT COUNT(*) AS n FROM purchases"
+    assert cache.get(query, database_copy, execute)["n"].item() == 3900
+
+    with sqlite3.connect(database_copy) as conn:
+        conn.execute("DELETE FROM purchases WHERE customer_id <= 100")
+    assert cache.get(query, database_copy, execute)["n"].item() == 3800
+    assert execute.queries == [query, query]
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from src.tools.cancel import (
+    CancellationRegistry,
+    CancellationToken,
+    QueryCancelledError,
+    QueryTimeoutError,
+)
+from src.tools.tools import execute_sql
+
+# a recursive CTE running for minutes unless interrupted
+SLOW_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+    "SELECT COUNT(*) FROM n"
+)
+
+
+def test_slow_queries_time_out(database):
+    start = time.monotonic()
+    with pytest.raises(QueryTimeoutError):
+        execute_sql(SLOW_QUERY, url=database, timeout=0.2)
+    assert time.monotonic() - start < 5
+
+
+def test_running_queries_are_cancelled_by_their_key(database):
+    registry = CancellationRegistry()
+    token = registry.start("session")
+    errors = []
+
+    def run():
+        try:
+            execute_sql(SLOW_QUERY, url=database, timeout=0, token=token)
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    time.sleep(0.2)
+    assert registry.cancel("session")
+    thread.join(5)
+    assert not thread.is_alive()
+    registry.finish("session", token)
+
+    # cancelled by the user, not timed out
+    assert type(errors[0]) is QueryCancelledError
+    assert not registry.cancel("session")
+    # the pooled connection is usable again
+    assert len(execute_sql("SELECT 1 AS one", url=database)) == 1
+
+
+def test_cancelled_tokens_stop_queries_before_they_run(database):
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(QueryCancelledError):
+        execute_sql("SELECT * FROM purchases", url=database, token=token)
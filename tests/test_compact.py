@@ -0,0 +1,69 @@
+import numpy as np
+from pandas import DataFrame, Series
+from pandas.testing import assert_frame_equal
+
+from src.tools.compact import compact_column, compact_frame
+from src.tools.tools import execute_sql
+
+
+def assert_same_values(compacted: DataFrame, data: DataFrame) -> None:
+    assert_frame_equal(compacted, data, check_dtype=False, check_categorical=False)
+
+
+def test_query_results_round_trip(database):
+    data = execute_sql(
+        "SELECT customer_id, age, gender, category, purchase_amount, "
+        "review_rating, season, subscription_status FROM purchases",
+        url=database,
+    )
+    compacted, compaction = compact_frame(data)
+
+    assert_same_values(compacted, data)
+    assert compaction.saved_bytes > 0
+    assert compaction.bytes == compacted.memory_usage(index=True, deep=True).sum()
+    assert compacted["age"].dtype == np.int8
+    assert compacted["customer_id"].dtype == np.int16
+    assert compacted["season"].dtype == "category"
+    # enums are categories already
+    assert "gender" not in compaction.columns
+
+
+def test_values_are_kept_as_is():
+    data = DataFrame(
+        {
+            "count": [1, 2, 70_000],
+            "price": [1.5, np.nan, 20.25],
+            "average": [1 / 3, 2 / 3, 0.1],
+            "flag": [True, None, False],
+            "name": ["a", "b", "c"],
+            "label": ["x", None, "x"],
+        }
+    )
+    compacted, compaction = compact_frame(data)
+
+    assert_same_values(compacted, data.assign(flag=data["flag"].astype("boolean")))
+    assert compacted["count"].dtype == np.int32
+    assert compacted["price"].dtype == np.float32
+    # float32 would round the averages
+    assert compacted["average"].dtype == np.float64
+    assert compacted["flag"].dtype == "boolean"
+    assert compacted["flag"].isna().tolist() == [False, True, False]
+    # unique strings stay strings
+    assert compacted["name"].dtype == data["name"].dtype
+    assert compacted["label"].dtype == "category"
+    assert compacted["label"].isna().tolist() == [False, True, False]
+    assert set(compaction.columns) == {"count", "price", "flag", "label"}
+
+
+def test_duplicated_columns_are_compacted_positionally():
+    data = DataFrame([[1, "x"], [2, "x"]], columns=["value", "value"])
+    compacted, _ = compact_frame(data)
+    assert list(compacted.dtypes) == [np.int8, "category"]
+    assert_same_values(compacted, data)
+    # the original is unchanged
+    assert data.dtypes.iloc[0] == np.int64
+
+
+def test_mixed_object_columns_are_not_converted():
+    column = Series([True, 1, "yes"], dtype=object)
+    assert compact_column(column).dtype == object
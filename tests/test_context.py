@@ -0,0 +1,20 @@
+from src.tools.cache import schema_cache
+from src.tools.context import build_schema_context
+
+
+def test_rendering_is_cached_across_questions(database):
+    build_schema_context("purchases per category", database)
+    misses = schema_cache.misses
+    first = build_schema_context("purchases per category", database)
+    second = build_schema_context("average age per season", database)
+    assert schema_cache.misses == misses
+    assert first == second
+    assert "category TEXT" in first and "season TEXT" in first
+
+
+def test_least_relevant_columns_are_left_out_of_the_budget(database):
+    context = build_schema_context("average age per season", database, budget=40)
+    assert context.startswith("Table purchases:")
+    assert "age INTEGER" in context and "season TEXT" in context
+    assert "payment_method" not in context
+    assert "less relevant columns omitted" in context
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from create_db import range_checksum, split_ranges, written_atomically
+
+CSV = Path(__file__).parent.parent / "data" / "shopping_trends.csv"
+
+
+def write_csv(path: Path, header: str, rows: list[str]) -> str:
+    path.write_text(header + "".join(rows))
+    return str(path)
+
+
+def checksums(data_file: str, batch_size: int) -> list[str]:
+    return [
+        range_checksum(data_file, start, end)
+        for start, end in split_ranges(data_file, batch_size)
+    ]
+
+
+@pytest.fixture(scope="module")
+def csv_rows() -> tuple[str, list[str]]:
+    header, *rows = CSV.read_text().splitlines(keepends=True)
+    return header, rows
+
+
+def test_ranges_cover_every_row(tmp_path, csv_rows):
+    header, rows = csv_rows
+    data_file = write_csv(tmp_path / "data.csv", header, rows)
+    ranges = split_ranges(data_file, 100)
+    assert ranges[0][0] == len(header)
+    assert ranges[-1][1] == Path(data_file).stat().st_size
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert 10 < len(ranges) < 160
+
+
+def test_edited_row_only_changes_its_chunk(tmp_path, csv_rows):
+    header, rows = csv_rows
+    before = checksums(write_csv(tmp_path / "before.csv", header, rows), 100)
+    # several rows longer, it moves the line break following every byte offset
+    edited = rows.copy()
+    edited[1000] = edited[1000].replace(",", f",{'x' * 500}", 1)
+    after = checksums(write_csv(tmp_path / "after.csv", header, edited), 100)
+    assert len(set(after) - set(before)) <= 2
+    assert len(set(before) & set(after)) >= len(before) - 2
+
+
+def test_inserted_row_only_changes_its_chunk(tmp_path, csv_rows):
+    header, rows = csv_rows
+    before = checksums(write_csv(tmp_path / "before.csv", header, rows), 100)
+    inserted = [*rows[:2000], rows[5], *rows[2000:]]
+    after = checksums(write_csv(tmp_path / "after.csv", header, inserted), 100)
+    assert len(set(after) - set(before)) <= 2
+
+
+@pytest.mark.parametrize("rows_count", [3900, 300, 40])
+def test_appended_rows_only_change_the_last_chunk(tmp_path, csv_rows, rows_count):
+    header, rows = csv_rows
+    before = checksums(
+        write_csv(tmp_path / "before.csv", header, rows[:rows_count]), 10
+    )
+    # longer rows change the average row length of the file
+    appended = [row.replace(",", f",{'x' * 200}", 1) for row in rows[-25:]]
+    after = checksums(
+        write_csv(tmp_path / "after.csv", header, rows[:rows_count] + appended), 10
+    )
+    assert after[: len(before) - 1] == before[:-1]
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    path = tmp_path / "database.db"
+    with pytest.raises(ValueError):
+        with written_atomically(path) as partial:
+            partial.write_text("half")
+            raise ValueError("invalid row")
+    assert list(tmp_path.iterdir()) == []
+
+    with written_atomically(path) as partial:
+        partial.write_text("complete")
+    assert path.read_text() == "complete"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+from src.tools.cube import route_query
+
+
+def rows(database: str, query: str) -> list[tuple]:
+    with sqlite3.connect(database) as conn:
+        return conn.execute(query).fetchall()
+
+
+def assert_same_rows(expected: list[tuple], actual: list[tuple]) -> None:
+    assert len(expected) == len(actual)
+    for expected_row, actual_row in zip(expected, actual):
+        assert actual_row == pytest.approx(expected_row)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT category, COUNT(*) FROM purchases GROUP BY category ORDER BY category",
+        "SELECT gender, season, SUM(purchase_amount) AS total, "
+        "AVG(review_rating) AS rating FROM purchases "
+        "GROUP BY gender, season ORDER BY gender, season",
+        "SELECT COUNT(*), MIN(previous_purchases), MAX(previous_purchases) "
+        "FROM purchases WHERE season = 'Winter'",
+        "SELECT category, AVG(purchase_amount) AS average FROM purchases "
+        "WHERE gender = 'MALE' GROUP BY category ORDER BY average DESC LIMIT 3",
+        "SELECT season, COUNT(*) AS purchases FROM purchases GROUP BY season "
+        "HAVING COUNT(*) > 980 ORDER BY season",
+        "SELECT payment_method, COUNT(review_rating) FROM purchases "
+        "WHERE category IN ('Clothing', 'Footwear') GROUP BY payment_method "
+        "ORDER BY payment_method",
+        "SELECT COUNT(*) FROM purchases WHERE category = 'Unknown'",
+    ],
+)
+def test_routed_queries_return_the_rows_of_the_base_table(cube_database, query):
+    routed = route_query(query, cube_database)
+    assert "FROM cube__" in routed
+    assert_same_rows(rows(cube_database, query), rows(cube_database, routed))
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        # filtered or grouped by columns that aren't cube dimensions
+        "SELECT category, COUNT(*) FROM purchases WHERE age > 30 GROUP BY category",
+        "SELECT location, COUNT(*) FROM purchases GROUP BY location",
+        # aggregates the cube can't recompute
+        "SELECT category, AVG(age) FROM purchases GROUP BY category",
+        "SELECT COUNT(DISTINCT customer_id) FROM purchases",
+        "SELECT category, GROUP_CONCAT(color) FROM purchases GROUP BY category",
+        "SELECT DISTINCT category FROM purchases",
+        # rows, not aggregates
+        "SELECT category, purchase_amount FROM purchases",
+        "SELECT * FROM purchases WHERE season = 'Winter'",
+        "SELECT category, COUNT(*) FROM purchases "
+        "WHERE customer_id IN (SELECT customer_id FROM purchases) GROUP BY category",
+        "SELECT p.category, COUNT(*) FROM purchases p GROUP BY p.category",
+    ],
+)
+def test_other_queries_are_not_routed(cube_database, query):
+    assert route_query(query, cube_database) == query
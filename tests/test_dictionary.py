@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from src.tools.dictionary import FACT_TABLE, route_dictionary_query
+
+
+def rows(database: str, query: str) -> list[tuple]:
+    with sqlite3.connect(database) as conn:
+        return conn.execute(query).fetchall()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        # filters
+        "SELECT customer_id, category, color FROM purchases "
+        "WHERE gender = 'FEMALE' AND season = 'Winter' ORDER BY customer_id",
+        "SELECT COUNT(*) FROM purchases WHERE category IN ('Clothing', 'Footwear')",
+        "SELECT customer_id, location FROM purchases "
+        "WHERE season = 'Summer' AND location LIKE 'New%' ORDER BY customer_id",
+        "SELECT COUNT(*) FROM purchases WHERE color = 'Unknown'",
+        "SELECT customer_id FROM purchases "
+        "WHERE size IN ('S') AND item_purchased = 'Blouse' ORDER BY customer_id",
+        # group by
+        "SELECT category, COUNT(*) FROM purchases GROUP BY category ORDER BY category",
+        "SELECT gender, season, AVG(purchase_amount) AS average FROM purchases "
+        "GROUP BY gender, season ORDER BY average DESC",
+        "SELECT location, SUM(purchase_amount) FROM purchases "
+        "WHERE payment_method = 'PAYPAL' GROUP BY location "
+        "HAVING COUNT(*) > 10 ORDER BY location",
+        "SELECT UPPER(color), COUNT(*) FROM purchases GROUP BY UPPER(color) "
+        "ORDER BY UPPER(color)",
+        # ORDER BY decoded columns
+        "SELECT customer_id, color FROM purchases WHERE category = 'Outerwear' "
+        "ORDER BY color, customer_id LIMIT 20",
+        "SELECT season AS s, COUNT(*) AS n FROM purchases GROUP BY season "
+        "ORDER BY s DESC",
+        "SELECT shipping_type, COUNT(*) FROM purchases GROUP BY shipping_type "
+        "ORDER BY shipping_type DESC LIMIT 3",
+    ],
+)
+def test_rewritten_queries_return_the_rows_of_the_view(dictionary_database, query):
+    routed = route_dictionary_query(query, dictionary_database)
+    assert f"FROM {FACT_TABLE}" in routed
+    expected = rows(dictionary_database, query)
+    actual = rows(dictionary_database, routed)
+    assert len(expected) == len(actual)
+    for expected_row, actual_row in zip(expected, actual):
+        assert actual_row == pytest.approx(expected_row)
+    with sqlite3.connect(dictionary_database) as conn:
+        assert [column[0] for column in conn.execute(routed).description] == [
+            column[0] for column in conn.execute(query).description
+        ]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        # nothing to gain, the rows are decoded anyway
+        "SELECT * FROM purchases WHERE age > 30",
+        "SELECT customer_id FROM purchases WHERE location LIKE 'New%'",
+        # not a single table query
+        "SELECT category, COUNT(*) FROM purchases "
+        "WHERE customer_id IN (SELECT customer_id FROM purchases) GROUP BY category",
+        "SELECT DISTINCT category FROM purchases WHERE gender = 'MALE'",
+        "SELECT purchases.category, COUNT(*) FROM purchases "
+        "GROUP BY purchases.category",
+    ],
+)
+def test_other_queries_are_not_rewritten(dictionary_database, query):
+    assert route_dictionary_query(query, dictionary_database) == query
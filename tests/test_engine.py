@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.tools.engine import PoolStats
+
+
+def test_pool_stats_counts_every_concurrent_event():
+    stats = PoolStats()
+
+    def checkout_and_checkin(_):
+        for _ in range(1000):
+            stats.add(checkouts=1)
+            stats.add(checkins=1, wait_seconds=0.5)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(checkout_and_checkin, range(8)))
+    assert stats.to_dict() == {
+        "checkouts": 8000,
+        "checkins": 8000,
+        "connects": 0,
+        "waits": 0,
+        "wait_seconds": 4000.0,
+        "hit_ratio": 1.0,
+    }
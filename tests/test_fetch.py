@@ -0,0 +1,48 @@
+import sqlite3
+
+import pytest
+
+from src.tools.tools import execute_sql
+
+
+def rows(database: str, query: str) -> list[tuple]:
+    with sqlite3.connect(database) as conn:
+        return conn.execute(query).fetchall()
+
+
+@pytest.mark.parametrize(
+    "query, dtypes",
+    [
+        (
+            "SELECT gender, SUM(discount_applied) AS discount_applied, COUNT(*) AS n "
+            "FROM purchases GROUP BY gender ORDER BY gender",
+            ["category", "int64", "int64"],
+        ),
+        (
+            "SELECT season, MAX(discount_applied) AS discount_applied "
+            "FROM purchases GROUP BY season ORDER BY season",
+            ["object|str", "bool"],
+        ),
+        (
+            "SELECT COUNT(DISTINCT category) AS gender, SUM(age) AS age "
+            "FROM purchases",
+            ["int64", "int64"],
+        ),
+        (
+            "SELECT LOWER(gender) AS gender, AVG(age) AS age FROM purchases "
+            "GROUP BY gender ORDER BY gender",
+            ["object|str", "float64"],
+        ),
+        (
+            "SELECT customer_id, gender, discount_applied FROM purchases "
+            "ORDER BY customer_id LIMIT 50",
+            ["int64", "category", "bool"],
+        ),
+    ],
+)
+def test_aliased_expressions_keep_their_values(database, query, dtypes):
+    data = execute_sql(query, url=database)
+    for dtype, expected in zip(data.dtypes, dtypes):
+        assert str(dtype) in expected.split("|")
+    # sqlite3 returns the values as they are, booleans as 0 and 1
+    assert [tuple(row) for row in data.itertuples(index=False)] == rows(database, query)
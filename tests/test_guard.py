@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from src.tools.guard import guard_query
+
+MAX_ROWS = 100
+
+
+def guard(database: str, query: str):
+    return guard_query(query, database, max_cost=1000, max_rows=MAX_ROWS)
+
+
+@pytest.mark.parametrize(
+    "query, rows",
+    [
+        ("SELECT COUNT(*), AVG(purchase_amount) FROM purchases", 1),
+        ("SELECT MAX(age) FROM purchases WHERE season = 'Winter'", 1),
+        ("SELECT category, COUNT(*) FROM purchases GROUP BY category", None),
+        ("SELECT * FROM purchases WHERE customer_id = 3", None),
+        ("SELECT gender, age FROM purchases ORDER BY age DESC LIMIT 10", 10),
+    ],
+)
+def test_cheap_queries_are_accepted(database, query, rows):
+    decision = guard(database, query)
+    assert decision.action == "accept", decision.reason
+    assert decision.query == query
+    if rows is not None:
+        assert decision.estimated_rows == rows
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM purchases",
+        # aggregates, but not one row
+        "SELECT customer_id, COUNT(*) OVER (PARTITION BY category) FROM purchases",
+        "SELECT *, (SELECT AVG(age) FROM purchases) AS average FROM purchases",
+        "WITH oldest AS (SELECT MAX(age) AS age FROM purchases) "
+        "SELECT * FROM purchases, oldest",
+        "SELECT COUNT(*) FROM purchases UNION ALL SELECT age FROM purchases",
+    ],
+)
+def test_large_results_are_limited(database, query):
+    decision = guard(database, query)
+    assert decision.action == "limit", decision.reason
+    assert decision.query.endswith(f"LIMIT {MAX_ROWS}")
+    with sqlite3.connect(database) as conn:
+        assert len(conn.execute(decision.query).fetchall()) == MAX_ROWS
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "DELETE FROM purchases",
+        "UPDATE purchases SET age = 0",
+        "WITH young AS (SELECT customer_id FROM purchases WHERE age < 20) "
+        "DELETE FROM purchases WHERE customer_id IN (SELECT customer_id FROM young)",
+        "PRAGMA table_info(purchases)",
+        "ATTACH DATABASE ':memory:' AS other",
+        "SELECT * FROM missing_table",
+        # a full scan per row, sorted so it can't be streamed and limited
+        "SELECT a.gender, COUNT(*) FROM purchases a CROSS JOIN purchases b "
+        "GROUP BY a.gender",
+    ],
+)
+def test_writes_invalid_and_expensive_queries_are_rejected(database, query):
+    decision = guard(database, query)
+    assert decision.action == "reject"
+    assert decision.reason
+    with sqlite3.connect(database) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM purchases").fetchone()[0] == 3900
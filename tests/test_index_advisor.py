@@ -0,0 +1,39 @@
+from index_advisor import recommend
+
+COLUMNS = ["customer_id", "gender", "category", "season", "age"]
+
+
+def entry(query: str, plan: list[str], seconds: float = 1.0) -> dict:
+    return {"query": query, "plan": plan, "seconds": seconds}
+
+
+def recommended(entries: list[dict]) -> list[tuple[str, ...]]:
+    return [candidate for candidate, *_ in recommend(entries, COLUMNS, set(), 1)]
+
+
+def test_scans_of_the_table_and_its_aliases_are_counted():
+    entries = [
+        entry("SELECT * FROM purchases WHERE season = 'Winter'", ["SCAN purchases"]),
+        entry("SELECT * FROM purchases AS p WHERE p.age > 30", ["SCAN p"]),
+        entry("SELECT * FROM fact__purchases f WHERE f.gender = 1", ["SCAN f"]),
+    ]
+    assert set(recommended(entries)) == {("season",), ("age",), ("gender",)}
+
+
+def test_scans_of_subqueries_and_searches_are_ignored():
+    entries = [
+        entry(
+            "WITH t AS (SELECT category FROM purchases WHERE customer_id = 3) "
+            "SELECT category FROM t ORDER BY category",
+            [
+                "SEARCH purchases USING INTEGER PRIMARY KEY (rowid=?)",
+                "SCAN t",
+                "USE TEMP B-TREE FOR ORDER BY",
+            ],
+        ),
+        entry(
+            "SELECT * FROM purchases WHERE customer_id = 3",
+            ["SEARCH purchases USING INTEGER PRIMARY KEY (rowid=?)"],
+        ),
+    ]
+    assert recommended(entries) == []
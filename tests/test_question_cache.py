@@ -0,0 +1,78 @@
+import pytest
+
+from src.tools.context import words
+from src.tools.question_cache import QuestionCache, key_terms
+
+SCHEMA = "sqlite:test"
+VOCABULARY = frozenset(
+    words(
+        "customer_id age gender category purchase_amount_usd season "
+        "discount_applied Male Female Clothing Footwear Winter Summer"
+    )
+)
+
+
+@pytest.fixture
+def cache() -> QuestionCache:
+    return QuestionCache(path="", vocabulary=lambda: VOCABULARY)
+
+
+@pytest.mark.parametrize(
+    "cached, question",
+    [
+        (
+            "count of purchases by category for male customers",
+            "count of purchases by category for female customers",
+        ),
+        ("count of purchases with a discount", "count of purchases without a discount"),
+        (
+            "purchases of customers older than 30",
+            "purchases of customers younger than 30",
+        ),
+        (
+            "purchases of customers older than 30",
+            "purchases of customers older than 40",
+        ),
+        ("average purchase amount in Winter", "average purchase amount in Summer"),
+        ("purchases in Alabama by category", "purchases in Texas by category"),
+        ("customers who applied a discount", "customers who didn't apply a discount"),
+        ("top 5 categories by purchases", "bottom 5 categories by purchases"),
+        ("average age by gender", "average age by season"),
+    ],
+)
+def test_near_misses_are_not_served(cache, cached, question):
+    cache.store(cached, "SELECT 1", SCHEMA)
+    assert key_terms(cached, VOCABULARY) != key_terms(question, VOCABULARY)
+    assert cache.lookup(question, SCHEMA) is None
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "count of purchases by category for male customers",
+        "Count of purchases per category for male customers?",
+        "count of the purchases by categories for male customers",
+    ],
+)
+def test_rephrased_questions_are_served(cache, question):
+    cache.store("count of purchases by category for male customers", "SELECT 1", SCHEMA)
+    assert cache.lookup(question, SCHEMA) == "SELECT 1"
+    assert cache.stats()["hits"] == 1
+
+
+def test_schema_change_drops_entries(cache):
+    cache.store("average age by gender", "SELECT 1", SCHEMA)
+    assert cache.lookup("average age by gender", "sqlite:other") is None
+    assert cache.lookup("average age by gender", SCHEMA) is None
+
+
+def test_questions_already_served_are_not_stored_again(cache):
+    cache.store("count of purchases by category for male customers", "SELECT 1", SCHEMA)
+    cache.store(
+        "Count of purchases per category for male customers?", "SELECT 1", SCHEMA
+    )
+    assert cache.stats()["entries"] == 1
+    # a new SQL for the same question is kept
+    cache.store("count of purchases by category for male customers", "SELECT 2", SCHEMA)
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["hits"] == 0
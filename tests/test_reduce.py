@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from src.tools.reduce import HISTOGRAM_COLUMNS, reduce_data
+
+ROWS = 20_000
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    return np.random.default_rng(0)
+
+
+def test_distribution_of_an_integer_measure_is_binned_by_integers(rng):
+    data = DataFrame({"age": rng.integers(18, 71, ROWS)})
+    reduced, reduction = reduce_data(data, "histogram of the age", 1000, bins=50)
+
+    assert reduction.method == "histogram"
+    assert list(reduced.columns) == HISTOGRAM_COLUMNS
+    widths = reduced["bin_end"] - reduced["bin_start"]
+    assert (widths == 2).all()
+    assert (reduced["bin_start"] % 1 == 0).all()
+    assert reduced["count"].sum() == ROWS
+
+
+def test_distribution_per_group_shares_the_bins(rng):
+    data = DataFrame(
+        {
+            "amount": rng.normal(50, 10, ROWS),
+            "gender": rng.choice(["FEMALE", "MALE"], ROWS),
+        }
+    )
+    reduced, reduction = reduce_data(data, "distribution of amount by gender", 1000)
+
+    assert reduction.method == "histogram"
+    assert reduction.groups == ["gender"]
+    assert list(reduced.columns) == ["gender", *HISTOGRAM_COLUMNS]
+    counts = reduced.groupby("gender")["count"].sum()
+    assert counts.to_dict() == data["gender"].value_counts().to_dict()
+    # the same equal width bins for both groups
+    widths = reduced["bin_end"] - reduced["bin_start"]
+    assert widths.to_numpy() == pytest.approx(widths.iloc[0])
+    assert reduced["bin_start"].nunique() <= 50
+
+
+@pytest.mark.parametrize("query", ["box plot of the amounts", "amounts", ""])
+def test_single_measure_is_sampled_unless_a_distribution_is_asked(rng, query):
+    data = DataFrame({"amount": rng.normal(50, 10, ROWS)})
+    reduced, reduction = reduce_data(data, query, 1000)
+
+    assert reduction.method == "uniform_sample"
+    assert list(reduced.columns) == ["amount"]
+    assert len(reduced) == 1000
+    assert reduced["amount"].isin(data["amount"]).all()
+
+
+def test_sorted_series_is_downsampled_with_lttb():
+    x = np.arange(ROWS)
+    data = DataFrame({"day": x, "sales": np.sin(x / 500) + x / ROWS})
+    reduced, reduction = reduce_data(data, "sales over time", 1000)
+
+    assert reduction.method == "lttb"
+    assert reduction.columns == ["day", "sales"]
+    assert len(reduced) == 1000
+    assert reduced["day"].is_monotonic_increasing
+    assert reduced["day"].iloc[[0, -1]].tolist() == [0, ROWS - 1]
+    # the peaks of the series are kept
+    assert reduced["sales"].max() == pytest.approx(data["sales"].max(), abs=1e-3)
+
+
+def test_unsorted_x_is_sampled(rng):
+    data = DataFrame({"age": rng.integers(18, 71, ROWS), "amount": rng.random(ROWS)})
+    reduced, reduction = reduce_data(data, "amount by age", 1000)
+
+    assert reduction.method == "uniform_sample"
+    assert len(reduced) == 1000
+
+
+def test_every_series_is_downsampled_with_lttb():
+    x = np.arange(ROWS // 4)
+    data = DataFrame(
+        {
+            "day": np.tile(x, 4),
+            "sales": np.concatenate([np.cos(x / (100 * (i + 1))) for i in range(4)]),
+            "store": np.repeat(["a", "b", "c", "d"], len(x)),
+        }
+    )
+    reduced, reduction = reduce_data(data, "sales per store", 1000)
+
+    assert reduction.method == "lttb"
+    assert reduction.groups == ["store"]
+    assert len(reduced) <= 1000
+    for _, series in reduced.groupby("store"):
+        assert series["day"].is_monotonic_increasing
+        assert series["day"].iloc[[0, -1]].tolist() == [0, len(x) - 1]
+
+
+def test_stratified_sample_keeps_every_group(rng):
+    categories = [f"category {i}" for i in range(40)]
+    data = DataFrame(
+        {
+            "name": [f"customer {i}" for i in range(ROWS)],
+            # the last category is a single row
+            "category": rng.choice(categories[:-1], ROWS - 1).tolist()
+            + [categories[-1]],
+            "amount": rng.random(ROWS),
+        }
+    )
+    reduced, reduction = reduce_data(data, "amount per customer", 1000)
+
+    assert reduction.method == "stratified_sample"
+    assert reduction.groups == ["category"]
+    assert set(reduced["category"]) == set(categories)
+    assert len(reduced) == pytest.approx(1000, abs=40)
+    # proportional to the groups
+    shares = reduced["category"].value_counts(normalize=True)
+    expected = data["category"].value_counts(normalize=True)
+    assert (shares[categories[:-1]] - expected[categories[:-1]]).abs().max() < 0.01
+
+
+def test_duplicated_columns_are_sampled(rng):
+    data = DataFrame([rng.integers(0, 100, ROWS), rng.random(ROWS), rng.random(ROWS)]).T
+    data.columns = ["age", "count", "count"]
+
+    reduced, reduction = reduce_data(data, max_points=1000)
+    assert reduction.method == "uniform_sample"
+    assert len(reduced) == reduction.rows == 1000
+    assert list(reduced.columns) == ["age", "count", "count"]
+
+
+def test_small_results_are_kept():
+    data = DataFrame({"category": ["Clothing", "Footwear"], "count": [3, 4]})
+    reduced, reduction = reduce_data(data, max_points=1000)
+    assert reduced is data
+    assert reduction.method == "none"
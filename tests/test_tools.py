@@ -0,0 +1,38 @@
+from src.tools.tools import execute_sql
+
+
+def test_results_are_fetched_in_batches(database):
+    data = execute_sql("SELECT * FROM purchases", url=database, batch_size=1000)
+    assert len(data) == 3900
+    assert data["customer_id"].tolist() == list(range(1, 3901))
+    assert data.attrs["truncated"] is False
+
+
+def test_results_above_the_row_ceiling_are_truncated(database):
+    data = execute_sql(
+        "SELECT * FROM purchases", url=database, batch_size=1000, max_rows=2500
+    )
+    assert len(data) == 2500
+    assert data["customer_id"].tolist() == list(range(1, 2501))
+    assert data.attrs["truncated"] is True
+
+
+def test_results_above_the_memory_ceiling_are_truncated(database):
+    full = execute_sql("SELECT * FROM purchases", url=database)
+    max_bytes = int(full.memory_usage(index=False, deep=True).sum()) // 3
+    data = execute_sql(
+        "SELECT * FROM purchases", url=database, batch_size=500, max_bytes=max_bytes
+    )
+    assert data.attrs["truncated"] is True
+    assert 0 < len(data) < 3900
+    assert data.memory_usage(index=False, deep=True).sum() <= max_bytes * 1.1
+    assert data["customer_id"].tolist() == list(range(1, len(data) + 1))
+
+
+def test_empty_results_keep_their_columns(database):
+    data = execute_sql(
+        "SELECT customer_id, gender FROM purchases WHERE age < 0", url=database
+    )
+    assert list(data.columns) == ["customer_id", "gender"]
+    assert data.empty
+    assert data.attrs["truncated"] is False
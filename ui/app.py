@@ -1,5 +1,7 @@
 import os
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -19,6 +21,27 @@ TEST_MODE = os.getenv("TEST_MODE", "false").lower() == "true"
 google_api_key = "itworks" if TEST_MODE else os.getenv("GOOGLE_API_KEY")
 
 
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Workers running the workflow, so the script can rerun while a request runs"""
+    return ThreadPoolExecutor(thread_name_prefix="workflow")
+
+
+def wait_for_request() -> dict:
+    """Result of the running request, a click on "Cancel query" reruns the script meanwhile"""
+    future: Future = st.session_state.request
+    status = st.empty()
+    start = time.monotonic()
+    while not future.done():
+        # the rerun of a click interrupts the script on its next element update, the
+        # rerun waits for the same request
+        status.caption(f"Running for {time.monotonic() - start:.0f}s")
+        time.sleep(0.25)
+    status.empty()
+    st.session_state.request = None
+    return future.result()
+
+
 # Set the app title
 st.title("Generate and interpret plots")
 
@@ -28,6 +51,12 @@ with st.sidebar:
         google_api_key = st.text_input("Enter your Google API Key", type="password")
         st.warning("Please enter your Google API key to use the agent.")
 
+# Stops the query of the running request, the workflow runs in a worker thread
+if st.session_state.get("unique_id") and st.sidebar.button("Cancel query"):
+    from src.tools import cancellation_registry
+
+    cancellation_registry.cancel(st.session_state.unique_id)
+
 if st.button("Clear history"):
     st.session_state.messages = st.session_state.messages[:1]
     st.session_state.conversation_id = str(uuid4())
@@ -72,17 +101,26 @@ if prompt:
 # Generate answer if API key is provided
 if google_api_key:
     if prompt:
+        st.session_state.request = get_executor().submit(
+            workflow.invoke,
+            {"user_query": prompt, "unique_id": st.session_state.unique_id},
+            st.session_state.config,
+        )
+    if st.session_state.get("request"):
         with st.spinner("Thinking..."):
-
-            response = workflow.invoke(
-                {"user_query": prompt, "unique_id": st.session_state.unique_id},
-                st.session_state.config,
-            )
+            response = wait_for_request()
         with st.chat_message("assistant"):
-            st.image(
-                response["plot_data"].plot_path,
-                caption=response["plot_data"].plot_caption,
-            )
+            if response["plot_data"].plot_path:
+                from src.tools import artifact_store
+
+                # the bytes the plot summary already read
+                st.image(
+                    artifact_store.read_image(
+                        f"plot_{st.session_state.unique_id}",
+                        response["plot_data"].plot_path,
+                    ),
+                    caption=response["plot_data"].plot_caption,
+                )
             st.markdown(response["plot_summary"])
         st.session_state.messages.append(
             {"role": "assistant", "content": response["plot_summary"]}
@@ -1,6 +1,8 @@
 import logging
 import json
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import os
 
@@ -24,6 +26,28 @@ sys.path.insert(0, str(project_root))
 
 google_api_key = os.environ.get("GOOGLE_API_KEY")
 
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Workers running the workflow, so the script can rerun while a request runs"""
+    return ThreadPoolExecutor(thread_name_prefix="workflow")
+
+
+def wait_for_request() -> dict:
+    """Result of the running request, a click on "Cancel query" reruns the script meanwhile"""
+    future: Future = st.session_state.request
+    status = st.empty()
+    start = time.monotonic()
+    while not future.done():
+        # the rerun of a click interrupts the script on its next element update, the
+        # rerun waits for the same request
+        status.caption(f"Running for {time.monotonic() - start:.0f}s")
+        time.sleep(0.25)
+    status.empty()
+    st.session_state.request = None
+    return future.result()
+
+
 test_mode = os.environ.get("TEST_MODE")
 if test_mode and test_mode.lower() == "true":
     st.write("Running on TEST mode!")
@@ -85,6 +109,12 @@ if (
 # Set the app title
 st.title("Generate and interpret plots")
 
+# Stops the query of the running request, the workflow runs in a worker thread
+if st.session_state.get("conversation_id") and st.sidebar.button("Cancel query"):
+    from src.tools import cancellation_registry
+
+    cancellation_registry.cancel(st.session_state.conversation_id)
+
 # Initialize resources only if API key is provided
 if google_api_key and st.session_state.get("graph") is None:
     with st.spinner("Initializing agent..."):
@@ -118,12 +148,15 @@ if prompt:
 # Generate answer if API key is provided
 if google_api_key and st.session_state.graph is not None:
     if prompt:
+        st.session_state.request = get_executor().submit(
+            st.session_state.graph.invoke,
+            st.session_state.params,
+            st.session_state.config,
+        )
+    if st.session_state.get("request"):
         with st.spinner("Thinking..."):
             try:
-                response = st.session_state.graph.invoke(
-                    st.session_state.params,
-                    st.session_state.config,
-                )
+                response = wait_for_request()
             except BamlClientError as e:
                 logger.error(e, exc_info=True)
                 try:
@@ -157,9 +190,15 @@ if google_api_key and st.session_state.graph is not None:
                 and response.get("plot_summary")
                 and response.get("plot_data")
             ):
+                from src.tools import artifact_store
+
                 with st.chat_message("assistant"):
+                    # the bytes the plot summary already read
                     st.image(
-                        response["plot_data"].plot_path,
+                        artifact_store.read_image(
+                            f"plot_{st.session_state.conversation_id}",
+                            response["plot_data"].plot_path,
+                        ),
                         caption=response["plot_data"].plot_caption,
                     )
                     st.write(response["plot_summary"])
@@ -178,6 +217,19 @@ if google_api_key and st.session_state.graph is not None:
             st.session_state.data_picked = True
         else:
             st.session_state.data_picked = False
+            decision = response.get("query_guard")
+            if decision and decision.action == "reject":
+                error_message = (
+                    f"The generated SQL query was rejected. {decision.reason}"
+                )
+            else:
+                error_message = response.get("error")
+            if error_message:
+                with st.chat_message("assistant"):
+                    st.markdown(error_message)
+                st.session_state.messages.append(
+                    {"role": "assistant", "content": error_message}
+                )
             first_message = st.session_state.messages[0]
             with st.chat_message("assistant"):
                 st.markdown(first_message["content"])